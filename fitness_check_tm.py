@@ -1,18 +1,26 @@
+import os
 import re
 import sys
 import csv
+import argparse
 import time
 import json
 import unicodedata
 from typing import Set, Dict, List
 
+# Gemeinsamer HTTP-Client liegt im scraper/-Verzeichnis
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scraper"))
+
 try:
-    import requests
+    import requests  # wird von http_client verwendet
     from bs4 import BeautifulSoup
-except Exception as e:
+except ImportError:
     print("FEHLER: Bitte installiere die Abhängigkeiten: pip install requests beautifulsoup4")
     sys.exit(2)
 
+# Außerhalb des try-Blocks: Fehler im HTTP-Client (Cache, Fixtures, Rate Limiter) sind keine fehlenden Pakete
+import http_client
+
 
 TRANSFERMARKT_URLS = {
     "1-bundesliga-verletzte": "https://www.transfermarkt.de/bundesliga/verletztespieler/wettbewerb/L1",
@@ -24,11 +32,9 @@ TRANSFERMARKT_URLS = {
 
 def http_get(url: str) -> str:
     headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/124 Safari/537.36",
-        "Accept-Language": "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7",
         "Cache-Control": "no-cache",
     }
-    r = requests.get(url, headers=headers, timeout=20)
+    r = http_client.get(url, headers=headers, timeout=20)
     r.raise_for_status()
     return r.text
 
@@ -120,9 +126,11 @@ def mark_players_in_txt(input_txt: str) -> None:
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python fitness_check_tm.py empfohlene_spieler_pro_team.txt")
-        sys.exit(1)
-    mark_players_in_txt(sys.argv[1])
+    parser = argparse.ArgumentParser(usage="python fitness_check_tm.py [--record DIR | --replay DIR] empfohlene_spieler_pro_team.txt")
+    parser.add_argument("input_txt")
+    http_client.add_fixture_arguments(parser)
+    args = parser.parse_args()
+    http_client.apply_fixture_arguments(args)
+    mark_players_in_txt(args.input_txt)
 
 
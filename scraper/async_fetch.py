@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Asynchrone Fetch-Engine für die Scraper
+Lädt viele Seiten gleichzeitig (asyncio + aiohttp), begrenzt aber die Anzahl
+gleichzeitiger Requests pro Host (Höflichkeitslimit)
+"""
+
+import asyncio
+import os
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+import http_client
+from rate_limiter import RATE_LIMITER
+
+# aiohttp ist optional - ohne aiohttp laufen die Requests über die gemeinsame
+# requests-Session in Worker-Threads (gleiche Nebenläufigkeit, gleiche Limits)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Maximale gleichzeitige Requests pro Host (per Umgebungsvariable einstellbar)
+DEFAULT_HOST_CONCURRENCY = int(os.environ.get('SCRAPER_HOST_CONCURRENCY', '4'))
+
+class AsyncFetcher:
+    """Asynchroner HTTP-Client mit Semaphore pro Host
+
+    Verwendung:
+        async with AsyncFetcher(host_concurrency=4) as fetcher:
+            response = await fetcher.get(url)
+    """
+
+    def __init__(self, host_concurrency: int = DEFAULT_HOST_CONCURRENCY):
+        self.host_concurrency = max(1, host_concurrency)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._session = None
+
+    async def __aenter__(self) -> 'AsyncFetcher':
+        if aiohttp is not None:
+            connect_timeout, read_timeout = http_client.DEFAULT_TIMEOUT
+            self._session = aiohttp.ClientSession(
+                headers=http_client.DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(connect=connect_timeout, sock_read=read_timeout),
+                connector=aiohttp.TCPConnector(limit=http_client.POOL_MAXSIZE, limit_per_host=self.host_concurrency),
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _semaphore_for(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.host_concurrency)
+        return self._semaphores[host]
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """GET-Request; gibt ein requests.Response-Objekt zurück (wie http_client.get)"""
+        async with self._semaphore_for(url):
+            fixtures = http_client.FIXTURES
+            if self._session is None or (fixtures is not None and fixtures.mode == 'replay'):
+                # http_client.get nutzt bereits den gemeinsamen Rate Limiter (und spielt Fixtures ab)
+                return await asyncio.to_thread(http_client.get, url, headers)
+            use_cache, cached, headers = http_client._prepare_request('GET', url, headers)
+            if cached is not None:
+                return http_client._record_fixture('GET', url, cached)
+            
+            result = None
+            for attempt in range(http_client.MAX_THROTTLE_RETRIES + 1):
+                acquired = await RATE_LIMITER.acquire_async(url, http_client.throttle_max_wait(attempt))
+                if not http_client._admit_attempt(url, acquired, result):
+                    break
+                try:
+                    async with self._session.get(url, headers=headers) as response:
+                        body = await response.read()
+                        result = http_client.build_response(
+                            str(response.url), response.status, dict(response.headers), body, response.charset
+                        )
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    RATE_LIMITER.on_error(url)
+                    raise
+                if http_client._attempt_done(url, result, attempt, http_client.MAX_THROTTLE_RETRIES):
+                    break
+            
+            return http_client._finish_request('GET', url, result, use_cache)
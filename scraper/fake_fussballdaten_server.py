@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Lokaler Ersatz-Server für fussballdaten.de (Last- und Durchsatztests)
+Liefert synthetische Seiten im Format, das die Scraper erwarten:
+- Spieltags-Übersichten: /{liga}/{saison}/{spieltag}/ (parse_league_matches, parse_england_matches,
+  has_future_matches, extract_games_with_dates)
+- Internationale Phasen: /{liga}/{saison}/league-stage/{spieltag}/ und /{liga}/{saison}/{phase}/
+  (parse_international_matches)
+- DFB-Pokal-Runden: /dfb-pokal/{saison}/{runde}/
+- Aufstellungsseiten: .../{heim}-{gast}/ (extract_team_html, analyze_start11)
+
+Latenz, Fehlerquote (503 mit Retry-After) und 404-Quote sind einstellbar,
+ETag/If-None-Match wird unterstützt (304). /__stats__ liefert Request-Zähler als JSON.
+
+Verwendung:
+    python fake_fussballdaten_server.py --port 8000 --latency 0.2 --error-rate 0.05
+    FUSSBALLDATEN_BASE_URL=http://127.0.0.1:8000 python scrape_lineups.py
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+# Team-Slugs pro Liga (ohne Bindestrich, damit "heim-gast" eindeutig bleibt)
+LEAGUE_TEAMS: Dict[str, List[str]] = {
+    'bundesliga': ['bayern', 'dortmund', 'leverkusen', 'leipzig', 'stuttgart', 'frankfurt', 'freiburg', 'wolfsburg', 'gladbach',
+                   'bremen', 'hoffenheim', 'augsburg', 'mainz', 'union', 'heidenheim', 'stpauli', 'koeln', 'hamburg'],
+    '2liga': [f'zweite{i:02d}' for i in range(1, 19)],
+    'england': [f'england{i:02d}' for i in range(1, 21)],
+    'spanien': [f'spanien{i:02d}' for i in range(1, 21)],
+    'italien': [f'italien{i:02d}' for i in range(1, 21)],
+    'frankreich': [f'frankreich{i:02d}' for i in range(1, 19)],
+}
+INTERNATIONAL_LEAGUES = ('championsleague', 'europaleague', 'conferenceleague')
+INTERNATIONAL_TEAMS = {league: [f'{league[:4]}{i:02d}' for i in range(1, 37)] for league in INTERNATIONAL_LEAGUES}
+INTERNATIONAL_MATCHDAYS = 8
+KNOCKOUT_PHASES = ['play-offs', 'achtelfinale', 'viertelfinale', 'halbfinale', 'finale']
+DFB_ROUNDS = ['1-runde', '2-runde', 'achtelfinale', 'viertelfinale', 'halbfinale', 'finale']
+DFB_TEAMS = [f'pokal{i:02d}' for i in range(1, 65)]
+
+# Anstoßzeiten eines Spieltags (Tag relativ zum Samstag, Uhrzeit)
+KICKOFF_SLOTS = [(-1, 20, 30), (0, 15, 30), (0, 15, 30), (0, 15, 30), (0, 15, 30), (0, 15, 30), (0, 18, 30), (1, 15, 30), (1, 17, 30), (1, 19, 30)]
+MATCH_DURATION = timedelta(hours=2)
+WEEKDAYS = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag', 'Samstag', 'Sonntag']
+# Seiten unter 1000 Zeichen werten die Scraper als leer
+PAGE_PADDING = '<!-- ' + 'fussballdaten ' * 80 + '-->'
+
+def round_robin(teams: List[str]) -> List[List[Tuple[str, str]]]:
+    """Spielplan nach dem Kreis-Verfahren (Hin- und Rückrunde)"""
+    teams = list(teams)
+    n = len(teams)
+    first_half = []
+    for rnd in range(n - 1):
+        pairs = []
+        for i in range(n // 2):
+            home, away = teams[i], teams[n - 1 - i]
+            pairs.append((home, away) if rnd % 2 == 0 else (away, home))
+        first_half.append(pairs)
+        teams = [teams[0]] + [teams[-1]] + teams[1:-1]
+    return first_half + [[(away, home) for home, away in pairs] for pairs in first_half]
+
+def stable_int(*parts) -> int:
+    """Deterministische Zahl aus beliebigen Werten (für Ergebnisse, Spielernamen usw.)"""
+    return int(hashlib.sha1('|'.join(map(str, parts)).encode('utf-8')).hexdigest()[:8], 16)
+
+class FakeSeason:
+    """Synthetischer Spielplan relativ zu "jetzt" (current_matchday liegt im nächsten Wochenende)"""
+
+    def __init__(self, current_matchday: int, now: Optional[datetime] = None):
+        self.current_matchday = current_matchday
+        self._fixed_now = now
+        now = self.now
+        # Samstag des aktuellen Spieltags
+        self.anchor = (now + timedelta(days=(5 - now.weekday()) % 7)).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.schedules = {league: round_robin(teams) for league, teams in LEAGUE_TEAMS.items()}
+
+    @property
+    def now(self) -> datetime:
+        """Aktuelle Zeit (Spiele werden während des Laufs live/beendet), fest wenn now übergeben wurde"""
+        return self._fixed_now or datetime.now()
+
+    def kickoff(self, matchday: int, slot: int) -> datetime:
+        day, hour, minute = KICKOFF_SLOTS[slot % len(KICKOFF_SLOTS)]
+        return self.anchor + timedelta(weeks=matchday - self.current_matchday, days=day, hours=hour, minutes=minute)
+
+    def domestic_games(self, league: str, matchday: int) -> List[Tuple[str, str, datetime]]:
+        schedule = self.schedules.get(league, [])
+        if not 1 <= matchday <= len(schedule):
+            return []
+        return [(home, away, self.kickoff(matchday, slot)) for slot, (home, away) in enumerate(schedule[matchday - 1])]
+
+    def international_games(self, league: str, phase: str, matchday: Optional[int]) -> List[Tuple[str, str, datetime]]:
+        teams = INTERNATIONAL_TEAMS[league]
+        if phase in ('league-stage', 'gruppenphase'):
+            if not matchday or not 1 <= matchday <= INTERNATIONAL_MATCHDAYS:
+                return []
+            rotated = teams[matchday:] + teams[:matchday]
+            pairs = [(rotated[i], rotated[-1 - i]) for i in range(len(teams) // 2)]
+            week_offset = (matchday - 1) * 2 - (self.current_matchday % INTERNATIONAL_MATCHDAYS)
+            base = self.anchor + timedelta(weeks=week_offset, days=-4)
+        elif phase in KNOCKOUT_PHASES:
+            size = {'play-offs': 16, 'achtelfinale': 16, 'viertelfinale': 8, 'halbfinale': 4, 'finale': 2}[phase]
+            pairs = [(teams[i], teams[size - 1 - i]) for i in range(size // 2)]
+            base = self.anchor + timedelta(weeks=8 + KNOCKOUT_PHASES.index(phase) * 3, days=-4)
+        else:
+            return []
+        # Dienstag/Mittwoch 18:45 und 21:00
+        return [(home, away, base + timedelta(days=i % 2, hours=18 if i % 4 < 2 else 21, minutes=45 if i % 4 < 2 else 0))
+                for i, (home, away) in enumerate(pairs)]
+
+    def dfb_games(self, round_name: str) -> List[Tuple[str, str, datetime]]:
+        if round_name not in DFB_ROUNDS:
+            return []
+        index = DFB_ROUNDS.index(round_name)
+        size = 64 >> index
+        teams = DFB_TEAMS[:size]
+        base = self.anchor + timedelta(weeks=(index - 1) * 6, days=-4)
+        return [(teams[i], teams[size - 1 - i], base + timedelta(days=i % 2, hours=18 if i % 2 else 20, minutes=30 if i % 2 else 45))
+                for i in range(size // 2)]
+
+    def state(self, kickoff: datetime) -> str:
+        if self.now < kickoff:
+            return 'future'
+        if self.now < kickoff + MATCH_DURATION:
+            return 'live'
+        return 'finished'
+
+def score_for(home: str, away: str, kickoff: datetime) -> str:
+    value = stable_int(home, away, kickoff.date())
+    return f"{value % 4}:{(value // 4) % 3}"
+
+def title_for(home: str, away: str, kickoff: datetime) -> str:
+    return f"{home.title()} - {away.title()} ({kickoff.strftime('%d.%m.%Y')})"
+
+def render_domestic_game(path: str, home: str, away: str, kickoff: datetime, state: str, index: int) -> str:
+    """Ein Spiel im Format der Spieltags-Übersicht (nationale Ligen/DFB-Pokal)"""
+    href = f"{path}{home}-{away}/"
+    title = title_for(home, away, kickoff)
+    if state == 'future':
+        return f'<a href="{href}" title="{title}"><span>{kickoff.strftime("%H:%M")}</span></a>'
+    score = score_for(home, away, kickoff)
+    if state == 'live':
+        return f'<a class="ergebnis live" href="{href}" title="{title}"><span id="erg{index}">{score}</span></a>'
+    return (f'<a class="ergebnis" href="{href}" title="{title}"><div class="ergebnis">{score}</div>'
+            f'<span id="erg{index}">{score}</span></a>')
+
+def render_international_game(league: str, season: str, phase: str, matchday: Optional[int], home: str, away: str, kickoff: datetime, state: str) -> str:
+    """Ein Spiel im Format der internationalen Übersichten (Phasen mit Spieltag oder /vereine/-Links)"""
+    if matchday:
+        href = f"/{league}/{season}/{phase}/{matchday}/{home}-{away}/"
+    else:
+        href = f"/vereine/{home}/{away}/"
+    title = title_for(home, away, kickoff)
+    if state == 'future':
+        return f'<a href="{href}" title="{title}"><span>{kickoff.strftime("%H:%M")}</span></a>'
+    score = score_for(home, away, kickoff)
+    css_class = 'ergebnis live' if state == 'live' else 'ergebnis'
+    return f'<a class="{css_class}" href="{href}" title="{title}"><span>{score}</span></a>'
+
+def render_overview(games: List[str], heading: str) -> str:
+    return f'<html><head><title>{heading}</title></head><body>{PAGE_PADDING}<h1>{heading}</h1>\n' + '\n'.join(games) + '\n</body></html>'
+
+def render_grouped_by_date(games: List[Tuple[datetime, str]], heading: str) -> str:
+    """Übersicht mit Datums-Überschriften ("Dienstag, 16.09.2025"), wie bei internationalen Phasen"""
+    parts = []
+    current_date = None
+    for kickoff, html in sorted(games, key=lambda g: g[0]):
+        if kickoff.date() != current_date:
+            current_date = kickoff.date()
+            parts.append(f'<div class="datum">{WEEKDAYS[kickoff.weekday()]}, {kickoff.strftime("%d.%m.%Y")}</div>')
+        parts.append(html)
+    return render_overview(parts, heading)
+
+def render_lineup(home: str, away: str, seed: str) -> str:
+    """Aufstellungsseite mit heim-content/gast-content, 11 Startspielern und Reservebank"""
+    def team_block(css_class: str, team: str) -> str:
+        players = []
+        for i in range(18):
+            slug = f"{team}-spieler-{stable_int(seed, team, i) % 1000:03d}"
+            name = f"Spieler {team.title()} {i + 1}"
+            players.append(f'<a class="name" href="/person/{slug}/" title="{name}"><span>{name}</span></a>')
+            if i == 10:
+                players.append('<h3>Reservebank</h3>')
+        return f'<div class="{css_class}">' + ''.join(players) + '<div class="trainer">Trainer</div></div>'
+    return render_overview([team_block('heim-content', home), team_block('gast-content', away)], f"{home} - {away}")
+
+class FakeSite:
+    """Routing der Pfade auf synthetische Seiten"""
+
+    def __init__(self, season: FakeSeason):
+        self.season = season
+
+    def page(self, path: str) -> Optional[str]:
+        parts = [p for p in path.split('/') if p]
+        if len(parts) < 3:
+            return None
+        league, season = parts[0], parts[1]
+        rest = parts[2:]
+        if league in LEAGUE_TEAMS:
+            return self._domestic(league, season, rest)
+        if league in INTERNATIONAL_LEAGUES:
+            return self._international(league, season, rest)
+        if league == 'dfb-pokal':
+            return self._dfb(season, rest)
+        return None
+
+    def _domestic(self, league: str, season: str, rest: List[str]) -> Optional[str]:
+        if not rest[0].isdigit():
+            return None
+        matchday = int(rest[0])
+        games = self.season.domestic_games(league, matchday)
+        if not games:
+            return None
+        if len(rest) == 1:
+            path = f"/{league}/{season}/{matchday}/"
+            return render_overview([render_domestic_game(path, h, a, k, self.season.state(k), i) for i, (h, a, k) in enumerate(games)],
+                                   f"{league} {matchday}. Spieltag")
+        return self._lineup(games, rest[1], f"{league}/{matchday}")
+
+    def _international(self, league: str, season: str, rest: List[str]) -> Optional[str]:
+        phase = rest[0]
+        matchday = int(rest[1]) if len(rest) > 1 and rest[1].isdigit() else None
+        games = self.season.international_games(league, phase, matchday)
+        if not games:
+            return None
+        slug_index = 2 if matchday else 1
+        if len(rest) == slug_index:
+            rendered = [(k, render_international_game(league, season, phase, matchday, h, a, k, self.season.state(k))) for h, a, k in games]
+            return render_grouped_by_date(rendered, f"{league} {phase} {matchday or ''}")
+        return self._lineup(games, rest[slug_index], f"{league}/{phase}/{matchday}")
+
+    def _dfb(self, season: str, rest: List[str]) -> Optional[str]:
+        round_name = rest[0]
+        games = self.season.dfb_games(round_name)
+        if not games:
+            return None
+        if len(rest) == 1:
+            path = f"/dfb-pokal/{season}/{round_name}/"
+            return render_overview([render_domestic_game(path, h, a, k, self.season.state(k), i) for i, (h, a, k) in enumerate(games)],
+                                   f"DFB-Pokal {round_name}")
+        return self._lineup(games, rest[1], f"dfb/{round_name}")
+
+    def _lineup(self, games: List[Tuple[str, str, datetime]], slug: str, seed: str) -> Optional[str]:
+        for home, away, kickoff in games:
+            if slug == f"{home}-{away}":
+                # Aufstellungen erscheinen 60 Minuten vor Anpfiff
+                if self.season.now >= kickoff - timedelta(minutes=60):
+                    return render_lineup(home, away, seed)
+                return render_overview(['<div class="vorbericht">Noch keine Aufstellung</div>'], f"{home} - {away}")
+        return None
+
+class FakeServer(ThreadingHTTPServer):
+    """HTTP-Server mit Latenz, Fehler- und 404-Quote"""
+    daemon_threads = True
+
+    def __init__(self, address, site: FakeSite, latency: float, jitter: float, error_rate: float, not_found_rate: float, seed: int):
+        super().__init__(address, FakeRequestHandler)
+        self.site = site
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.not_found_rate = not_found_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counters = {'requests': 0, '200': 0, '304': 0, '404': 0, '503': 0}
+
+    def count(self, key: str):
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + 1
+
+    def roll(self) -> Tuple[float, float]:
+        with self.lock:
+            return self.random.random(), self.random.random()
+
+class FakeRequestHandler(BaseHTTPRequestHandler):
+    server: FakeServer
+
+    def do_GET(self):
+        server = self.server
+        if self.path == '/__stats__':
+            self._send(200, json.dumps(server.counters).encode('utf-8'), 'application/json')
+            return
+        server.count('requests')
+        error_roll, not_found_roll = server.roll()
+        delay = server.latency + server.jitter * error_roll
+        if delay > 0:
+            time.sleep(delay)
+        if error_roll < server.error_rate:
+            server.count('503')
+            self._send(503, b'Service Unavailable', 'text/plain', {'Retry-After': '1'})
+            return
+        html = server.site.page(self.path.split('?', 1)[0])
+        if html is None or not_found_roll < server.not_found_rate:
+            server.count('404')
+            self._send(404, render_overview(['<h2>Seite nicht gefunden (404)</h2>'], '404').encode('utf-8'), 'text/html; charset=utf-8')
+            return
+        body = html.encode('utf-8')
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            server.count('304')
+            self._send(304, b'', None, {'ETag': etag})
+            return
+        server.count('200')
+        self._send(200, body, 'text/html; charset=utf-8', {'ETag': etag})
+
+    def _send(self, status: int, body: bytes, content_type: Optional[str], headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Kein Log pro Request (würde bei Lasttests die Ausgabe fluten)
+        pass
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Lokaler Ersatz-Server für fussballdaten.de")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--current-matchday', type=int, default=10, help="Spieltag, der am nächsten Wochenende stattfindet")
+    parser.add_argument('--latency', type=float, default=0.0, help="Grund-Latenz pro Request in Sekunden")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Zusätzliche zufällige Latenz (0..jitter Sekunden)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Anteil der Requests mit 503 + Retry-After (0..1)")
+    parser.add_argument('--not-found-rate', type=float, default=0.0, help="Anteil zusätzlicher zufälliger 404-Antworten (0..1)")
+    parser.add_argument('--seed', type=int, default=1, help="Seed für Latenz/Fehler (reproduzierbare Läufe)")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    site = FakeSite(FakeSeason(args.current_matchday))
+    server = FakeServer((args.host, args.port), site, args.latency, args.jitter, args.error_rate, args.not_found_rate, args.seed)
+    print(f"🧪 Fake-fussballdaten.de läuft auf http://{args.host}:{args.port} (aktueller Spieltag {args.current_matchday}, jede Saison im Pfad)")
+    print(f"   Latenz {args.latency}s (+{args.jitter}s), Fehlerquote {args.error_rate:.0%}, 404-Quote {args.not_found_rate:.0%}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"📊 {json.dumps(server.counters)}")
+
+if __name__ == '__main__':
+    main()
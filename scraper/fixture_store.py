@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Aufzeichnen/Abspielen von HTTP-Antworten (Fixture-Store)
+- Record: Jede Antwort des Fetch-Layers (URL, Status, Header, Body) wird gespeichert
+- Replay: Antworten kommen aus dem Store, es wird kein Netzwerk benutzt
+Damit lässt sich die komplette Pipeline offline und reproduzierbar messen
+(Parser/Orchestrierung getrennt von der Netzwerkzeit).
+
+Aufbau eines Store-Verzeichnisses:
+- index.json: "METHODE URL" → Liste von Antworten (Status, Header, Encoding, Body-Hash)
+- bodies/<sha1>.gz: Bodies gzip-komprimiert, gleiche Bodies werden nur einmal gespeichert
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+import requests
+
+# Index wird nach so vielen Aufnahmen (und beim Beenden) geschrieben
+FLUSH_EVERY = 20
+
+class FixtureStore:
+    """Thread-sicherer Store für aufgezeichnete Antworten
+
+    mode: 'record' (Antworten speichern) oder 'replay' (Antworten ausliefern)
+    """
+
+    def __init__(self, directory: str, mode: str):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Unbekannter Fixture-Modus: {mode}")
+        self.directory = directory
+        self.mode = mode
+        self.body_dir = os.path.join(directory, 'bodies')
+        self.index_file = os.path.join(directory, 'index.json')
+        self._lock = threading.Lock()
+        self._index: Dict[str, List[Dict]] = self._load_index()
+        # Record: Schlüssel, die in diesem Prozess schon neu aufgenommen wurden
+        self._recorded_keys = set()
+        # Replay: Wie oft ein Schlüssel bereits ausgeliefert wurde
+        self._replay_counts: Dict[str, int] = {}
+        self._pending_changes = 0
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+        if mode == 'replay' and not self._index:
+            print(f"⚠️ Fixture-Store {directory} ist leer oder existiert nicht")
+
+    def _load_index(self) -> Dict[str, List[Dict]]:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _key(method: str, url: str) -> str:
+        return f"{method.upper()} {url}"
+
+    def record(self, method: str, url: str, response: requests.Response):
+        """Speichert eine Antwort. Mehrere Antworten auf dieselbe URL werden als Folge gespeichert."""
+        body = response.content or b''
+        body_hash = hashlib.sha1(body).hexdigest()
+        entry = {
+            'status': response.status_code,
+            'headers': dict(response.headers),
+            'encoding': response.encoding,
+            'body': body_hash,
+        }
+        key = self._key(method, url)
+        with self._lock:
+            body_path = os.path.join(self.body_dir, body_hash + '.gz')
+            if not os.path.exists(body_path):
+                os.makedirs(self.body_dir, exist_ok=True)
+                tmp_path = body_path + '.tmp'
+                with gzip.open(tmp_path, 'wb') as f:
+                    f.write(body)
+                os.replace(tmp_path, body_path)
+            # Erste Aufnahme in diesem Prozess ersetzt alte Aufnahmen derselben URL
+            if key not in self._recorded_keys:
+                self._recorded_keys.add(key)
+                self._index[key] = []
+            self._index[key].append(entry)
+            self.recorded += 1
+            self._pending_changes += 1
+            if self._pending_changes >= FLUSH_EVERY:
+                self._write_index()
+
+    def replay(self, method: str, url: str) -> requests.Response:
+        """Liefert die aufgezeichnete Antwort (bei mehreren in Aufnahme-Reihenfolge, danach die letzte)
+
+        Fehlt die URL im Store, wird requests.exceptions.ConnectionError geworfen
+        (wie bei einem Netzwerkfehler - die Scraper behandeln das bereits).
+        """
+        key = self._key(method, url)
+        with self._lock:
+            entries = self._index.get(key)
+            if not entries:
+                self.missing += 1
+                raise requests.exceptions.ConnectionError(f"Replay: Keine Aufnahme für {key}")
+            position = self._replay_counts.get(key, 0)
+            self._replay_counts[key] = position + 1
+            entry = entries[min(position, len(entries) - 1)]
+            self.replayed += 1
+        with gzip.open(os.path.join(self.body_dir, entry['body'] + '.gz'), 'rb') as f:
+            body = f.read()
+        from http_client import build_response
+        return build_response(url, entry['status'], entry.get('headers'), body, entry.get('encoding'))
+
+    def _write_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_file = self.index_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_file, self.index_file)
+        self._pending_changes = 0
+
+    def flush(self):
+        """Schreibt den Index auf die Festplatte (nur im Record-Modus)"""
+        with self._lock:
+            if self.mode == 'record' and self._pending_changes:
+                self._write_index()
+
+    def stats(self) -> str:
+        if self.mode == 'record':
+            return f"Fixtures: {self.recorded} Antworten aufgezeichnet in {self.directory}"
+        return f"Fixtures: {self.replayed} Antworten abgespielt, {self.missing} fehlend ({self.directory})"
+
+def open_fixture_store(record_dir: Optional[str] = None, replay_dir: Optional[str] = None) -> Optional[FixtureStore]:
+    """Erstellt den Store für --record/--replay (beides gleichzeitig ist nicht erlaubt)"""
+    if record_dir and replay_dir:
+        raise ValueError("--record und --replay können nicht gleichzeitig verwendet werden")
+    if not record_dir and not replay_dir:
+        return None
+    store = FixtureStore(record_dir or replay_dir, 'record' if record_dir else 'replay')
+    atexit.register(store.flush)
+    return store
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Persistenter HTTP-Cache auf der Festplatte (unter dem Fetch-Layer)
+- Schlüssel: URL; gespeichert werden Body, ETag/Last-Modified und Abrufzeit
+- Abgelaufene Einträge werden per If-None-Match/If-Modified-Since revalidiert (304 = Body aus Cache)
+- TTL pro URL-Klasse (beendeter Spieltag, aktueller Spieltag, Aufstellungsseite)
+- Größenbegrenzung mit LRU-Verdrängung
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from overview_anchors import all_matches_finished
+
+# Cache-Verzeichnis (Repository-Root/.cache, per Umgebungsvariable überschreibbar)
+CACHE_DIR = os.environ.get(
+    'SCRAPER_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache')
+)
+
+# Nur Seiten dieser Hosts werden gecacht (GitHub-API usw. nicht)
+CACHEABLE_HOSTS = ('www.fussballdaten.de',)
+
+# TTL in Sekunden pro URL-Klasse - innerhalb der TTL wird gar nicht angefragt,
+# danach wird revalidiert (304 kostet kaum Bytes)
+TTL_BY_CLASS = {
+    'matchday_finished': 7 * 24 * 3600,  # Alle Spiele beendet - ändert sich praktisch nie
+    'matchday_current': 0,                # Aktueller Spieltag - immer revalidieren (Live-Ergebnisse)
+    'lineup': 10 * 60,                    # Aufstellungsseite - ändert sich kurz vor Anpfiff
+    'other': 0,
+}
+
+# Maximale Cache-Größe (Bodies) in MB
+MAX_CACHE_BYTES = int(float(os.environ.get('SCRAPER_HTTP_CACHE_MB', '50')) * 1024 * 1024)
+
+# Index wird nach so vielen Änderungen (und beim Beenden) geschrieben
+FLUSH_EVERY = 20
+
+# Phasen-/Runden-Namen mit Bindestrich (sind keine Team-Paare "heim-gast")
+PHASE_SLUGS = {'league-stage', 'play-offs', '1-runde', '2-runde'}
+
+TITLE_DATE_PATTERN = re.compile(r'title="[^"]*\((\d{2})\.(\d{2})\.(\d{4})')
+HEADER_DATE_PATTERN = re.compile(r'(?:Montag|Dienstag|Mittwoch|Donnerstag|Freitag|Samstag|Sonntag),?\s*(\d{2})\.(\d{2})\.(\d{4})')
+LIVE_PATTERN = re.compile(r'class="[^"]*ergebnis\s+live', re.IGNORECASE)
+
+def classify_url(url: str, body: Optional[str] = None) -> str:
+    """Ordnet eine URL einer Cache-Klasse zu (Body wird für Spieltagsseiten ausgewertet)"""
+    segments = [s for s in urlsplit(url).path.split('/') if s]
+    if len(segments) >= 3:
+        last = segments[-1]
+        if '-' in last and last not in PHASE_SLUGS:
+            return 'lineup'
+        if body is not None:
+            return 'matchday_finished' if is_finished_overview(body) else 'matchday_current'
+        return 'matchday_current'
+    return 'other'
+
+def is_finished_overview(html: str) -> bool:
+    """
+    Prüft ob eine Spieltags-/Phasenseite nur noch beendete Spiele enthält: jedes Spiel hat ein
+    Ergebnis (kein verlegtes Spiel mit Uhrzeit) und das letzte liegt mindestens zwei Tage zurück
+    """
+    if LIVE_PATTERN.search(html) or not all_matches_finished(html):
+        return False
+    latest = None
+    for pattern in (TITLE_DATE_PATTERN, HEADER_DATE_PATTERN):
+        for match in pattern.finditer(html):
+            try:
+                date = datetime(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+            except ValueError:
+                continue
+            if latest is None or date > latest:
+                latest = date
+    if latest is None:
+        return False
+    # Letztes Spiel liegt mindestens zwei Tage zurück (Nachträge/Korrekturen abgewartet)
+    return latest < datetime.now() - timedelta(days=2)
+
+class HttpCache:
+    """Thread-sicherer HTTP-Cache mit Index (JSON) und Bodies als Dateien"""
+
+    def __init__(self, cache_dir: str = os.path.join(CACHE_DIR, 'http'), max_bytes: int = MAX_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.body_dir = os.path.join(cache_dir, 'bodies')
+        self.index_file = os.path.join(cache_dir, 'index.json')
+        self.max_bytes = max_bytes
+        self.hosts = set(CACHEABLE_HOSTS)
+        self._lock = threading.Lock()
+        self._pending_changes = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._index: Dict[str, Dict] = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _body_path(self, url: str) -> str:
+        return os.path.join(self.body_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def _read_body(self, url: str) -> Optional[bytes]:
+        try:
+            with open(self._body_path(url), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def is_cacheable(self, url: str, headers: Optional[Dict[str, str]] = None) -> bool:
+        """Nur GET-Seiten der CACHEABLE_HOSTS ohne Authorization-Header"""
+        if headers and any(k.lower() == 'authorization' for k in headers):
+            return False
+        return urlsplit(url).netloc.lower() in self.hosts
+
+    def add_host(self, host: str):
+        """Cacht zusätzlich Seiten dieses Hosts (z.B. lokaler Test-Server)"""
+        self.hosts.add(host.lower())
+
+    def get_fresh(self, url: str) -> Optional[requests.Response]:
+        """Gibt die gecachte Antwort zurück, wenn sie innerhalb der TTL liegt"""
+        with self._lock:
+            entry = self._index.get(url)
+            if not entry:
+                return None
+            ttl = TTL_BY_CLASS.get(entry.get('urlClass', 'other'), 0)
+            if time.time() - entry.get('fetchedAt', 0) > ttl:
+                return None
+            body = self._read_body(url)
+            if body is None:
+                self._index.pop(url, None)
+                return None
+            entry['lastAccess'] = time.time()
+            self.hits += 1
+            self._mark_changed()
+            return self._build_response(url, entry, body)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match/If-Modified-Since für einen abgelaufenen Eintrag"""
+        with self._lock:
+            entry = self._index.get(url)
+            if not entry:
+                return {}
+            headers = {}
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('lastModified'):
+                headers['If-Modified-Since'] = entry['lastModified']
+            return headers
+
+    def process_response(self, url: str, response: requests.Response) -> requests.Response:
+        """Verarbeitet die Antwort des Servers: 304 → Body aus Cache, 200 → speichern"""
+        if response.status_code == 304:
+            with self._lock:
+                entry = self._index.get(url)
+                body = self._read_body(url) if entry else None
+                if entry and body is not None:
+                    entry['fetchedAt'] = entry['lastAccess'] = time.time()
+                    # Neue Validatoren übernehmen, falls der Server welche mitschickt
+                    if response.headers.get('ETag'):
+                        entry['etag'] = response.headers['ETag']
+                    if response.headers.get('Last-Modified'):
+                        entry['lastModified'] = response.headers['Last-Modified']
+                    self.revalidated += 1
+                    self._mark_changed()
+                    return self._build_response(url, entry, body)
+            return response
+        if response.status_code == 200:
+            self.misses += 1
+            self.store(url, response)
+        return response
+
+    def store(self, url: str, response: requests.Response):
+        """Speichert eine 200-Antwort im Cache"""
+        body = response.content
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'lastModified': response.headers.get('Last-Modified'),
+            'contentType': response.headers.get('Content-Type'),
+            'encoding': response.encoding,
+            'fetchedAt': time.time(),
+            'lastAccess': time.time(),
+            'size': len(body),
+            'urlClass': classify_url(url, response.text),
+        }
+        with self._lock:
+            os.makedirs(self.body_dir, exist_ok=True)
+            tmp_path = self._body_path(url) + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, self._body_path(url))
+            self._index[url] = entry
+            self._evict()
+            self._mark_changed()
+
+    def _build_response(self, url: str, entry: Dict, body: bytes) -> requests.Response:
+        from http_client import build_response
+        headers = {'Content-Type': entry['contentType']} if entry.get('contentType') else {}
+        return build_response(url, 200, headers, body, entry.get('encoding'))
+
+    def _evict(self):
+        """LRU: Älteste Einträge entfernen, bis die Gesamtgröße unter max_bytes liegt"""
+        total = sum(e.get('size', 0) for e in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for url, entry in sorted(self._index.items(), key=lambda item: item[1].get('lastAccess', 0)):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._body_path(url))
+            except OSError:
+                pass
+            total -= entry.get('size', 0)
+            del self._index[url]
+
+    def _mark_changed(self):
+        self._pending_changes += 1
+        if self._pending_changes >= FLUSH_EVERY:
+            self._write_index()
+
+    def _write_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_file = self.index_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_file, self.index_file)
+        self._pending_changes = 0
+
+    def flush(self):
+        """Schreibt den Index auf die Festplatte"""
+        with self._lock:
+            if self._pending_changes:
+                self._write_index()
+
+    def stats(self) -> str:
+        return f"HTTP-Cache: {self.hits} Treffer, {self.revalidated} revalidiert (304), {self.misses} neu geladen"
+
+# Gemeinsamer Cache (SCRAPER_HTTP_CACHE=0 deaktiviert ihn)
+HTTP_CACHE: Optional[HttpCache] = None
+if os.environ.get('SCRAPER_HTTP_CACHE', '1') != '0':
+    HTTP_CACHE = HttpCache()
+    atexit.register(HTTP_CACHE.flush)
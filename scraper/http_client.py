@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Gemeinsamer HTTP-Client für alle Scraper
+Eine gepoolte Keep-Alive-Session mit einheitlichen Headern und Timeouts,
+damit nicht jeder Request eine neue TCP+TLS-Verbindung aufbaut
+"""
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import RATE_LIMITER, THROTTLE_STATUS_CODES
+from http_cache import HTTP_CACHE
+from fixture_store import FixtureStore, open_fixture_store
+from run_budget import RUN_BUDGET
+
+# Einheitlicher User-Agent für alle Requests (vorher in jedem Scraper unterschiedlich)
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+# Basis-URL von fussballdaten.de - per FUSSBALLDATEN_BASE_URL oder --base-url überschreibbar
+# (z.B. http://127.0.0.1:8000 für fake_fussballdaten_server.py)
+DEFAULT_FUSSBALLDATEN_BASE_URL = 'https://www.fussballdaten.de'
+
+# Timeout in Sekunden: (Verbindungsaufbau, Lesen)
+DEFAULT_TIMEOUT = (10, 30)
+
+# Verbindungs-Pool: Anzahl Hosts im Pool und offene Verbindungen pro Host
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Wiederholungen bei 429/503 (die Wartezeit bestimmt der Rate Limiter, inkl. Retry-After).
+# Nur GET wird automatisch wiederholt: PUT/POST (z.B. GitHub-Uploads) haben eigene Retry-Schleifen,
+# und ein wiederholter PUT nach einem 503, der doch angekommen ist, endet im sha-Konflikt
+MAX_THROTTLE_RETRIES = 2
+# Längste Wartezeit vor einer Wiederholung (Sekunden); länger pausierte Hosts werden nicht wiederholt
+MAX_THROTTLE_RETRY_WAIT = 30.0
+
+class ThrottleWaitExceeded(requests.exceptions.RequestException):
+    """Der Host pausiert (429/503, Retry-After) länger, als das Run-Budget noch erlaubt"""
+
+def throttle_max_wait(attempt: int) -> Optional[float]:
+    """Höchste Wartezeit im Rate Limiter vor einem Versuch: Wiederholungen höchstens
+    MAX_THROTTLE_RETRY_WAIT, alle Versuche höchstens bis zum Ende des Run-Budgets"""
+    limits = [limit for limit in (
+        MAX_THROTTLE_RETRY_WAIT if attempt > 0 else None,
+        RUN_BUDGET.remaining_seconds(),
+    ) if limit is not None]
+    return min(limits) if limits else None
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Record/Replay (--record DIR / --replay DIR oder SCRAPER_RECORD_DIR / SCRAPER_REPLAY_DIR)
+FIXTURES: Optional[FixtureStore] = open_fixture_store(
+    os.environ.get('SCRAPER_RECORD_DIR'), os.environ.get('SCRAPER_REPLAY_DIR')
+)
+
+_fussballdaten_base_url = DEFAULT_FUSSBALLDATEN_BASE_URL
+
+def set_fussballdaten_base_url(base_url: Optional[str]):
+    """Setzt die Basis-URL für alle fussballdaten.de-Requests
+
+    Ein anderer Host bekommt dieselben Rate-Limits und dasselbe Caching wie fussballdaten.de.
+    """
+    global _fussballdaten_base_url
+    if not base_url:
+        return
+    _fussballdaten_base_url = base_url.rstrip('/')
+    host = urlsplit(_fussballdaten_base_url).netloc.lower()
+    default_host = urlsplit(DEFAULT_FUSSBALLDATEN_BASE_URL).netloc
+    if host != default_host:
+        RATE_LIMITER.alias_host(host, default_host)
+        if HTTP_CACHE is not None:
+            HTTP_CACHE.add_host(host)
+        print(f"🔀 fussballdaten.de-Basis-URL: {_fussballdaten_base_url}")
+
+def fussballdaten_url(path: str) -> str:
+    """Baut eine fussballdaten.de-URL aus einem Pfad (z.B. 'bundesliga/2026/5/')"""
+    return f"{_fussballdaten_base_url}/{path.lstrip('/')}"
+
+def configure_fixtures(record_dir: Optional[str] = None, replay_dir: Optional[str] = None):
+    """Aktiviert Aufzeichnen (record_dir) oder Abspielen (replay_dir) für alle folgenden Requests"""
+    global FIXTURES
+    store = open_fixture_store(record_dir, replay_dir)
+    if store is not None:
+        FIXTURES = store
+        print(f"🎞️ Fixture-Modus: {store.mode} ({store.directory})")
+
+def add_fixture_arguments(parser):
+    """Fügt --record/--replay zu einem argparse-Parser hinzu"""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--record', metavar='DIR', default=None,
+                       help="Alle HTTP-Antworten in DIR aufzeichnen (alternativ: SCRAPER_RECORD_DIR)")
+    group.add_argument('--replay', metavar='DIR', default=None,
+                       help="HTTP-Antworten aus DIR abspielen, ohne Netzwerk (alternativ: SCRAPER_REPLAY_DIR)")
+
+def add_base_url_argument(parser):
+    """Fügt --base-url zu einem argparse-Parser hinzu"""
+    parser.add_argument('--base-url', default=None,
+                        help="Basis-URL statt https://www.fussballdaten.de (alternativ: FUSSBALLDATEN_BASE_URL)")
+
+def apply_fixture_arguments(args):
+    """Übernimmt --record/--replay aus den geparsten Argumenten"""
+    configure_fixtures(args.record, args.replay)
+
+def get_session() -> requests.Session:
+    """Gibt die gemeinsame Session zurück (wird beim ersten Aufruf erstellt)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                _session = session
+    return _session
+
+def request(method: str, url: str, headers: Optional[Dict[str, str]] = None, timeout=None, **kwargs) -> requests.Response:
+    """Führt einen Request über die gemeinsame Session aus
+
+    headers werden mit DEFAULT_HEADERS zusammengeführt, timeout fällt auf DEFAULT_TIMEOUT zurück.
+    GET-Requests auf fussballdaten.de laufen über den HTTP-Cache (frische Einträge ohne Request,
+    abgelaufene per If-None-Match/If-Modified-Since).
+    Jeder Request läuft durch den Rate Limiter des Hosts; bei 429/503 wird gebremst und
+    (nur GET) bis zu MAX_THROTTLE_RETRIES mal wiederholt, sofern die Pause in MAX_THROTTLE_RETRY_WAIT
+    und das Run-Budget passt (sonst wird die 429/503-Antwort zurückgegeben). Müsste schon der erste
+    Versuch über das Budget hinaus warten, wird ThrottleWaitExceeded geworfen. Jeder gesendete Request zählt gegen das Run-Budget.
+    Fehler (Timeout, Verbindungsfehler) werden wie bei requests.request geworfen.
+    Im Replay-Modus kommt die Antwort aus dem Fixture-Store (kein Netzwerk, kein Cache),
+    im Record-Modus wird jede Antwort zusätzlich gespeichert.
+    """
+    if FIXTURES is not None and FIXTURES.mode == 'replay':
+        RUN_BUDGET.count_request()
+        return FIXTURES.replay(method, url)
+    return _request(method, url, headers=headers, timeout=timeout, **kwargs)
+
+def _request(method: str, url: str, headers: Optional[Dict[str, str]] = None, timeout=None, **kwargs) -> requests.Response:
+    """Request über Cache, Rate Limiter und gemeinsame Session (ohne Replay)"""
+    use_cache, cached, headers = _prepare_request(method, url, headers)
+    if cached is not None:
+        return _record_fixture(method, url, cached)
+    
+    retries = MAX_THROTTLE_RETRIES if method.upper() == 'GET' else 0
+    response = None
+    for attempt in range(retries + 1):
+        if not _admit_attempt(url, RATE_LIMITER.acquire(url, throttle_max_wait(attempt)), response):
+            break
+        try:
+            response = get_session().request(
+                method, url,
+                headers=headers,
+                timeout=timeout if timeout is not None else DEFAULT_TIMEOUT,
+                **kwargs
+            )
+        except requests.exceptions.RequestException:
+            RATE_LIMITER.on_error(url)
+            raise
+        if _attempt_done(url, response, attempt, retries):
+            break
+    
+    return _finish_request(method, url, response, use_cache)
+
+# Schritte vor und nach dem Senden, gemeinsam mit async_fetch.AsyncFetcher (nur der Transport unterscheidet sich)
+
+def _prepare_request(method: str, url: str, headers: Optional[Dict[str, str]]) -> Tuple[bool, Optional[requests.Response], Optional[Dict[str, str]]]:
+    """HTTP-Cache vor dem Senden: (use_cache, frische Antwort aus dem Cache oder None, Header inkl. If-None-Match/If-Modified-Since)"""
+    use_cache = method.upper() == 'GET' and HTTP_CACHE is not None and HTTP_CACHE.is_cacheable(url, headers)
+    if not use_cache:
+        return False, None, headers
+    cached = HTTP_CACHE.get_fresh(url)
+    if cached is not None:
+        return True, cached, headers
+    return True, None, {**(headers or {}), **HTTP_CACHE.conditional_headers(url)}
+
+def _admit_attempt(url: str, acquired: bool, response: Optional[requests.Response]) -> bool:
+    """Nach dem Rate Limiter: True, wenn der Versuch gesendet wird (zählt gegen das Run-Budget).
+    Ohne Freigabe wird eine Wiederholung ausgelassen; müsste schon der erste Versuch zu lange warten, ThrottleWaitExceeded"""
+    if not acquired:
+        if response is None:
+            raise ThrottleWaitExceeded(f"{urlsplit(url).netloc} pausiert länger als das Run-Budget erlaubt")
+        print(f"  ⏱️ Keine Wiederholung für {url} - Pause zu lang für Budget/Limit")
+        return False
+    RUN_BUDGET.count_request()
+    return True
+
+def _attempt_done(url: str, response: requests.Response, attempt: int, retries: int) -> bool:
+    """Meldet die Antwort an den Rate Limiter; True, wenn nicht (mehr) wiederholt wird"""
+    RATE_LIMITER.on_response(url, response.status_code, response.headers.get('Retry-After'))
+    return response.status_code not in THROTTLE_STATUS_CODES or attempt == retries
+
+def _finish_request(method: str, url: str, response: requests.Response, use_cache: bool) -> requests.Response:
+    """Nach dem letzten Versuch: Antwort im HTTP-Cache ablegen (304 → gespeicherte Antwort) und im Record-Modus speichern"""
+    if use_cache:
+        response = HTTP_CACHE.process_response(url, response)
+    return _record_fixture(method, url, response)
+
+def _record_fixture(method: str, url: str, response: requests.Response) -> requests.Response:
+    """Speichert die Antwort im Record-Modus (auch Antworten aus dem HTTP-Cache)"""
+    if FIXTURES is not None and FIXTURES.mode == 'record':
+        FIXTURES.record(method, url, response)
+    return response
+
+def get(url: str, headers: Optional[Dict[str, str]] = None, timeout=None, **kwargs) -> requests.Response:
+    """GET-Request über die gemeinsame Session"""
+    return request('GET', url, headers=headers, timeout=timeout, **kwargs)
+
+def build_response(url: str, status_code: int, headers: Optional[Dict[str, str]], body: bytes, encoding: Optional[str] = None) -> requests.Response:
+    """Erstellt ein requests.Response-Objekt aus bereits geladenen Daten (z.B. vom asynchronen Client)"""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response._content = body
+    response.encoding = encoding or requests.utils.get_encoding_from_headers(response.headers) or 'utf-8'
+    return response
+
+set_fussballdaten_base_url(os.environ.get('FUSSBALLDATEN_BASE_URL'))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Ligen gleichzeitig scrapen
+Die Ligen sind unabhängig (eigene URL-Bäume, eigene Dateien) und werden in einem Thread-Pool
+bearbeitet. Alle Requests laufen weiter durch den gemeinsamen Rate Limiter (http_client), die
+Last auf fussballdaten.de bleibt also gleich - nur die Wartezeiten der Ligen überlappen.
+
+Die Ausgaben jeder Liga werden gepuffert und in der Reihenfolge der Ligen ausgegeben,
+Ergebnisse kommen ebenfalls in dieser Reihenfolge zurück (deterministisch wie sequentiell).
+"""
+
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+# Standard-Anzahl gleichzeitiger Ligen (1 = nacheinander wie bisher)
+DEFAULT_LEAGUE_WORKERS = int(os.environ.get('SCRAPER_LEAGUE_WORKERS', '4'))
+
+class ThreadOutput(io.TextIOBase):
+    """stdout-Ersatz: Threads mit Puffer schreiben in ihren Puffer, alle anderen direkt"""
+
+    def __init__(self, target):
+        self.target = target
+        self.local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self.local, 'buffer', None)
+        if buffer is None:
+            return self.target.write(text)
+        return buffer.write(text)
+
+    def flush(self):
+        self.target.flush()
+
+def add_league_workers_argument(parser):
+    parser.add_argument(
+        '--league-workers', type=int, default=DEFAULT_LEAGUE_WORKERS,
+        help=f"Anzahl gleichzeitig bearbeiteter Ligen (alternativ: SCRAPER_LEAGUE_WORKERS, Standard {DEFAULT_LEAGUE_WORKERS}, 1 = nacheinander)"
+    )
+
+def run_leagues(jobs: List[Tuple[str, Callable[[], Any]]], workers: Optional[int] = None) -> List[Any]:
+    """
+    Führt die Jobs (Liga-Name, Funktion) aus und gibt ihre Ergebnisse in Job-Reihenfolge zurück.
+    Fehler fangen die Jobs selbst ab (wie in den main-Funktionen); eine trotzdem geworfene
+    Exception wird nach der Ausgabe der vorherigen Ligen weitergegeben.
+    """
+    workers = DEFAULT_LEAGUE_WORKERS if workers is None else workers
+    if workers <= 1 or len(jobs) <= 1:
+        return [job() for _, job in jobs]
+
+    output = ThreadOutput(sys.stdout)
+
+    def run(job: Callable[[], Any]) -> Tuple[Any, Optional[BaseException], str]:
+        output.local.buffer = io.StringIO()
+        try:
+            return job(), None, output.local.buffer.getvalue()
+        except Exception as e:
+            return None, e, output.local.buffer.getvalue()
+        finally:
+            output.local.buffer = None
+
+    print(f"🧵 {len(jobs)} Ligen mit {min(workers, len(jobs))} Workern")
+    previous_stdout = sys.stdout
+    sys.stdout = output
+    results = []
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='league') as executor:
+            futures = [(name, executor.submit(run, job)) for name, job in jobs]
+            # In Liga-Reihenfolge ausgeben, sobald die jeweilige Liga fertig ist
+            for name, future in futures:
+                result, error, text = future.result()
+                output.target.write(text)
+                output.target.flush()
+                if error is not None:
+                    output.target.write(f"❌ Unerwarteter Fehler bei {name}: {error}\n")
+                    raise error
+                results.append(result)
+    finally:
+        sys.stdout = previous_stdout
+    return results
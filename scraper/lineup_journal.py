@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Checkpoints für Aufstellungs-Läufe
+Bricht ein Lauf von scrape_lineups.py ab (Timeout, Runner beendet, Fehler in einer Liga), waren
+bisher alle Aufstellungen dieser Liga verloren. Jetzt wird nach jedem (bzw. jedem N-ten) Spiel
+ein kleines Journal pro Liga geschrieben (.cache/lineup_journal/{liga}.json): Spiel-Identität →
+Ergebnis von scrape_lineup_for_match (Aufstellung oder null für "nicht gefunden").
+Mit --resume übernimmt der nächste Lauf die vollständigen Aufstellungen, statt diese Spiele erneut
+zu laden; "nicht gefunden" und unvollständige Aufstellungen werden erneut getestet (sie können
+inzwischen erschienen sein).
+Nach dem Speichern der Liga wird das Journal gelöscht.
+"""
+
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from http_cache import CACHE_DIR
+from lineup_store import COMPLETE_LINEUP_SIZE, LineupKey
+
+JOURNAL_DIR = os.path.join(CACHE_DIR, 'lineup_journal')
+
+# Checkpoint nach so vielen Spielen (0 = kein Journal)
+DEFAULT_CHECKPOINT_EVERY = int(os.environ.get('SCRAPER_CHECKPOINT_EVERY', '1'))
+
+# Ältere Journale werden beim Fortsetzen ignoriert (Aufstellungen können sich inzwischen geändert haben)
+JOURNAL_MAX_AGE_SECONDS = float(os.environ.get('SCRAPER_JOURNAL_MAX_AGE_HOURS', '12')) * 3600
+
+LineupResult = Optional[Tuple[List[str], List, bool]]
+
+def is_complete_result(result: LineupResult) -> bool:
+    """True für eine vollständige Aufstellung (mindestens COMPLETE_LINEUP_SIZE Spieler pro Team)"""
+    return bool(result) and all(len(players or []) >= COMPLETE_LINEUP_SIZE for players in result[:2])
+
+def journal_path(league_name: str) -> str:
+    return os.path.join(JOURNAL_DIR, f"{league_name}.json")
+
+def clear_journal(league_name: str):
+    """Löscht das Journal einer Liga (nach erfolgreichem Speichern der Aufstellungen)"""
+    try:
+        os.remove(journal_path(league_name))
+    except OSError:
+        pass
+
+class LineupJournal:
+    """Ergebnisse der bereits bearbeiteten Spiele einer Liga in diesem Lauf"""
+
+    def __init__(self, league_name: str, season: str, resume: bool = False, every: Optional[int] = None):
+        self.league_name = league_name
+        self.season = season
+        self.every = DEFAULT_CHECKPOINT_EVERY if every is None else every
+        self.path = journal_path(league_name)
+        self._results: Dict[LineupKey, LineupResult] = {}
+        self._pending = 0
+        self.resumed = 0
+        if resume:
+            self._results = self._load()
+            self.resumed = len(self._results)
+        elif self.every > 0:
+            clear_journal(league_name)
+
+    def _load(self) -> Dict[LineupKey, LineupResult]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('season') != self.season:
+            return {}
+        if time.time() - data.get('updatedAt', 0) > JOURNAL_MAX_AGE_SECONDS:
+            print(f"   ⌛ Journal für {self.league_name} ist älter als {JOURNAL_MAX_AGE_SECONDS / 3600:.0f} h - wird ignoriert")
+            return {}
+        results = {}
+        for item in data.get('matches', []):
+            if isinstance(item, dict) and isinstance(item.get('key'), list):
+                lineup = item.get('lineup')
+                lineup = tuple(lineup) if isinstance(lineup, list) else None
+                # Nur vollständige Aufstellungen gelten als erledigt
+                if is_complete_result(lineup):
+                    results[tuple(item['key'])] = lineup
+        return results
+
+    def __contains__(self, key: LineupKey) -> bool:
+        return key in self._results
+
+    def get(self, key: LineupKey) -> LineupResult:
+        return self._results.get(key)
+
+    def record(self, key: LineupKey, result: LineupResult):
+        """Merkt das Ergebnis eines Spiels; schreibt das Journal nach every Spielen"""
+        if self.every <= 0:
+            return
+        self._results[key] = result
+        self._pending += 1
+        if self._pending >= self.every:
+            self.flush()
+
+    def flush(self):
+        if self.every <= 0 or not self._pending:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_file = self.path + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "league": self.league_name,
+                "season": self.season,
+                "updatedAt": time.time(),
+                "matches": [{"key": list(key), "lineup": result} for key, result in self._results.items()],
+            }, f, ensure_ascii=False)
+        os.replace(tmp_file, self.path)
+        self._pending = 0
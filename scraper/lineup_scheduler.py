@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Anpfiff-gesteuerter Aufstellungs-Scheduler
+Aufstellungen erscheinen erst ca. eine Stunde vor Anpfiff. Statt alle 30 Minuten alle Ligen
+komplett zu scrapen, liest der Scheduler die Match-Dateien, baut eine nach Zeit sortierte
+Warteschlange und testet jedes Spiel nur in einem Fenster um den Anpfiff (Standard T-75 bis T+15 Minuten).
+Wie in scrape_lineups.py entscheidet der gemeinsame Speicher (LineupStore.needs_scrape), ob ein Spiel
+getestet wird: fehlende/unvollständige Aufstellungen immer, vollständige nur im Fenster T-75 bis T+15
+(sie können sich bis zum Anpfiff noch ändern).
+
+Verwendung:
+    python lineup_scheduler.py            # Dauerbetrieb: schläft bis zum nächsten fälligen Spiel
+    python lineup_scheduler.py --once     # Nur aktuell fällige Spiele testen und beenden (z.B. per Cron)
+"""
+
+import argparse
+import heapq
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+import http_client
+from probe_cache import PROBE_CACHE
+from slug_index import SLUG_INDEX
+from match_url_index import MATCH_URL_INDEX
+from lineup_store import LineupStore, lineup_key
+from scrape_lineups import (
+    LEAGUE_CONFIGS, build_lineup_entry, get_current_season,
+    get_scraping_season, load_match_records, save_lineups_json, scrape_lineup_for_match,
+)
+
+# Fenster um den Anpfiff (Minuten) und Abstand zwischen zwei Tests desselben Spiels
+DEFAULT_BEFORE_MINUTES = 75
+DEFAULT_AFTER_MINUTES = 15
+DEFAULT_INTERVAL_MINUTES = 10
+
+# Match-Dateien werden im Dauerbetrieb so oft neu gelesen (Verlegungen, neue Spiele)
+RELOAD_INTERVAL = timedelta(hours=1)
+
+class LineupScheduler:
+    """Zeitlich sortierte Warteschlange (Heap) der Spiele, deren Aufstellung fehlt oder sich noch ändern kann"""
+
+    def __init__(self, leagues: List[str], before: timedelta, after: timedelta, interval: timedelta, data_dir: str = 'data/matches'):
+        self.leagues = leagues
+        self.before = before
+        self.after = after
+        self.interval = interval
+        self.data_dir = os.path.join('..', data_dir) if os.path.basename(os.getcwd()) == 'scraper' else data_dir
+        self._queue: List[Tuple[datetime, int, Dict]] = []
+        self._sequence = 0
+        # Ein Speicher pro Liga (in load() gelesen), geänderte Ligen werden nach jeder Runde geschrieben
+        self.stores: Dict[str, LineupStore] = {}
+        self._dirty: Set[str] = set()
+        self.loaded_at: Optional[datetime] = None
+        self.probes = 0
+        self.stored = 0
+
+    def _push(self, due: datetime, job: Dict):
+        heapq.heappush(self._queue, (due, self._sequence, job))
+        self._sequence += 1
+
+    def load(self, now: datetime):
+        """Baut die Warteschlange aus den Match-Dateien neu auf (und liest die gespeicherten Aufstellungen)"""
+        self.flush()
+        self._queue = []
+        self.stores = {}
+        for league_name in self.leagues:
+            league_path, is_international, liga_id = LEAGUE_CONFIGS.get(league_name, (league_name, False, 1))
+            matches, _ = load_match_records(os.path.join(self.data_dir, f"matches_{league_name}.json"), league_name)
+            scraping_season = get_scraping_season(league_name)
+            stored = self.stores[league_name] = LineupStore(league_name, season=scraping_season)
+            queued = 0
+            for match in matches:
+                if match.kickoff_epoch is None:
+                    continue
+                kickoff = datetime.fromtimestamp(match.kickoff_epoch, timezone.utc)
+                if kickoff + self.after < now:
+                    continue
+                match_key = lineup_key(*match.fields())
+                due = max(now, kickoff - self.before)
+                if not stored.needs_scrape(match_key, match.kickoff_epoch, due.timestamp()):
+                    continue
+                self._push(due, {
+                    'league': league_name,
+                    'kickoff': kickoff,
+                    'fields': match.fields(),
+                    'key': match_key,
+                    'kickoff_epoch': match.kickoff_epoch,
+                    'lineup_args': (
+                        league_path, scraping_season, match.phase, match.matchday,
+                        match.home_team, match.away_team, is_international, liga_id, match.kickoff_epoch,
+                        (match.home_slug, match.away_slug)
+                    ),
+                })
+                queued += 1
+            if queued:
+                print(f"📋 {league_name}: {queued} Spiele in der Warteschlange (Aufstellung fehlt oder kann sich noch ändern)")
+        self.loaded_at = now
+        if self._queue:
+            print(f"⏰ Nächstes Spiel fällig: {self._queue[0][0]:%d.%m.%Y %H:%M} UTC")
+
+    def next_due(self) -> Optional[datetime]:
+        return self._queue[0][0] if self._queue else None
+
+    def run_due(self, now: datetime) -> int:
+        """Testet alle Spiele, die jetzt fällig sind, und schreibt die geänderten Ligen. Gibt die Anzahl Tests zurück"""
+        count = 0
+        try:
+            while self._queue and self._queue[0][0] <= now:
+                _, _, job = heapq.heappop(self._queue)
+                self.probe(job, now)
+                count += 1
+        finally:
+            self.flush()
+        return count
+
+    def probe(self, job: Dict, now: datetime):
+        """Testet ein Spiel; solange needs_scrape gilt (auch eine vollständige Aufstellung bis T+15), wird es nach interval erneut eingeplant"""
+        home_team, away_team, date_time, matchday, phase = job['fields']
+        minutes = int((job['kickoff'] - now).total_seconds() // 60)
+        print(f"\n⚽ [{job['league']}] {home_team} vs {away_team} (Anpfiff in {minutes} min)")
+        self.probes += 1
+        lineup = scrape_lineup_for_match(*job['lineup_args'])
+        if lineup:
+            entry = build_lineup_entry(home_team, away_team, date_time, matchday, phase, lineup)
+            self.store(job['league'], entry)
+        next_due = now + self.interval
+        if not self.stores[job['league']].needs_scrape(job['key'], job['kickoff_epoch'], next_due.timestamp()):
+            print(f"  ✅ Vollständige Aufstellung gespeichert - Spiel wird nicht mehr getestet")
+            return
+        if next_due <= job['kickoff'] + self.after:
+            self._push(next_due, job)
+        else:
+            print(f"  ⌛ Fenster abgelaufen - keine Aufstellung gefunden")
+
+    def store(self, league_name: str, entry: Dict):
+        """Übernimmt die Aufstellung in den Speicher der Liga (ersetzt den Eintrag desselben Spiels); geschrieben wird mit flush()"""
+        if self.stores[league_name].put(entry):
+            self._dirty.add(league_name)
+            self.stored += 1
+
+    def flush(self):
+        """Schreibt lineups_*.json der Ligen mit neuen Aufstellungen"""
+        for league_name in sorted(self._dirty):
+            store = self.stores[league_name]
+            data = store.data
+            data['lineups'] = store.lineups()
+            data['lastUpdated'] = datetime.now().isoformat()
+            save_lineups_json(league_name, data.get('season') or get_current_season(), data)
+        self._dirty.clear()
+
+    def stats(self) -> str:
+        return f"Scheduler: {self.probes} Spiel-Tests, {self.stored} Aufstellungen gespeichert, {len(self._queue)} offen"
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Kommandozeilen-Optionen"""
+    parser = argparse.ArgumentParser(description="Testet Aufstellungen nur im Fenster um den Anpfiff")
+    parser.add_argument('--once', action='store_true',
+                        help="Nur aktuell fällige Spiele testen und beenden (für Cron/GitHub Actions)")
+    parser.add_argument('--before', type=int, default=DEFAULT_BEFORE_MINUTES,
+                        help=f"Minuten vor Anpfiff, ab denen getestet wird (Standard {DEFAULT_BEFORE_MINUTES})")
+    parser.add_argument('--after', type=int, default=DEFAULT_AFTER_MINUTES,
+                        help=f"Minuten nach Anpfiff, bis zu denen getestet wird (Standard {DEFAULT_AFTER_MINUTES})")
+    parser.add_argument('--interval', type=int, default=DEFAULT_INTERVAL_MINUTES,
+                        help=f"Minuten zwischen zwei Tests desselben Spiels (Standard {DEFAULT_INTERVAL_MINUTES})")
+    parser.add_argument('--leagues', nargs='+', default=list(LEAGUE_CONFIGS), metavar='LIGA',
+                        help="Ligen (Standard: alle)")
+    http_client.add_fixture_arguments(parser)
+    http_client.add_base_url_argument(parser)
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    """Hauptfunktion"""
+    args = parse_args(argv)
+    http_client.apply_fixture_arguments(args)
+    http_client.set_fussballdaten_base_url(args.base_url)
+    print(f"🚀 Starte Aufstellungs-Scheduler (Fenster T-{args.before} bis T+{args.after} min, alle {args.interval} min)...")
+
+    scheduler = LineupScheduler(
+        args.leagues, timedelta(minutes=args.before), timedelta(minutes=args.after), timedelta(minutes=args.interval)
+    )
+    scheduler.load(datetime.now(timezone.utc))
+    try:
+        while True:
+            now = datetime.now(timezone.utc)
+            if not args.once and now - scheduler.loaded_at >= RELOAD_INTERVAL:
+                scheduler.load(now)
+            scheduler.run_due(now)
+            if args.once:
+                break
+            # Ohne fällige Spiele bis zum nächsten Neu-Lesen der Match-Dateien schlafen
+            next_due = scheduler.next_due()
+            sleep_until = scheduler.loaded_at + RELOAD_INTERVAL
+            if next_due is not None:
+                sleep_until = min(next_due, sleep_until)
+            seconds = max(1.0, (sleep_until - datetime.now(timezone.utc)).total_seconds())
+            print(f"💤 Schlafe {seconds / 60:.1f} min bis {sleep_until:%d.%m.%Y %H:%M} UTC")
+            time.sleep(seconds)
+    except KeyboardInterrupt:
+        print("\n⏹️ Scheduler beendet")
+
+    print(f"\n📊 {scheduler.stats()}")
+    if PROBE_CACHE is not None:
+        PROBE_CACHE.save()
+    if SLUG_INDEX is not None:
+        SLUG_INDEX.save()
+    if MATCH_URL_INDEX is not None:
+        MATCH_URL_INDEX.save()
+    if http_client.FIXTURES is not None:
+        print(f"🎞️ {http_client.FIXTURES.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Gespeicherte Aufstellungen pro Liga (data/lineups/lineups_{liga}.json)
+Die Datei wird nicht mehr bei jedem Lauf durch die Aufstellungen dieses Laufs ersetzt, sondern
+fortgeschrieben: Jede Aufstellung ist über die Spiel-Identität (Heim, Gast, Anpfiff, Spieltag/Phase)
+abgelegt. Spiele mit vollständiger Aufstellung (11 + 11) werden nicht erneut geladen, außer kurz
+vor/nach Anpfiff (vorher veröffentlichte Aufstellungen können sich noch ändern).
+
+Die Datei enthält damit alle Aufstellungen der laufenden Saison (nicht mehr nur das 7-Tage-Fenster
+des letzten Laufs). Einträge einer anderen Saison werden beim Laden verworfen; wird ein Spiel verlegt,
+ersetzt die neue Aufstellung den Eintrag mit dem alten Anpfiff.
+"""
+
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+# Eine Aufstellung gilt als vollständig, wenn beide Teams so viele Spieler haben
+COMPLETE_LINEUP_SIZE = 11
+
+# Vollständige Aufstellungen werden in diesem Fenster um den Anpfiff trotzdem neu geladen (Minuten)
+REFRESH_BEFORE_MINUTES = 75
+REFRESH_AFTER_MINUTES = 15
+
+LineupKey = Tuple[str, str, str, str, str]
+
+def season_of(date_time: Optional[str]) -> Optional[str]:
+    """Saison eines Anpfiffs wie get_current_season (Juli - Juni, z.B. 2025-08-16 → '2026'), sonst None"""
+    try:
+        year, month = int((date_time or '')[:4]), int((date_time or '')[5:7])
+    except ValueError:
+        return None
+    return str(year + 1) if month >= 7 else str(year)
+
+def lineups_file_path(league_name: str, output_dir: str = 'data/lineups') -> str:
+    """Pfad der lineups_*.json einer Liga (relativ zum Repository-Root wie save_lineups_json)"""
+    if os.path.basename(os.getcwd()) == 'scraper':
+        output_dir = os.path.join('..', output_dir)
+    return os.path.join(output_dir, f"lineups_{league_name}.json")
+
+def load_lineups_file(league_name: str) -> Dict:
+    """Lädt die gespeicherten Aufstellungen einer Liga (leere Struktur, falls nicht vorhanden)"""
+    try:
+        with open(lineups_file_path(league_name), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and isinstance(data.get('lineups'), list):
+            return data
+    except (OSError, ValueError):
+        pass
+    return {"league": league_name, "season": "", "lineups": []}
+
+def lineup_key(home_team: str, away_team: str, date_time: str, matchday: Optional[Union[int, str]] = None, phase: Optional[str] = '') -> LineupKey:
+    """Spiel-Identität: Teams, Anpfiff (auf die Minute, ohne 'Z'), Spieltag/Runde und Phase"""
+    return (
+        home_team or '', away_team or '', (date_time or '').rstrip('Z')[:16],
+        '' if matchday is None else str(matchday), phase or '',
+    )
+
+def fixture_key(key: LineupKey) -> Tuple[str, str, str, str]:
+    """Spiel-Identität ohne Anpfiff (Teams, Spieltag/Runde, Phase) - bleibt bei einer Verlegung gleich"""
+    return key[0], key[1], key[3], key[4]
+
+def entry_key(entry: Dict) -> LineupKey:
+    return lineup_key(entry.get('homeTeam'), entry.get('awayTeam'), entry.get('dateTime'), entry.get('matchday'), entry.get('phase'))
+
+def is_complete_lineup(entry: Optional[Dict]) -> bool:
+    return bool(entry) and (len(entry.get('homeLineup') or []) >= COMPLETE_LINEUP_SIZE
+                            and len(entry.get('awayLineup') or []) >= COMPLETE_LINEUP_SIZE)
+
+class LineupStore:
+    """Aufstellungen einer Liga nach Spiel-Identität; Reihenfolge der Datei bleibt erhalten
+
+    season: Saison der Scraping-URLs (get_scraping_season) - Einträge anderer Saisons werden verworfen
+    """
+
+    def __init__(self, league_name: str, data: Optional[Dict] = None, season: Optional[str] = None):
+        self.league_name = league_name
+        self.data = data if data is not None else load_lineups_file(league_name)
+        self._entries: Dict[LineupKey, Dict] = {}
+        self.added = 0
+        self.replaced = 0
+        self.dropped = 0
+        for entry in self.data['lineups']:
+            if not isinstance(entry, dict):
+                continue
+            entry_season = season_of(entry.get('dateTime'))
+            if season and entry_season and entry_season != season:
+                self.dropped += 1
+                continue
+            self._entries[entry_key(entry)] = entry
+        if self.dropped:
+            print(f"   🗑️ {league_name}: {self.dropped} Aufstellungen einer anderen Saison verworfen")
+
+    def get(self, key: LineupKey) -> Optional[Dict]:
+        return self._entries.get(key)
+
+    def needs_scrape(self, key: LineupKey, kickoff_epoch: Optional[float], now: Optional[float] = None) -> bool:
+        """True für fehlende/unvollständige Aufstellungen und vollständige kurz vor/nach Anpfiff"""
+        if not is_complete_lineup(self._entries.get(key)):
+            return True
+        if kickoff_epoch is None:
+            return False
+        now = time.time() if now is None else now
+        return kickoff_epoch - REFRESH_BEFORE_MINUTES * 60 <= now <= kickoff_epoch + REFRESH_AFTER_MINUTES * 60
+
+    def put(self, entry: Dict) -> bool:
+        """
+        Übernimmt eine Aufstellung (ersetzt dasselbe Spiel, auch mit altem Anpfiff nach einer Verlegung).
+        Eine vollständige wird nie durch eine unvollständige desselben Anpfiffs ersetzt
+        """
+        key = entry_key(entry)
+        existing = self._entries.get(key)
+        if existing is not None and is_complete_lineup(existing) and not is_complete_lineup(entry):
+            return False
+        moved = [other for other in self._entries if other != key and fixture_key(other) == fixture_key(key)]
+        for other in moved:
+            del self._entries[other]
+        if existing is None and not moved:
+            self.added += 1
+        else:
+            self.replaced += 1
+        self._entries[key] = entry
+        return True
+
+    def lineups(self) -> List[Dict]:
+        """Alle Aufstellungen: gespeicherte in Datei-Reihenfolge (ersetzte an ihrer Stelle), neue am Ende"""
+        result = []
+        seen = set()
+        for entry in self.data['lineups']:
+            if not isinstance(entry, dict):
+                continue
+            key = entry_key(entry)
+            if key not in seen and key in self._entries:
+                seen.add(key)
+                result.append(self._entries[key])
+        result.extend(entry for key, entry in self._entries.items() if key not in seen)
+        return result
+
+    def stats(self) -> str:
+        dropped = f", {self.dropped} aus anderer Saison verworfen" if self.dropped else ""
+        return f"Aufstellungen: {len(self._entries)} gespeichert, {self.added} neu, {self.replaced} ersetzt{dropped}"
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Einheitlicher Spiel-Datensatz
+Die Match-Dateien liegen in zwei Formaten vor: OpenLigaDB (team1/Team1 mit teamName/TeamName,
+group.groupOrderID, matchDateTime, matchIsFinished) und das Format von scrape_matches.py
+(homeTeam, awayTeam, dateTime, matchday, phase, isFinished). Statt bei jedem Zugriff alle
+Schreibweisen per dict.get zu probieren, wird jedes Spiel einmal beim Laden in einen
+MatchRecord übersetzt (Teams, Spieltag/Runde, Phase, Anpfiff als Epoch, Team-Slugs).
+"""
+
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+from window_planner import match_schedule_entry, parse_match_datetime
+
+# Zeitzone der lokalen Anstoßzeiten (matchDateTime / dateTime)
+LOCAL_TIMEZONE = 'Europe/Berlin'
+
+# Champions League, Europa League, Conference League: scrape_matches.py rechnet die Anstoßzeiten
+# dieser Ligen beim Parsen von MEZ nach UTC um - ihr dateTime ist echte UTC-Zeit
+UTC_DATE_TIME_LIGA_IDS = frozenset({11, 12, 13})
+
+def kickoff_utc(match: Dict, date_time: str, utc: bool = False) -> Optional[datetime]:
+    """Anpfiff in UTC: matchDateTimeUTC (OpenLigaDB), sonst date_time (utc=True: bereits UTC, sonst lokale Zeit)"""
+    utc_value = match.get('matchDateTimeUTC') or match.get('MatchDateTimeUTC')
+    if utc_value:
+        kickoff = parse_match_datetime(utc_value)
+        return kickoff.replace(tzinfo=timezone.utc) if kickoff else None
+    kickoff = parse_match_datetime(date_time)
+    if kickoff is None:
+        return None
+    if utc:
+        return kickoff.replace(tzinfo=timezone.utc)
+    # dateTime der nationalen Ligen aus scrape_matches.py ist lokale Zeit (das 'Z' ist nur angehängt)
+    local_zone = ZoneInfo(LOCAL_TIMEZONE) if ZoneInfo is not None else datetime.now().astimezone().tzinfo
+    return kickoff.replace(tzinfo=local_zone).astimezone(timezone.utc)
+
+def team_name(team: Dict) -> str:
+    return team.get('TeamName') or team.get('teamName') or team.get('name') or team.get('Name') or ''
+
+class MatchRecord:
+    """Ein Spiel aus einer Match-Datei in einheitlicher Form
+
+    matchday: Spieltag (int), bei DFB-Pokal der Runden-Slug ('achtelfinale'), bei K.o.-Runden None
+    kickoff: Anpfiff wie in der Datei (naiv; lokale Zeit, international UTC); kickoff_epoch: Anpfiff in UTC als Unix-Zeit
+    home_slug/away_slug: fussballdaten.de-Slugs (werden mit resolve_slugs gesetzt)
+    """
+
+    __slots__ = (
+        'home_team', 'away_team', 'date_time', 'matchday', 'phase',
+        'kickoff', 'kickoff_epoch', 'finished', 'live', 'home_slug', 'away_slug',
+    )
+
+    def __init__(self, home_team: str, away_team: str, date_time: str, matchday: Optional[Union[int, str]], phase: str,
+                 kickoff: Optional[datetime], kickoff_epoch: Optional[float], finished: bool = False, live: bool = False):
+        self.home_team = home_team
+        self.away_team = away_team
+        self.date_time = date_time
+        self.matchday = matchday
+        self.phase = phase
+        self.kickoff = kickoff
+        self.kickoff_epoch = kickoff_epoch
+        self.finished = finished
+        self.live = live
+        self.home_slug: Optional[str] = None
+        self.away_slug: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"MatchRecord({self.home_team!r} vs {self.away_team!r}, matchday={self.matchday!r}, phase={self.phase!r}, dateTime={self.date_time!r})"
+
+    def fields(self):
+        """(home_team, away_team, date_time, matchday, phase)"""
+        return self.home_team, self.away_team, self.date_time, self.matchday, self.phase
+
+    def schedule_entry(self) -> Optional[Dict]:
+        """Spieltag, Anpfiff und Status wie window_planner.match_schedule_entry"""
+        if not self.matchday or self.kickoff is None:
+            return None
+        return {'matchday': self.matchday, 'kickoff': self.kickoff, 'finished': self.finished}
+
+    @classmethod
+    def from_openligadb(cls, match: Dict, liga_id: int) -> Optional['MatchRecord']:
+        """OpenLigaDB-Format (team1/Team1, group/Group, matchDateTime)"""
+        team1 = match.get('Team1') or match.get('team1')
+        team2 = match.get('Team2') or match.get('team2')
+        if not isinstance(team1, dict) or not isinstance(team2, dict):
+            return None
+        date_time = match.get('MatchDateTime') or match.get('matchDateTime') or match.get('dateTime', '')
+        return cls._build(match, liga_id, team_name(team1), team_name(team2), date_time, '',
+                          bool(match.get('matchIsFinished') or match.get('MatchIsFinished')), False)
+
+    @classmethod
+    def from_fussballdaten(cls, match: Dict, liga_id: int) -> Optional['MatchRecord']:
+        """Format von scrape_matches.py (homeTeam/awayTeam, matchday, phase)"""
+        home_team = match.get('homeTeam') or ''
+        away_team = match.get('awayTeam') or ''
+        if not isinstance(home_team, str) or not isinstance(away_team, str):
+            return None
+        return cls._build(match, liga_id, home_team, away_team, match.get('dateTime', ''), match.get('phase') or '',
+                          bool(match.get('isFinished')), bool(match.get('isLive')))
+
+    @classmethod
+    def _build(cls, match: Dict, liga_id: int, home_team: str, away_team: str, date_time: str, phase: str,
+               finished: bool, live: bool) -> 'MatchRecord':
+        schedule = match_schedule_entry(match, liga_id)
+        if schedule is not None:
+            matchday = schedule['matchday']
+        else:
+            matchday = match.get('matchday') or match.get('Matchday')
+        kickoff = parse_match_datetime(date_time)
+        kickoff_at = kickoff_utc(match, date_time, liga_id in UTC_DATE_TIME_LIGA_IDS)
+        return cls(home_team, away_team, date_time, matchday, phase, kickoff,
+                   kickoff_at.timestamp() if kickoff_at else None, finished, live)
+
+    @classmethod
+    def from_dict(cls, match: Dict, liga_id: int = 1) -> Optional['MatchRecord']:
+        """Erkennt das Format; None für Einträge ohne Teams"""
+        if not isinstance(match, dict):
+            return None
+        if 'homeTeam' in match and 'awayTeam' in match:
+            record = cls.from_fussballdaten(match, liga_id)
+        else:
+            record = cls.from_openligadb(match, liga_id)
+        if record is None or not record.home_team or not record.away_team:
+            return None
+        return record
+
+def build_match_records(matches: Iterable[Dict], liga_id: int = 1) -> List[MatchRecord]:
+    """Übersetzt alle Spiele einer Match-Datei (ungültige Einträge werden übersprungen)"""
+    records = []
+    for match in matches:
+        record = MatchRecord.from_dict(match, liga_id)
+        if record is not None:
+            records.append(record)
+    return records
+
+def resolve_slugs(records: Iterable[MatchRecord], resolver: Callable[[str], str], memo: Optional[Dict[str, str]] = None):
+    """Setzt home_slug/away_slug (resolver wird pro Team-Name nur einmal aufgerufen)
+
+    memo: Team-Name → Slug über mehrere Aufrufe hinweg (z.B. Record für Record in einem Durchlauf)
+    """
+    slugs: Dict[str, str] = {} if memo is None else memo
+    for record in records:
+        for name, attribute in ((record.home_team, 'home_slug'), (record.away_team, 'away_slug')):
+            if name not in slugs:
+                slugs[name] = resolver(name)
+            setattr(record, attribute, slugs[name])
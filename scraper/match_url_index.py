@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Index der Spiel-Detail-URLs
+Die Spieltags-Übersichten listen die exakten Links jedes Spiels
+(/{liga}/{saison}/{spieltag}/{heim}-{gast}/, international /{liga}/{saison}/{phase}/{spieltag}/{heim}-{gast}/).
+Sie werden pro Liga und Saison gesammelt und gespeichert, damit die Aufstellungs-Suche
+direkt die eine richtige URL lädt statt beide Team-Reihenfolgen und Spieltag ±1 zu testen.
+"""
+
+import atexit
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+from http_cache import CACHE_DIR
+from slug_index import split_slug_pair, team_name_core
+
+# Spiel-Link mit Titel "Heim - Gast (Datum)": Liga, Saison, Runde/Phase (beliebig viele Pfadteile), Slug-Paar
+DETAIL_LINK_PATTERN = re.compile(r'<a\b[^>]*href="/([a-z0-9-]+)/(\d{4})/((?:[a-z0-9-]+/)*?)([a-z0-9.]+(?:-[a-z0-9.]+)+)/"[^>]*>', re.IGNORECASE)
+TITLE_PATTERN = re.compile(r'title="([^"(]+?)\s+(?:-|–|vs\.?)\s+([^"(]+?)\s*\(\d{2}\.\d{2}\.\d{4}', re.IGNORECASE)
+
+# Einträge von Saisons, die so lange nicht mehr gesehen wurden, werden beim Speichern entfernt
+MAX_AGE = 400 * 24 * 3600
+
+def round_number(value: Union[int, str, None]) -> Optional[int]:
+    """Spieltag als Zahl (letzter Pfadteil, z.B. 'league-stage/3' → 3), sonst None"""
+    if value is None:
+        return None
+    last = str(value).rstrip('/').rsplit('/', 1)[-1]
+    return int(last) if last.isdigit() else None
+
+class MatchUrlIndex:
+    """Thread-sicherer, gespeicherter Index ("liga/saison" → "heim-gast" → Detail-URL)"""
+
+    def __init__(self, cache_file: str = os.path.join(CACHE_DIR, 'match_urls.json')):
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._changed = False
+        self.learned = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, Dict]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Dict]]:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def harvest(self, html: Optional[str]) -> int:
+        """Übernimmt alle Spiel-Links einer Übersichtsseite. Gibt die Anzahl Links zurück"""
+        if not html:
+            return 0
+        count = 0
+        now = time.time()
+        with self._lock:
+            for link in DETAIL_LINK_PATTERN.finditer(html):
+                title = TITLE_PATTERN.search(link.group(0))
+                if not title:
+                    continue
+                league_path, season, round_path, slug_pair = (group.lower() for group in link.groups())
+                slugs = split_slug_pair(slug_pair, title.group(1), title.group(2))
+                if not slugs:
+                    continue
+                entries = self._entries.setdefault(f"{league_path}/{season}", {})
+                path = f"{league_path}/{season}/{round_path}{slug_pair}/"
+                entry = entries.get(slug_pair)
+                count += 1
+                if entry is not None and entry.get('path') == path and now - entry.get('seenAt', 0) < 24 * 3600:
+                    continue
+                if entry is None or entry.get('path') != path:
+                    self.learned += 1
+                entries[slug_pair] = {
+                    'path': path,
+                    'round': round_path.rstrip('/'),
+                    'homeSlug': slugs[0],
+                    'awaySlug': slugs[1],
+                    'home': title.group(1).strip(),
+                    'away': title.group(2).strip(),
+                    'seenAt': now,
+                }
+                self._changed = True
+        return count
+
+    def lookup(self, league_path: str, season: str, home_slug: str, away_slug: str, home_team: str = '', away_team: str = '', matchday: Union[int, str, None] = None) -> Optional[Tuple[str, str, str]]:
+        """Gibt (Pfad, Heim-Slug, Gast-Slug) des Spiels zurück, sonst None
+
+        Gesucht wird nur in der angegebenen Heim/Gast-Reihenfolge (die umgekehrte ist das Rückspiel),
+        zuerst über die Slugs, dann über die Team-Namen. Liegt der gefundene Spieltag mehr als
+        einen Spieltag neben dem erwarteten, wird dem Eintrag nicht vertraut.
+        """
+        with self._lock:
+            entries = self._entries.get(f"{league_path}/{season}")
+            entry = entries.get(f"{home_slug}-{away_slug}") if entries else None
+            if entries and entry is None and home_team and away_team:
+                home_core = team_name_core(home_team)
+                away_core = team_name_core(away_team)
+                for candidate in entries.values():
+                    if team_name_core(candidate['home']) == home_core and team_name_core(candidate['away']) == away_core:
+                        entry = candidate
+                        break
+            expected = round_number(matchday)
+            found = round_number(entry['round']) if entry else None
+            if entry and expected is not None and found is not None and abs(expected - found) > 1:
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry['path'], entry['homeSlug'], entry['awaySlug']
+
+    def save(self):
+        """Speichert den Index (lange nicht gesehene Saisons werden entfernt)"""
+        with self._lock:
+            if not self._changed:
+                return
+            cutoff = time.time() - MAX_AGE
+            self._entries = {
+                key: entries for key, entries in self._entries.items()
+                if any(entry.get('seenAt', 0) >= cutoff for entry in entries.values())
+            }
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_file = self.cache_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+            self._changed = False
+
+    def stats(self) -> str:
+        return f"Spiel-URL-Index: {self.learned} URLs gelernt, {self.hits} Treffer, {self.misses} nicht gefunden"
+
+# Gemeinsamer Spiel-URL-Index (SCRAPER_MATCH_URL_INDEX=0 deaktiviert ihn)
+MATCH_URL_INDEX: Optional[MatchUrlIndex] = None
+if os.environ.get('SCRAPER_MATCH_URL_INDEX', '1') != '0':
+    MATCH_URL_INDEX = MatchUrlIndex()
+    atexit.register(MATCH_URL_INDEX.save)
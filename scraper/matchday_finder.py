@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Aktueller Spieltag per Bisektion
+Die Termine der Spieltage steigen monoton: Alle Spieltage vor dem aktuellen sind gespielt,
+ab dem aktuellen gibt es zukünftige (oder laufende) Spiele. Der erste Spieltag mit zukünftigen
+Spielen lässt sich deshalb mit O(log n) Seitenaufrufen finden statt linear ab Spieltag 1.
+
+Die Prüfung pro Spieltag ist austauschbar (Übersichtsseite, Seiten-Speicher oder lokale
+Match-Dateien). Die letzte Antwort pro Liga wird gespeichert; der nächste Lauf beginnt dort
+und braucht meist nur zwei Prüfungen.
+"""
+
+import atexit
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from http_cache import CACHE_DIR
+from match_record import MatchRecord
+from window_planner import match_schedule_entry
+
+def find_first_matchday(candidates: Sequence[Any], has_future: Callable[[Any], Optional[bool]], hint: Any = None) -> Optional[Any]:
+    """
+    Gibt den ersten Eintrag aus candidates (aufsteigend sortierte Spieltage/Runden) zurück,
+    für den has_future True liefert, sonst None.
+
+    has_future gibt None zurück, wenn für den Spieltag keine Daten vorliegen (Seite fehlt);
+    solche Spieltage gelten bei der Suche als "noch nicht gespielt". Ist das Ergebnis selbst
+    ohne Daten, wird None zurückgegeben.
+    hint: Spieltag des letzten Laufs - von dort wird in wachsenden Schritten gesucht.
+    """
+    if not candidates:
+        return None
+    results: Dict[int, Optional[bool]] = {}
+
+    def check(index: int) -> Optional[bool]:
+        if index not in results:
+            results[index] = has_future(candidates[index])
+        return results[index]
+
+    def is_open(index: int) -> bool:
+        return check(index) is not False
+
+    last = len(candidates) - 1
+    if hint in candidates:
+        start = list(candidates).index(hint)
+        if is_open(start):
+            if start == 0 or not is_open(start - 1):
+                low = high = start
+            else:
+                # Zurück in wachsenden Schritten, bis ein gespielter Spieltag gefunden ist
+                step, high = 2, start - 1
+                low = max(0, start - step)
+                while low > 0 and is_open(low):
+                    high = low
+                    step *= 2
+                    low = max(0, start - step)
+        else:
+            # Vorwärts in wachsenden Schritten, bis ein offener Spieltag gefunden ist
+            step, low = 1, start + 1
+            high = min(last, start + step)
+            while low <= last and not is_open(high):
+                if high == last:
+                    return None
+                low = high + 1
+                step *= 2
+                high = min(last, start + step)
+            if low > last:
+                return None
+    else:
+        if not is_open(last):
+            return None
+        low, high = 0, last
+
+    # Bisektion: erster offener Index in [low, high] (high ist offen oder der kleinste Kandidat)
+    while low < high:
+        middle = (low + high) // 2
+        if is_open(middle):
+            high = middle
+        else:
+            low = middle + 1
+
+    return candidates[low] if check(low) else None
+
+def open_matchdays_from_matches(matches: List[Union[Dict, MatchRecord]], liga_id: int, phase: Optional[str] = None) -> Dict[Any, bool]:
+    """Spieltag → gibt es noch offene Spiele (aus den lokalen Match-Dateien, optional nur eine Phase)"""
+    open_matchdays: Dict[Any, bool] = {}
+    for match in matches:
+        if isinstance(match, MatchRecord):
+            match_phase = match.phase
+        elif isinstance(match, dict):
+            match_phase = match.get('phase')
+        else:
+            continue
+        if phase is not None and match_phase != phase:
+            continue
+        entry = match_schedule_entry(match, liga_id)
+        if entry is None:
+            continue
+        open_matchdays[entry['matchday']] = open_matchdays.get(entry['matchday'], False) or not entry['finished']
+    return open_matchdays
+
+class MatchdayHints:
+    """Gespeicherte letzte Antworten (Schlüssel z.B. 'bundesliga/2026' oder 'championsleague/2026/league-stage')"""
+
+    def __init__(self, cache_file: str = os.path.join(CACHE_DIR, 'current_matchdays.json')):
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._changed = False
+        self._entries: Dict[str, Any] = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            return self._entries.get(key)
+
+    def remember(self, key: str, matchday: Any):
+        with self._lock:
+            if self._entries.get(key) != matchday:
+                self._entries[key] = matchday
+                self._changed = True
+
+    def save(self):
+        with self._lock:
+            if not self._changed:
+                return
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_file = self.cache_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_file, self.cache_file)
+            self._changed = False
+
+# Gemeinsame Spieltags-Hinweise (SCRAPER_MATCHDAY_HINTS=0 deaktiviert sie)
+MATCHDAY_HINTS: Optional[MatchdayHints] = None
+if os.environ.get('SCRAPER_MATCHDAY_HINTS', '1') != '0':
+    MATCHDAY_HINTS = MatchdayHints()
+    atexit.register(MATCHDAY_HINTS.save)
+
+def find_current_matchday_cached(key: str, candidates: Sequence[Any], has_future: Callable[[Any], Optional[bool]]) -> Optional[Any]:
+    """find_first_matchday mit gespeicherter letzter Antwort als Startpunkt"""
+    hint = MATCHDAY_HINTS.get(key) if MATCHDAY_HINTS is not None else None
+    matchday = find_first_matchday(candidates, has_future, hint)
+    if matchday is not None and MATCHDAY_HINTS is not None:
+        MATCHDAY_HINTS.remember(key, matchday)
+    return matchday
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Spiel-Links der Spieltags-/Phasen-Übersichten
+Jeder Spiel-Link wird anhand seines Abschnitts (bis zum nächsten Spiel-Link) als live, beendet
+oder zukünftig eingeordnet. Wird vom Parser (scrape_matches.py) und vom HTTP-Cache
+(TTL für beendete Spieltage) gemeinsam verwendet, damit beide dieselbe Sicht auf eine Seite haben.
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Titel mit Datum, z.B. title="Team A - Team B (22.08.2025) ..."
+MATCH_TITLE_DATE_PATTERN = re.compile(r'title="[^"]*\((\d{2})\.(\d{2})\.(\d{4})[^)]*\)[^"]*"', re.IGNORECASE)
+MATCH_CLASS_PATTERN = re.compile(r'class="([^"]*)"', re.IGNORECASE)
+# Im Abschnitt nach dem Link: Uhrzeit (Zukunft), Ergebnis (live) oder Ergebnis mit id (beendet)
+FUTURE_TIME_PATTERN = re.compile(r'<span>(\d{2}:\d{2})</span>', re.IGNORECASE)
+LIVE_SCORE_PATTERN = re.compile(r'<span[^>]*>(\d+:\d+)</span>', re.IGNORECASE)
+FINISHED_SCORE_PATTERN = re.compile(r'<span[^>]*id="[^"]*"[^>]*>(\d+:\d+)</span>', re.IGNORECASE)
+# Internationale Übersichten: Ergebnis ohne id (einstellige Heim-Tore, sonst wäre es eine Uhrzeit)
+PLAIN_SCORE_PATTERN = re.compile(r'<span[^>]*>(\d:\d+)</span>', re.IGNORECASE)
+
+# Beliebiger Spiel-Link mit Datum im Titel (alle Ligen und Phasen, auch /vereine/-Links)
+ANY_MATCH_LINK_PATTERN = re.compile(r'<a\b[^>]*\btitle="[^"]*\(\d{2}\.\d{2}\.\d{4}[^>]*>', re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def match_anchor_pattern(league_path: str) -> re.Pattern:
+    """Pattern für Spiel-Links einer Liga: <a ... href="/{liga}/{saison}/{spieltag}/{heim}-{gast}/" ...> (pro Liga gecacht)"""
+    return re.compile(
+        rf'<a\b[^>]*href="/{re.escape(league_path)}/\d+/\d+/([a-z0-9.-]+)/"[^>]*>',
+        re.IGNORECASE
+    )
+
+def classify_match_anchor(html: str, tag: str, start: int, end: int) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Ordnet einen Spiel-Link ein: ('live', Stand), ('finished', Ergebnis), ('future', Uhrzeit)
+    oder (None, None), wenn der Abschnitt html[start:end] nicht dazu passt.
+    """
+    class_match = MATCH_CLASS_PATTERN.search(tag)
+    css_classes = class_match.group(1).split() if class_match else []
+    if css_classes == ['ergebnis', 'live']:
+        score_match = LIVE_SCORE_PATTERN.search(html, start, end)
+        return ('live', score_match.group(1)) if score_match else (None, None)
+    if css_classes == ['ergebnis']:
+        score_match = FINISHED_SCORE_PATTERN.search(html, start, end) or PLAIN_SCORE_PATTERN.search(html, start, end)
+        return ('finished', score_match.group(1)) if score_match else (None, None)
+    time_match = FUTURE_TIME_PATTERN.search(html, start, end)
+    return ('future', time_match.group(1)) if time_match else (None, None)
+
+def all_matches_finished(html: str) -> bool:
+    """
+    True, wenn die Seite Spiel-Links enthält und jeder davon ein Ergebnis hat.
+    Ein verlegtes Spiel (nur Uhrzeit <span>HH:MM</span>), ein Live-Spiel oder ein nicht
+    erkennbarer Abschnitt macht die Seite zu einer offenen Seite.
+    """
+    anchors = list(ANY_MATCH_LINK_PATTERN.finditer(html))
+    if not anchors:
+        return False
+    for i, anchor in enumerate(anchors):
+        section_end = anchors[i + 1].start() if i + 1 < len(anchors) else len(html)
+        state, _ = classify_match_anchor(html, anchor.group(0), anchor.end(), section_end)
+        if state != 'finished' or FUTURE_TIME_PATTERN.search(html, anchor.end(), section_end):
+            return False
+    return True
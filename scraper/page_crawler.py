@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Spieltags-Seiten gleichzeitig laden
+Statt Spieltag für Spieltag wird ein gleitendes Fenster von Seiten gleichzeitig geladen
+(Requests weiter über den gemeinsamen Rate Limiter). Die Ergebnisse werden in der
+Reihenfolge der Spieltage ausgewertet, damit die Abbruch-Regel "N leere Seiten in Folge"
+genau wie beim sequentiellen Laden greift; Seiten hinter dem Abbruch werden verworfen.
+Ist das Run-Budget erschöpft (run_budget), werden keine weiteren Seiten mehr gestartet.
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from run_budget import RUN_BUDGET
+
+# Anzahl gleichzeitig geladener Seiten pro Liga (1 = nacheinander wie bisher)
+DEFAULT_CRAWL_WINDOW = int(os.environ.get('SCRAPER_CRAWL_WINDOW', '4'))
+
+def crawl_in_order(
+    items: Iterable[Any],
+    fetch: Callable[[Any], Optional[Any]],
+    window: Optional[int] = None,
+    max_consecutive_empty: Optional[int] = None,
+    group: Optional[Callable[[Any], Hashable]] = None,
+) -> List[Tuple[Any, Any]]:
+    """
+    Lädt fetch(item) für alle items mit bis zu window gleichzeitigen Aufrufen und gibt die
+    nicht leeren Ergebnisse als (item, Ergebnis) in der Reihenfolge von items zurück.
+
+    fetch gibt None für eine leere/fehlende Seite zurück.
+    max_consecutive_empty: nach so vielen leeren Seiten in Folge werden die restlichen Seiten
+    derselben Gruppe (group(item), z.B. die Phase) nicht mehr geladen; noch nicht gestartete
+    Requests werden abgebrochen.
+    Bei erschöpftem Run-Budget werden keine neuen Seiten gestartet (fehlen im Ergebnis, zählen nicht als leer).
+    """
+    items = list(items)
+    window = DEFAULT_CRAWL_WINDOW if window is None else window
+    group_of = group or (lambda item: None)
+    results: List[Tuple[Any, Any]] = []
+    stopped = set()
+    empty_streak: Dict[Hashable, int] = {}
+
+    def consume(item: Any, result: Optional[Any]) -> bool:
+        """Wertet ein Ergebnis aus; True, wenn die Gruppe abgebrochen wird"""
+        key = group_of(item)
+        if result is None:
+            empty_streak[key] = empty_streak.get(key, 0) + 1
+            if max_consecutive_empty is not None and empty_streak[key] >= max_consecutive_empty:
+                stopped.add(key)
+                return True
+            return False
+        empty_streak[key] = 0
+        results.append((item, result))
+        return False
+
+    if window <= 1:
+        for item in items:
+            if RUN_BUDGET.exhausted():
+                break
+            if group_of(item) not in stopped:
+                consume(item, fetch(item))
+        return results
+
+    pending: Dict[int, Future] = {}
+    next_index = 0
+    with ThreadPoolExecutor(max_workers=window, thread_name_prefix='crawl') as executor:
+        def fill():
+            nonlocal next_index
+            while len(pending) < window and next_index < len(items) and not RUN_BUDGET.exhausted():
+                if group_of(items[next_index]) not in stopped:
+                    pending[next_index] = executor.submit(fetch, items[next_index])
+                next_index += 1
+
+        fill()
+        for index, item in enumerate(items):
+            future = pending.pop(index, None)
+            if future is None:
+                continue
+            if consume(item, future.result()):
+                # Abbruch: Seiten dieser Gruppe hinter dem Abbruch verwerfen
+                key = group_of(item)
+                for later in [i for i in pending if group_of(items[i]) == key]:
+                    pending.pop(later).cancel()
+            fill()
+    return results
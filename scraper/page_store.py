@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Seiten-Speicher für einen Scraping-Lauf
+Spieltags-Übersichten (https://www.fussballdaten.de/{liga}/{saison}/{spieltag}/) werden
+pro Lauf nur einmal geladen und nur einmal ausgewertet, auch wenn mehrere Funktionen
+(find_matchdays_to_scrape, find_current_matchday, find_matchday_for_match) sie brauchen.
+"""
+
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+class PageStore:
+    """Lauf-bezogener Speicher für geladene Seiten und deren Auswertung
+
+    fetch: Funktion, die eine URL lädt und HTML oder None zurückgibt
+    now: Referenzzeit des Laufs (damit zeitabhängige Auswertungen wiederverwendbar sind)
+    """
+
+    def __init__(self, fetch: Callable[[str], Optional[str]], now: Optional[datetime] = None):
+        self._fetch = fetch
+        self.now = now or datetime.now()
+        self._pages: Dict[str, Optional[str]] = {}
+        self._parsed: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.parse_hits = 0
+        self.parse_misses = 0
+
+    def get(self, url: str) -> Optional[str]:
+        """Gibt das HTML der URL zurück (lädt nur beim ersten Aufruf, auch Fehlschläge werden gemerkt)"""
+        with self._lock:
+            if url in self._pages:
+                self.hits += 1
+                return self._pages[url]
+            self.misses += 1
+        html = self._fetch(url)
+        with self._lock:
+            self._pages.setdefault(url, html)
+            return self._pages[url]
+
+    def parse(self, url: str, parser: Callable[..., Any], *args) -> Any:
+        """Wertet die Seite mit parser(html, *args) aus - das Ergebnis wird pro (URL, parser, args) gemerkt"""
+        key = (url, parser, args)
+        with self._lock:
+            if key in self._parsed:
+                self.parse_hits += 1
+                return self._parsed[key]
+        html = self.get(url)
+        result = parser(html, *args) if html else None
+        with self._lock:
+            self.parse_misses += 1
+            self._parsed[key] = result
+        return result
+
+    def stats(self) -> str:
+        return (f"Seiten-Speicher: {self.misses} geladen, {self.hits} wiederverwendet, "
+                f"{self.parse_hits} Auswertungen wiederverwendet")
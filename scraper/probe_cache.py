@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Persistenter Negativ-Cache für Aufstellungs-URLs
+Merkt sich URLs, die 404 geliefert haben oder keine heim-content/gast-content enthielten,
+damit der nächste Lauf (alle 30 Minuten) dieselben toten Permutationen
+({heim}-{gast} / {gast}-{heim}, Spieltag ±1) nicht erneut anfragt.
+Die TTL hängt vom Anpfiff ab: je näher der Anpfiff, desto früher wird erneut geprüft.
+Die aus den Übersichten bekannte Detail-URL eines Spiels wird nie als tot gemerkt - ihr fehlt
+höchstens noch die Aufstellung.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from http_cache import CACHE_DIR
+
+HOUR = 3600
+
+def negative_ttl(kickoff_epoch: Optional[float], now: Optional[float] = None, checked_at: Optional[float] = None) -> float:
+    """
+    TTL in Sekunden für eine tote URL, abhängig vom Abstand zum Anpfiff (UTC, Unix-Zeit).
+    checked_at: Zeitpunkt der Prüfung - nach dem Spiel gilt die lange TTL nur für Prüfungen nach Anpfiff
+    """
+    if kickoff_epoch is None:
+        return 6 * HOUR
+    now = time.time() if now is None else now
+    seconds_to_kickoff = kickoff_epoch - now
+    if seconds_to_kickoff > 7 * 24 * HOUR:
+        return 24 * HOUR
+    if seconds_to_kickoff > 24 * HOUR:
+        return 6 * HOUR
+    if seconds_to_kickoff > 3 * HOUR:
+        return 1 * HOUR
+    if seconds_to_kickoff > -3 * HOUR:
+        # Rund um den Anpfiff erscheinen die Aufstellungen - jeden Lauf neu prüfen
+        return 10 * 60
+    if checked_at is not None and checked_at < kickoff_epoch:
+        # Vor Anpfiff geprüft (Aufstellung evtl. noch nicht veröffentlicht) - einmal neu prüfen
+        return 10 * 60
+    # Spiel ist vorbei: Was jetzt noch fehlt, bleibt tot (z.B. falsche Team-Reihenfolge)
+    return 24 * HOUR
+
+# Einträge, die älter sind, werden beim Speichern entfernt
+MAX_AGE = 7 * 24 * HOUR
+
+class NegativeProbeCache:
+    """Thread-sicherer Negativ-Cache (URL → Zeitpunkt der Prüfung und Grund)"""
+
+    def __init__(self, cache_file: str = os.path.join(CACHE_DIR, 'lineup_probes.json')):
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._changed = False
+        self.skipped = 0
+        self.recorded = 0
+        self._entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def is_dead(self, url: str, kickoff_epoch: Optional[float] = None) -> bool:
+        """True, wenn die URL kürzlich tot war und die TTL (nach Anpfiff-Nähe) noch läuft"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if not entry:
+                return False
+            now = time.time()
+            checked_at = entry.get('checkedAt', 0)
+            return now - checked_at < negative_ttl(kickoff_epoch, now, checked_at)
+
+    def filter_candidates(self, candidates: List[Tuple[int, str]], kickoff_epoch: Optional[float] = None) -> List[Tuple[int, str]]:
+        """Entfernt bekannte tote URLs aus der Kandidaten-Liste (Reihenfolge bleibt erhalten)"""
+        remaining = [(phase, url) for phase, url in candidates if not self.is_dead(url, kickoff_epoch)]
+        skipped = len(candidates) - len(remaining)
+        if skipped:
+            with self._lock:
+                self.skipped += skipped
+            print(f"    ⏭️ {skipped} bekannte tote URL(s) übersprungen (Negativ-Cache)")
+        return remaining
+
+    def record(self, url: str, reason: str):
+        """Merkt sich eine tote URL (reason: '404' oder 'no-content')"""
+        with self._lock:
+            self._entries[url] = {'checkedAt': time.time(), 'reason': reason}
+            self.recorded += 1
+            self._changed = True
+
+    def forget(self, url: str):
+        """Entfernt eine URL (z.B. wenn sie inzwischen eine Aufstellung liefert)"""
+        with self._lock:
+            if self._entries.pop(url, None) is not None:
+                self._changed = True
+
+    def save(self):
+        """Speichert den Cache (alte Einträge werden entfernt)"""
+        with self._lock:
+            if not self._changed:
+                return
+            cutoff = time.time() - MAX_AGE
+            self._entries = {url: e for url, e in self._entries.items() if e.get('checkedAt', 0) >= cutoff}
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_file = self.cache_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_file, self.cache_file)
+            self._changed = False
+
+    def stats(self) -> str:
+        return f"Negativ-Cache: {self.skipped} tote URLs übersprungen, {self.recorded} neu gemerkt"
+
+def dead_probe_reason(status_code: Optional[int], html: Optional[str]) -> Optional[str]:
+    """Gibt den Grund zurück, falls die Antwort eine tote Aufstellungs-URL ist (sonst None)
+
+    Verbindungsfehler (status_code None) und andere Statuscodes werden nicht gemerkt.
+    """
+    if status_code == 404:
+        return '404'
+    if status_code == 200 and html is not None and ("heim-content" not in html or "gast-content" not in html):
+        return 'no-content'
+    return None
+
+# Gemeinsamer Negativ-Cache (SCRAPER_PROBE_CACHE=0 deaktiviert ihn)
+PROBE_CACHE: Optional[NegativeProbeCache] = None
+if os.environ.get('SCRAPER_PROBE_CACHE', '1') != '0':
+    PROBE_CACHE = NegativeProbeCache()
+    atexit.register(PROBE_CACHE.save)
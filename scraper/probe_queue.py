@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Aufstellungs-Tests aller Ligen in einer Warteschlange
+Bisher wurden die Spiele Liga für Liga in Datei-Reihenfolge getestet; ein Spiel mit Anpfiff in
+20 Minuten konnte hinter 100 Spielen der nächsten Woche warten. scrape_lineups.py plant jetzt
+zuerst alle Ligen, führt die Spiele nach Dringlichkeit zu einer Warteschlange zusammen
+(Zeit bis Anpfiff, ob schon eine Aufstellung gespeichert ist) und lässt die Worker sie in dieser
+Reihenfolge abarbeiten. Bei Budget- oder Nebenläufigkeits-Grenzen kommen so die zeitkritischen
+Aufstellungen zuerst.
+"""
+
+import io
+import os
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from league_pool import ThreadOutput
+from run_budget import RUN_BUDGET
+
+# Anzahl gleichzeitiger Aufstellungs-Tests (ohne Async-Modus; 1 = nacheinander)
+DEFAULT_PROBE_WORKERS = int(os.environ.get('SCRAPER_PROBE_WORKERS', '4'))
+
+def add_probe_workers_argument(parser):
+    parser.add_argument(
+        '--probe-workers', type=int, default=DEFAULT_PROBE_WORKERS,
+        help=f"Anzahl gleichzeitiger Aufstellungs-Tests über alle Ligen (alternativ: SCRAPER_PROBE_WORKERS, Standard {DEFAULT_PROBE_WORKERS}, 1 = nacheinander)"
+    )
+
+def run_in_order(tasks: List[Tuple[str, Callable[[], Any]]], workers: Optional[int] = None,
+                 on_done: Optional[Callable[[int, Any], None]] = None) -> Dict[int, Any]:
+    """
+    Führt die Tasks (Bezeichnung, Funktion) mit bis zu workers Threads aus; ein freier Worker nimmt
+    immer den nächsten Task der Liste (die Liste ist nach Dringlichkeit sortiert).
+    Ist das Run-Budget erschöpft, wird kein weiterer Task begonnen.
+    on_done(Index, Ergebnis) wird nacheinander (nie gleichzeitig) aufgerufen, z.B. für Checkpoints.
+    Die Ausgaben eines Tasks werden gepuffert und am Stück ausgegeben, sobald er fertig ist.
+    Gibt {Index: Ergebnis} der fertigen Tasks zurück; ein Task mit Fehler wird ausgegeben und fehlt.
+    """
+    workers = DEFAULT_PROBE_WORKERS if workers is None else workers
+    results: Dict[int, Any] = {}
+    lock = threading.Lock()
+    next_index = 0
+    buffered = workers > 1 and len(tasks) > 1
+    output = ThreadOutput(sys.stdout)
+
+    def take() -> Optional[int]:
+        nonlocal next_index
+        with lock:
+            if next_index >= len(tasks) or RUN_BUDGET.exhausted():
+                return None
+            next_index += 1
+            return next_index - 1
+
+    def worker():
+        while True:
+            index = take()
+            if index is None:
+                return
+            label, task = tasks[index]
+            if buffered:
+                output.local.buffer = io.StringIO()
+            else:
+                print(f"\n[{index + 1}/{len(tasks)}] {label}")
+            error = None
+            try:
+                result = task()
+            except Exception as e:
+                error = e
+                traceback.print_exc(file=sys.stdout)
+            text = ''
+            if buffered:
+                text = output.local.buffer.getvalue()
+                output.local.buffer = None
+            with lock:
+                if buffered:
+                    output.target.write(f"\n[{index + 1}/{len(tasks)}] {label}\n{text}")
+                    output.target.flush()
+                if error is not None:
+                    print(f"  ❌ Fehler bei {label}: {error}")
+                    continue
+                results[index] = result
+                if on_done is not None:
+                    on_done(index, result)
+
+    if not buffered:
+        worker()
+        return results
+
+    previous_stdout = sys.stdout
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='probe') as executor:
+            for future in [executor.submit(worker) for _ in range(min(workers, len(tasks)))]:
+                future.result()
+    finally:
+        sys.stdout = previous_stdout
+    return results
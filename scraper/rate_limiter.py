@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Adaptiver Rate Limiter (Token Bucket pro Host)
+Ersetzt das feste time.sleep(REQUEST_DELAY) vor jedem Request:
+- Requests pro Sekunde und Burst pro Host
+- 429/503 und Retry-After bremsen automatisch (Rate halbieren, Pause einlegen)
+- Bei gesunden Antworten wird die Rate schrittweise wieder erhöht
+"""
+
+import asyncio
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Standard-Limits pro Host: (Requests pro Sekunde, Burst, maximale Rate nach Erholung)
+# fussballdaten.de: 2 Requests/s entspricht dem bisherigen REQUEST_DELAY von 0.5s
+HOST_LIMITS: Dict[str, Tuple[float, int, float]] = {
+    'www.fussballdaten.de': (
+        float(os.environ.get('SCRAPER_RATE_LIMIT', '2.0')),
+        int(os.environ.get('SCRAPER_RATE_BURST', '4')),
+        float(os.environ.get('SCRAPER_RATE_LIMIT_MAX', '4.0')),
+    ),
+}
+DEFAULT_LIMIT: Tuple[float, int, float] = (5.0, 5, 10.0)
+
+# Statuscodes, bei denen der Host überlastet ist
+THROTTLE_STATUS_CODES = (429, 503)
+
+# Anpassung der Rate: Halbieren bei Überlast, +10% nach RECOVERY_AFTER gesunden Antworten
+MIN_RATE = 0.2
+BACKOFF_FACTOR = 0.5
+RECOVERY_FACTOR = 1.1
+RECOVERY_AFTER = 10
+# Pause, wenn 429/503 ohne Retry-After kommt
+DEFAULT_THROTTLE_PAUSE = 5.0
+# Obergrenze für Retry-After (verhindert, dass ein Lauf stundenlang wartet)
+MAX_RETRY_AFTER = 120.0
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parst den Retry-After-Header (Sekunden oder HTTP-Datum) zu Sekunden"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class TokenBucket:
+    """Token Bucket für einen Host (nicht thread-safe, wird vom HostRateLimiter gesperrt)"""
+
+    def __init__(self, rate: float, burst: int, max_rate: float):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_rate = max(rate, max_rate)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.healthy_streak = 0
+
+    def reserve(self, now: float) -> float:
+        """Reserviert ein Token und gibt die Wartezeit in Sekunden zurück"""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        # Negative Tokens = bereits reservierte Requests, die noch warten
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+    def release(self):
+        """Gibt ein reserviertes, aber nicht genutztes Token zurück"""
+        self.tokens = min(self.burst, self.tokens + 1)
+
+    def throttle(self, now: float, retry_after: Optional[float]):
+        """Host ist überlastet: Rate halbieren und ggf. pausieren"""
+        self.rate = max(MIN_RATE, self.rate * BACKOFF_FACTOR)
+        self.healthy_streak = 0
+        pause = retry_after if retry_after is not None else DEFAULT_THROTTLE_PAUSE
+        self.paused_until = max(self.paused_until, now + min(pause, MAX_RETRY_AFTER))
+        # Bereits angesparte Tokens verfallen, damit nach der Pause kein Burst kommt
+        self.tokens = min(self.tokens, 0.0)
+
+    def recover(self):
+        """Gesunde Antwort: nach RECOVERY_AFTER Antworten Rate wieder erhöhen"""
+        self.healthy_streak += 1
+        if self.healthy_streak >= RECOVERY_AFTER and self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate * RECOVERY_FACTOR)
+            self.healthy_streak = 0
+
+class HostRateLimiter:
+    """Thread-sicherer Rate Limiter mit einem Token Bucket pro Host"""
+
+    def __init__(self, host_limits: Optional[Dict[str, Tuple[float, int, float]]] = None, default_limit: Tuple[float, int, float] = DEFAULT_LIMIT):
+        self.host_limits = dict(HOST_LIMITS if host_limits is None else host_limits)
+        self.default_limit = default_limit
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst, max_rate = self.host_limits.get(host, self.default_limit)
+            bucket = TokenBucket(rate, burst, max_rate)
+            self._buckets[host] = bucket
+        return bucket
+
+    def reserve(self, url: str) -> float:
+        """Reserviert einen Request-Slot für den Host der URL, gibt Wartezeit in Sekunden zurück"""
+        with self._lock:
+            return self._bucket(url).reserve(time.monotonic())
+
+    def _reserve_within(self, url: str, max_wait: Optional[float]) -> Optional[float]:
+        """Reserviert einen Slot, wenn die Wartezeit höchstens max_wait beträgt; sonst None (nichts reserviert)"""
+        with self._lock:
+            bucket = self._bucket(url)
+            wait = bucket.reserve(time.monotonic())
+            if max_wait is not None and wait > max_wait:
+                bucket.release()
+                return None
+            return wait
+
+    def acquire(self, url: str, max_wait: Optional[float] = None) -> bool:
+        """Blockiert, bis ein Request an den Host der URL erlaubt ist.
+        Müsste länger als max_wait Sekunden gewartet werden, wird sofort False zurückgegeben"""
+        wait = self._reserve_within(url, max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, url: str, max_wait: Optional[float] = None) -> bool:
+        """Asynchrone Variante von acquire"""
+        wait = self._reserve_within(url, max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def on_response(self, url: str, status_code: int, retry_after: Optional[str] = None):
+        """Passt die Rate anhand der Antwort an (429/503 bremsen, sonst Erholung)"""
+        with self._lock:
+            bucket = self._bucket(url)
+            if status_code in THROTTLE_STATUS_CODES:
+                bucket.throttle(time.monotonic(), parse_retry_after(retry_after))
+                print(f"  🐢 HTTP {status_code} von {urlsplit(url).netloc} - Rate reduziert auf {bucket.rate:.2f}/s")
+            else:
+                bucket.recover()
+
+    def on_error(self, url: str):
+        """Verbindungsfehler/Timeout: wie Überlast behandeln (ohne Retry-After)"""
+        with self._lock:
+            self._bucket(url).throttle(time.monotonic(), None)
+
+    def alias_host(self, alias: str, host: str):
+        """Gibt einem weiteren Host dieselben Limits wie host (z.B. lokaler Test-Server)"""
+        with self._lock:
+            self.host_limits[alias.lower()] = self.host_limits.get(host, self.default_limit)
+            self._buckets.pop(alias.lower(), None)
+
+    def current_rate(self, url: str) -> float:
+        """Aktuelle Rate (Requests pro Sekunde) für den Host der URL"""
+        with self._lock:
+            return self._bucket(url).rate
+
+# Gemeinsamer Limiter für alle Fetcher eines Prozesses
+RATE_LIMITER = HostRateLimiter()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Zeit- und Request-Budget eines Laufs
+Die Workflows laufen alle 5 bzw. 10 Minuten; ein langsamer Lauf überlappt sonst mit dem nächsten.
+Mit --deadline SECONDS / --max-requests N wird keine neue Arbeit mehr begonnen, sobald das Budget
+(abzüglich einer Reserve für laufende Requests und das Speichern) verbraucht ist. Bereits geladene
+Ergebnisse werden normal gespeichert, der Rest folgt im nächsten Lauf.
+
+Damit bei knappem Budget das Wichtigste zuerst kommt, wird die Arbeit nach Wert sortiert
+(work_priority): laufende Spiele, dann bald beginnende (nach Anpfiff), dann ältere Spiele.
+"""
+
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
+# Reserve vor der Deadline (Sekunden, höchstens ein Viertel der Deadline) für laufende Requests und das Speichern
+DEFAULT_DEADLINE_RESERVE = float(os.environ.get('SCRAPER_DEADLINE_RESERVE', '30'))
+
+# Ein Spiel gilt so lange nach Anpfiff als laufend (Minuten, inkl. Halbzeit und Nachspielzeit)
+LIVE_MINUTES = 135
+
+class RunBudget:
+    """Deadline und Request-Zähler eines Laufs (thread-safe, gemeinsam für alle Ligen)"""
+
+    def __init__(self, deadline_seconds: Optional[float] = None, max_requests: Optional[int] = None):
+        self._lock = threading.Lock()
+        self.configure(deadline_seconds, max_requests)
+
+    def configure(self, deadline_seconds: Optional[float] = None, max_requests: Optional[int] = None):
+        """Startet das Budget neu (None = unbegrenzt)"""
+        with self._lock:
+            self.started = time.monotonic()
+            self.deadline_seconds = deadline_seconds if deadline_seconds and deadline_seconds > 0 else None
+            self.max_requests = max_requests if max_requests and max_requests > 0 else None
+            self.requests = 0
+            self.stop_reason: Optional[str] = None
+
+    @property
+    def limited(self) -> bool:
+        return self.deadline_seconds is not None or self.max_requests is not None
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def exhausted(self) -> bool:
+        """True, sobald keine neue Arbeit mehr begonnen werden soll (wird beim ersten Mal gemeldet)"""
+        if not self.limited:
+            return False
+        with self._lock:
+            if self.stop_reason is None:
+                elapsed = time.monotonic() - self.started
+                if self.deadline_seconds is not None:
+                    reserve = min(DEFAULT_DEADLINE_RESERVE, self.deadline_seconds / 4)
+                    if elapsed >= self.deadline_seconds - reserve:
+                        self.stop_reason = f"Deadline {self.deadline_seconds:.0f}s (nach {elapsed:.0f}s, Reserve {reserve:.0f}s)"
+                if self.stop_reason is None and self.max_requests is not None and self.requests >= self.max_requests:
+                    self.stop_reason = f"Request-Budget {self.max_requests} verbraucht"
+                if self.stop_reason is not None:
+                    print(f"⏱️ Budget erschöpft: {self.stop_reason} - keine neue Arbeit mehr, Ergebnisse werden gespeichert")
+            return self.stop_reason is not None
+
+    def remaining_seconds(self) -> Optional[float]:
+        """Sekunden bis keine neue Arbeit mehr begonnen wird (Deadline abzüglich Reserve), None ohne Deadline"""
+        if self.deadline_seconds is None:
+            return None
+        reserve = min(DEFAULT_DEADLINE_RESERVE, self.deadline_seconds / 4)
+        return max(0.0, self.deadline_seconds - reserve - (time.monotonic() - self.started))
+
+    def stats(self) -> str:
+        elapsed = time.monotonic() - self.started
+        limits = []
+        if self.deadline_seconds is not None:
+            limits.append(f"Deadline {self.deadline_seconds:.0f}s")
+        if self.max_requests is not None:
+            limits.append(f"max. {self.max_requests} Requests")
+        status = f", gestoppt: {self.stop_reason}" if self.stop_reason else ""
+        return f"Budget: {elapsed:.0f}s, {self.requests} Requests ({', '.join(limits) or 'unbegrenzt'}){status}"
+
+def _env_number(name: str) -> Optional[float]:
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+# Gemeinsames Budget (SCRAPER_DEADLINE / SCRAPER_REQUEST_BUDGET oder --deadline / --max-requests)
+RUN_BUDGET = RunBudget(_env_number('SCRAPER_DEADLINE'), int(_env_number('SCRAPER_REQUEST_BUDGET') or 0))
+
+def add_budget_arguments(parser):
+    parser.add_argument(
+        '--deadline', type=float, default=None, metavar='SECONDS',
+        help="Nach so vielen Sekunden keine neue Arbeit mehr beginnen und Teilergebnisse speichern (alternativ: SCRAPER_DEADLINE)"
+    )
+    parser.add_argument(
+        '--max-requests', type=int, default=None, metavar='N',
+        help="Nach so vielen HTTP-Requests keine neue Arbeit mehr beginnen (alternativ: SCRAPER_REQUEST_BUDGET)"
+    )
+
+def apply_budget_arguments(args):
+    """Übernimmt --deadline/--max-requests (ohne Angabe bleiben die Umgebungsvariablen gültig)"""
+    if args.deadline is not None or args.max_requests is not None:
+        RUN_BUDGET.configure(
+            args.deadline if args.deadline is not None else RUN_BUDGET.deadline_seconds,
+            args.max_requests if args.max_requests is not None else RUN_BUDGET.max_requests,
+        )
+    if RUN_BUDGET.limited:
+        print(f"⏱️ {RUN_BUDGET.stats()}")
+
+def work_priority(kickoff_epoch: Optional[float], live: bool = False, now: Optional[float] = None) -> Tuple[int, float]:
+    """
+    Sortierschlüssel nach Wert (kleiner = wichtiger):
+    0 laufende Spiele, 1 bald beginnende (frühester Anpfiff zuerst), 2 vergangene (jüngste zuerst), 3 ohne Anpfiff
+    """
+    if kickoff_epoch is None:
+        return (0, 0.0) if live else (3, 0.0)
+    now = time.time() if now is None else now
+    if live or kickoff_epoch <= now <= kickoff_epoch + LIVE_MINUTES * 60:
+        return (0, kickoff_epoch)
+    if kickoff_epoch > now:
+        return (1, kickoff_epoch)
+    return (2, -kickoff_epoch)
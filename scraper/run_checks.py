@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Wiederholbare Prüfungen der Parser und Datensätze (ohne Netzwerk)
+Jede Prüfung ist eine Funktion check_*, die bei einer Abweichung eine AssertionError wirft.
+Die Übersichtsseiten liegen in check_pages/ (aus fake_fussballdaten_server.py erzeugt, ein verlegtes
+Spiel von Hand), die erwartete Parser-Ausgabe in check_pages/expected.json.
+
+Verwendung:
+    python run_checks.py            # alle Prüfungen
+    python run_checks.py kickoff    # nur Prüfungen, deren Name 'kickoff' enthält
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import traceback
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from http_cache import is_finished_overview
+from lineup_store import COMPLETE_LINEUP_SIZE, LineupStore, lineup_key
+from match_record import build_match_records
+from match_url_index import MatchUrlIndex
+from matchday_finder import find_first_matchday
+from probe_cache import negative_ttl
+from scrape_matches import parse_international_matches, parse_matchday_overview
+
+CHECK_PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'check_pages')
+
+CHECKS: List[Callable[[], None]] = []
+
+def check(function: Callable[[], None]) -> Callable[[], None]:
+    """Registriert eine Prüfung"""
+    CHECKS.append(function)
+    return function
+
+def utc(*args) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+def read_check_page(name: str) -> str:
+    with open(os.path.join(CHECK_PAGES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+def lineup_entry(home: str, away: str, date_time: str, matchday: int, size: int = COMPLETE_LINEUP_SIZE) -> dict:
+    players = [f'p{i}' for i in range(size)]
+    return {'homeTeam': home, 'awayTeam': away, 'dateTime': date_time, 'matchday': matchday, 'phase': None,
+            'homeLineup': players, 'awayLineup': players}
+
+@check
+def check_kickoff_epoch():
+    """Nationale dateTime ist lokale Zeit (Sommerzeit: UTC+2), internationale bereits UTC, OpenLigaDB hat matchDateTimeUTC"""
+    league, = build_match_records([{'homeTeam': 'A', 'awayTeam': 'B', 'dateTime': '2025-09-13T15:30:00Z', 'matchday': 3}], 1)
+    assert league.kickoff_epoch == utc(2025, 9, 13, 13, 30), league.kickoff_epoch
+    international, = build_match_records([{'homeTeam': 'A', 'awayTeam': 'B', 'dateTime': '2025-09-16T19:00:00Z', 'phase': 'league-stage'}], 11)
+    assert international.kickoff_epoch == utc(2025, 9, 16, 19, 0), international.kickoff_epoch
+    openligadb, = build_match_records([{
+        'team1': {'teamName': 'A'}, 'team2': {'teamName': 'B'},
+        'matchDateTime': '2025-08-22T20:30:00', 'matchDateTimeUTC': '2025-08-22T18:30:00Z',
+    }], 1)
+    assert openligadb.kickoff_epoch == utc(2025, 8, 22, 18, 30), openligadb.kickoff_epoch
+
+@check
+def check_international_kickoff_consumers():
+    """Refresh-Fenster (LineupStore) und Negativ-Cache-TTL rechnen mit dem UTC-Anpfiff internationaler Spiele"""
+    record, = build_match_records([{'homeTeam': 'A', 'awayTeam': 'B', 'dateTime': '2025-09-16T19:00:00Z', 'phase': 'league-stage'}], 11)
+    players = [f'p{i}' for i in range(COMPLETE_LINEUP_SIZE)]
+    store = LineupStore('checks', {'lineups': [{
+        'homeTeam': 'A', 'awayTeam': 'B', 'dateTime': '2025-09-16T19:00:00Z', 'matchday': None, 'phase': 'league-stage',
+        'homeLineup': players, 'awayLineup': players,
+    }]})
+    key = lineup_key(*record.fields())
+    # T-60 (vollständige Aufstellung wird noch einmal geprüft), T-120 (noch nicht)
+    assert store.needs_scrape(key, record.kickoff_epoch, utc(2025, 9, 16, 18, 0))
+    assert not store.needs_scrape(key, record.kickoff_epoch, utc(2025, 9, 16, 17, 0))
+    # Zwei Stunden nach Anpfiff liegt das Spiel noch im ±3h-Fenster (10 Minuten TTL)
+    assert negative_ttl(record.kickoff_epoch, utc(2025, 9, 16, 21, 0)) == 10 * 60
+
+@check
+def check_overview_pages():
+    """parse_matchday_overview/parse_international_matches und is_finished_overview auf den Seiten in check_pages/"""
+    with open(os.path.join(CHECK_PAGES_DIR, 'expected.json'), 'r', encoding='utf-8') as f:
+        expected = json.load(f)
+    for name, spec in expected.items():
+        html = read_check_page(name)
+        with contextlib.redirect_stdout(io.StringIO()):
+            if spec['parser'] == 'international':
+                matches = parse_international_matches(html, spec['phase'], spec['matchday'], spec['league'])
+            else:
+                matches = parse_matchday_overview(html, spec['matchday'], spec['league'])
+        # Live-Spiele bekommen die aktuelle Zeit als dateTime
+        for match in matches:
+            if match['isLive']:
+                match['dateTime'] = None
+        assert matches == spec['matches'], f"{name}: {len(matches)} Spiele, erwartet {len(spec['matches'])}"
+        assert is_finished_overview(html) == spec['finished'], name
+
+@check
+def check_lineup_store_merge():
+    """LineupStore.put: vollständige nie durch unvollständige ersetzen, Verlegung ersetzt den alten Anpfiff an seiner Stelle"""
+    store = LineupStore('checks', {'lineups': [
+        lineup_entry('A', 'B', '2025-09-13T15:30:00Z', 3),
+        lineup_entry('C', 'D', '2025-09-13T15:30:00Z', 3, size=9),
+        lineup_entry('E', 'F', '2024-09-14T15:30:00Z', 3),
+    ]}, season='2026')
+    assert store.dropped == 1 and len(store.lineups()) == 2, store.stats()
+    
+    assert not store.put(lineup_entry('A', 'B', '2025-09-13T15:30:00Z', 3, size=10))
+    assert store.put(lineup_entry('C', 'D', '2025-09-13T15:30:00Z', 3))
+    # Verlegung: gleiches Spiel (Teams, Spieltag), neuer Anpfiff - auch eine unvollständige Aufstellung ersetzt
+    assert store.put(lineup_entry('A', 'B', '2025-09-16T20:30:00Z', 3, size=10))
+    assert store.put(lineup_entry('G', 'H', '2025-09-14T17:30:00Z', 3))
+    assert (store.added, store.replaced) == (1, 2), store.stats()
+    
+    # Ersetzte stehen an ihrer Stelle, verlegte (neuer Schlüssel) wie neue am Ende
+    assert [(entry['homeTeam'], entry['dateTime']) for entry in store.lineups()] == [
+        ('C', '2025-09-13T15:30:00Z'), ('A', '2025-09-16T20:30:00Z'), ('G', '2025-09-14T17:30:00Z'),
+    ]
+    assert store.get(lineup_key('A', 'B', '2025-09-13T15:30:00Z', 3)) is None
+
+@check
+def check_matchday_finder_bisection():
+    """find_first_matchday liefert den ersten offenen Spieltag wie die lineare Suche, mit und ohne Hinweis des letzten Laufs"""
+    candidates = list(range(1, 35))
+    for current in range(1, 36):
+        for hint in (None, 1, current - 3, current, current + 4, 34):
+            calls = []
+            has_future = lambda matchday: calls.append(matchday) or matchday >= current
+            found = find_first_matchday(candidates, has_future, hint)
+            assert found == (current if current <= 34 else None), (current, hint, found)
+            assert len(calls) == len(set(calls)) and len(calls) <= 12, (current, hint, calls)
+    # Fehlende Seiten (None) gelten als noch nicht gespielt; ist der gefundene Spieltag ohne Daten, gibt es kein Ergebnis
+    has_future = lambda matchday: None if matchday in (20, 21) else matchday >= 22
+    assert find_first_matchday(candidates, has_future) is None
+    assert find_first_matchday(candidates, has_future, hint=22) is None
+    has_future = lambda matchday: None if matchday == 30 else matchday >= 22
+    assert find_first_matchday(candidates, has_future) == 22
+    assert find_first_matchday(candidates, has_future, hint=19) == 22
+
+@check
+def check_match_url_index_lookup():
+    """MatchUrlIndex: Treffer über Slugs oder Team-Namen, nur in Heim/Gast-Reihenfolge und höchstens ±1 Spieltag daneben"""
+    with tempfile.TemporaryDirectory() as directory:
+        index = MatchUrlIndex(os.path.join(directory, 'match_urls.json'))
+        assert index.harvest(read_check_page('bundesliga_7_live.html')) == 9
+        path = ('bundesliga/2026/7/mainz-hoffenheim/', 'mainz', 'hoffenheim')
+        assert index.lookup('bundesliga', '2026', 'mainz', 'hoffenheim', matchday=7) == path
+        assert index.lookup('bundesliga', '2026', 'mainz', 'hoffenheim', matchday=8) == path
+        assert index.lookup('bundesliga', '2026', 'mainz05', 'tsg', 'Mainz', 'Hoffenheim') == path
+        assert index.lookup('bundesliga', '2026', 'hoffenheim', 'mainz') is None
+        assert index.lookup('bundesliga', '2026', 'mainz', 'hoffenheim', matchday=9) is None
+        assert index.lookup('bundesliga', '2025', 'mainz', 'hoffenheim') is None
+        index.save()
+        assert MatchUrlIndex(index.cache_file).lookup('bundesliga', '2026', 'mainz', 'hoffenheim') == path
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Führt die Prüfungen aus; Rückgabe 1, wenn eine fehlschlägt"""
+    argv = sys.argv[1:] if argv is None else argv
+    selected = [function for function in CHECKS if not argv or any(name in function.__name__ for name in argv)]
+    failed = 0
+    for function in selected:
+        try:
+            function()
+            print(f"✅ {function.__name__}")
+        except Exception:
+            failed += 1
+            print(f"❌ {function.__name__}")
+            traceback.print_exc(file=sys.stdout)
+    print(f"\n📊 {len(selected) - failed}/{len(selected)} Prüfungen erfolgreich")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
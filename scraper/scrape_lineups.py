@@ -4,23 +4,37 @@ Lineup-Scraper für Anstoss App
 Scrapt Aufstellungen von fussballdaten.de für alle Spiele und speichert sie als JSON auf GitHub
 """
 
-import requests
 import re
 import json
 import os
 import sys
+import asyncio
+import argparse
+import heapq
+import traceback
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional, Tuple, Union
-import time
+from typing import Callable, Iterable, List, Dict, Optional, Tuple, Union
 
 # Import Team-Slug-Konverter
-from team_slug_converter import convert_team_to_slug, REQUEST_DELAY
-
-# User-Agent für Requests
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-}
+from team_slug_converter import convert_team_to_slug, convert_teams_to_slugs, has_curated_team_slug
+# Gemeinsamer HTTP-Client (Keep-Alive-Session, einheitliche Header)
+import http_client
+from http_client import fussballdaten_url
+# Seiten-Speicher pro Lauf (Spieltags-Übersichten nur einmal laden/auswerten)
+from page_store import PageStore
+# Negativ-Cache für tote Aufstellungs-URLs (persistent zwischen Läufen)
+from probe_cache import PROBE_CACHE, dead_probe_reason
+from slug_index import SLUG_INDEX
+from match_url_index import MATCH_URL_INDEX
+from window_planner import plan_matchdays_from_matches
+from match_record import MatchRecord, build_match_records, resolve_slugs
+from matchday_finder import find_current_matchday_cached, open_matchdays_from_matches
+from league_pool import add_league_workers_argument, run_leagues
+from lineup_store import LineupStore, lineup_key
+from lineup_journal import DEFAULT_CHECKPOINT_EVERY, LineupJournal, clear_journal
+from run_budget import RUN_BUDGET, add_budget_arguments, apply_budget_arguments, work_priority
+from probe_queue import add_probe_workers_argument, run_in_order
 
 def get_current_season() -> str:
     """Ermittelt die aktuelle Saison (Juli - Juni)"""
@@ -41,19 +55,60 @@ def get_international_season() -> str:
     """Ermittelt die aktuelle internationale Saison (Juli - Juni)"""
     return get_current_season()
 
+def get_scraping_season(league_name: str) -> str:
+    """Saison für die fussballdaten.de-URLs einer Liga"""
+    if league_name in ["championsleague", "europaleague", "conferenceleague"]:
+        # Internationale Ligen: Verwende internationale Saison für Scraping-URLs
+        return get_international_season()
+    # Deutsche Ligen und andere Ligen (england, spain, italy, france): aktuelle Saison (kein +1 mehr)
+    return get_current_season()
+
 def fetch_html(url: str) -> Optional[str]:
-    """Lädt HTML von einer URL mit Rate Limiting"""
+    """Lädt HTML von einer URL (Rate Limiting übernimmt http_client)"""
+    return fetch_html_with_status(url)[1]
+
+def fetch_html_with_status(url: str) -> Tuple[Optional[int], Optional[str]]:
+    """Wie fetch_html, gibt zusätzlich den HTTP-Status zurück (None bei Verbindungsfehler)"""
     try:
-        time.sleep(REQUEST_DELAY)  # Rate Limiting
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        response = http_client.get(url)
         if response.status_code == 200:
-            return response.text
+            return response.status_code, response.text
         else:
             print(f"  ⚠️ HTTP {response.status_code} für {url}")
-            return None
+            return response.status_code, None
     except Exception as e:
         print(f"  ❌ Fehler beim Laden von {url}: {e}")
+        return None, None
+
+def parse_kickoff(date_time: str) -> Optional[datetime]:
+    """Parst den Anpfiff aus dateTime/matchDateTime (z.B. '2025-08-22T20:30:00' oder mit 'Z')"""
+    if not date_time:
         return None
+    try:
+        return datetime.fromisoformat(date_time.rstrip('Z')[:19])
+    except ValueError:
+        return None
+
+def fetch_overview(url: str, pages: Optional[PageStore] = None) -> Optional[str]:
+    """Lädt eine Spieltags-/Runden-Übersicht (über den Seiten-Speicher des Laufs, falls vorhanden)
+
+    Die Spiel-Links der Übersicht werden in den Slug-Index und den Spiel-URL-Index übernommen
+    (pro Lauf einmal pro Seite).
+    """
+    html = pages.get(url) if pages is not None else fetch_html(url)
+    if html:
+        for index in (SLUG_INDEX, MATCH_URL_INDEX):
+            if index is None:
+                continue
+            if pages is not None:
+                pages.parse(url, index.harvest)
+            else:
+                index.harvest(html)
+    return html
+
+def overview_has_future_matches(url: str, html: str, now: datetime, pages: Optional[PageStore] = None) -> bool:
+    """has_future_matches für eine Übersicht (Ergebnis wird im Seiten-Speicher gemerkt)"""
+    return pages.parse(url, has_future_matches, now) if pages is not None else has_future_matches(html, now)
 
 def extract_team_html(html: str, css_class: str) -> str:
     """Extrahiert Team-HTML aus dem Gesamt-HTML (heim-content oder gast-content)"""
@@ -176,7 +231,7 @@ def is_coach(name: str) -> bool:
 
 # Team-Name-Konvertierung wird jetzt von team_slug_converter.py übernommen
 
-def find_matchday_for_match(league_path: str, season: str, home_team: str, away_team: str, is_international: bool = False, liga_id: int = 1, phase: str = '', allowed_matchdays: Optional[List[Union[int, str]]] = None) -> Optional[Union[int, str]]:
+def find_matchday_for_match(league_path: str, season: str, home_team: str, away_team: str, is_international: bool = False, liga_id: int = 1, phase: str = '', allowed_matchdays: Optional[List[Union[int, str]]] = None, pages: Optional[PageStore] = None) -> Optional[Union[int, str]]:
     """
     Findet den richtigen Spieltag für ein Match, indem durch Spieltage iteriert wird
     und geprüft wird, ob das spezifische Match auf diesem Spieltag ist.
@@ -187,19 +242,18 @@ def find_matchday_for_match(league_path: str, season: str, home_team: str, away_
         allowed_matchdays: Optional. Liste von Spieltagen, die durchsucht werden sollen.
                           Wenn None, werden alle Spieltage durchsucht (alte Logik).
                           Beispiel: [16, 17, 18] oder ["achtelfinale", "viertelfinale"]
+        pages: Optional. Seiten-Speicher des Laufs (jede Übersicht wird nur einmal geladen)
     """
-    from team_slug_converter import convert_team_to_slug
-    
-    now = datetime.now()
-    home_slug = convert_team_to_slug(home_team, liga_id, is_international)
-    away_slug = convert_team_to_slug(away_team, liga_id, is_international)
+    now = pages.now if pages is not None else datetime.now()
+    home_slug = lookup_team_slug(home_team, league_path, liga_id, is_international)
+    away_slug = lookup_team_slug(away_team, league_path, liga_id, is_international)
     
     if is_international:
         # Internationale Ligen: Prüfe Phasen mit Spieltagen
         if phase in ['gruppenphase', 'league-stage']:
             for matchday in range(1, 21):
-                url = f"https://www.fussballdaten.de/{league_path}/{season}/{phase}/{matchday}/"
-                html = fetch_html(url)
+                url = fussballdaten_url(f"{league_path}/{season}/{phase}/{matchday}/")
+                html = fetch_overview(url, pages)
                 if not html or len(html) < 1000:
                     continue
                 
@@ -210,7 +264,7 @@ def find_matchday_for_match(league_path: str, season: str, home_team: str, away_
                         print(f"    📅 Spieltag {matchday} gefunden (Match gefunden auf diesem Spieltag)")
                         return matchday
                 # Fallback: Prüfe ob Spiele in der Zukunft sind (wenn Team-Slugs nicht gefunden)
-                elif has_future_matches(html, now):
+                elif overview_has_future_matches(url, html, now, pages):
                     print(f"    📅 Spieltag {matchday} gefunden (hat zukünftige Spiele, aber Match nicht verifiziert)")
                     return matchday
         else:
@@ -224,8 +278,8 @@ def find_matchday_for_match(league_path: str, season: str, home_team: str, away_
         else:
             rounds = ['1-runde', '2-runde', 'achtelfinale', 'viertelfinale', 'halbfinale', 'finale']
         for round_name in rounds:
-            url = f"https://www.fussballdaten.de/{league_path}/{season}/{round_name}/"
-            html = fetch_html(url)
+            url = fussballdaten_url(f"{league_path}/{season}/{round_name}/")
+            html = fetch_overview(url, pages)
             if not html or len(html) < 1000:
                 continue
             
@@ -235,7 +289,7 @@ def find_matchday_for_match(league_path: str, season: str, home_team: str, away_
                     print(f"    📅 Runde {round_name} gefunden (Match gefunden in dieser Runde)")
                     return round_name
             # Fallback: Prüfe ob Spiele in der Zukunft sind
-            elif has_future_matches(html, now):
+            elif overview_has_future_matches(url, html, now, pages):
                 print(f"    📅 Runde {round_name} gefunden (hat zukünftige Spiele, aber Match nicht verifiziert)")
                 return round_name
     else:
@@ -247,8 +301,8 @@ def find_matchday_for_match(league_path: str, season: str, home_team: str, away_
             matchdays_to_check = range(1, 35)
         
         for matchday in matchdays_to_check:
-            url = f"https://www.fussballdaten.de/{league_path}/{season}/{matchday}/"
-            html = fetch_html(url)
+            url = fussballdaten_url(f"{league_path}/{season}/{matchday}/")
+            html = fetch_overview(url, pages)
             if not html or len(html) < 1000:
                 continue
             
@@ -259,64 +313,73 @@ def find_matchday_for_match(league_path: str, season: str, home_team: str, away_
                     print(f"    📅 Spieltag {matchday} gefunden (Match gefunden auf diesem Spieltag)")
                     return matchday
             # Fallback: Prüfe ob Spiele in der Zukunft sind (wenn Team-Slugs nicht gefunden)
-            elif has_future_matches(html, now):
+            elif overview_has_future_matches(url, html, now, pages):
                 print(f"    📅 Spieltag {matchday} gefunden (hat zukünftige Spiele, aber Match nicht verifiziert)")
                 return matchday
     
     return None
 
-def find_current_matchday(league_path: str, season: str, is_international: bool = False, liga_id: int = 1) -> Optional[Union[int, str]]:
+def find_current_matchday(league_path: str, season: str, is_international: bool = False, liga_id: int = 1, pages: Optional[PageStore] = None, matches: Optional[List[Dict]] = None) -> Optional[Union[int, str]]:
     """
-    Findet den aktuellen Spieltag, indem durch Spieltage iteriert wird
-    und geprüft wird, ob Spiele in der Zukunft sind.
+    Findet den aktuellen Spieltag per Bisektion über die Spieltage
+    (erster Spieltag mit zukünftigen Spielen, siehe matchday_finder).
     
-    Gibt den ersten Spieltag zurück, der zukünftige Spiele hat.
+    Mit matches wird zuerst in den lokalen Match-Daten gesucht, sonst in den Übersichtsseiten
+    (über den Seiten-Speicher, wenn vorhanden). Die letzte Antwort pro Liga ist der Startpunkt
+    des nächsten Laufs.
     """
-    now = datetime.now()
+    now = pages.now if pages is not None else datetime.now()
+    
+    def overview_check(path: str):
+        """Prüfung für einen Spieltag über die Übersichtsseite (None = Seite fehlt)"""
+        url = fussballdaten_url(path)
+        html = fetch_overview(url, pages)
+        if not html or len(html) < 1000:
+            return None
+        return overview_has_future_matches(url, html, now, pages)
+    
+    def local_check(phase: Optional[str] = None):
+        """Prüfung aus den lokalen Match-Daten (None = Spieltag nicht in der Datei)"""
+        open_matchdays = open_matchdays_from_matches(matches or [], liga_id, phase)
+        return open_matchdays.get
     
     if is_international:
         # Internationale Ligen: Prüfe Phasen mit Spieltagen
         phases_with_matchdays = ['gruppenphase', 'league-stage']
         for phase in phases_with_matchdays:
-            for matchday in range(1, 21):
-                url = f"https://www.fussballdaten.de/{league_path}/{season}/{phase}/{matchday}/"
-                html = fetch_html(url)
-                if not html or len(html) < 1000:
-                    continue
-                
-                # Prüfe ob Spiele in der Zukunft sind
-                if has_future_matches(html, now):
-                    print(f"   📅 Aktueller Spieltag gefunden: {phase} {matchday}")
-                    return (phase, matchday)
+            key = f"{league_path}/{season}/{phase}"
+            matchday = None
+            if matches:
+                matchday = find_current_matchday_cached(key, range(1, 21), local_check(phase))
+            if matchday is None:
+                matchday = find_current_matchday_cached(key, range(1, 21), lambda md: overview_check(f"{league_path}/{season}/{phase}/{md}/"))
+            if matchday is not None:
+                print(f"   📅 Aktueller Spieltag gefunden: {phase} {matchday}")
+                return (phase, matchday)
         return None
     elif liga_id == 3:  # DFB-Pokal
         # DFB-Pokal: Prüfe Runden
         rounds = ['1-runde', '2-runde', 'achtelfinale', 'viertelfinale', 'halbfinale', 'finale']
-        for round_name in rounds:
-            url = f"https://www.fussballdaten.de/{league_path}/{season}/{round_name}/"
-            html = fetch_html(url)
-            if not html or len(html) < 1000:
-                continue
-            
-            # Prüfe ob Spiele in der Zukunft sind
-            if has_future_matches(html, now):
-                print(f"   📅 Aktuelle Runde gefunden: {round_name}")
-                return round_name
-        return None
+        key = f"{league_path}/{season}"
+        round_name = None
+        if matches:
+            round_name = find_current_matchday_cached(key, rounds, local_check())
+        if round_name is None:
+            round_name = find_current_matchday_cached(key, rounds, lambda name: overview_check(f"{league_path}/{season}/{name}/"))
+        if round_name is not None:
+            print(f"   📅 Aktuelle Runde gefunden: {round_name}")
+        return round_name
     else:
-        # Normale Ligen: Iteriere durch Spieltage 1-34
-        for matchday in range(1, 35):
-            url = f"https://www.fussballdaten.de/{league_path}/{season}/{matchday}/"
-            html = fetch_html(url)
-            if not html or len(html) < 1000:
-                continue
-            
-            # Prüfe ob Spiele in der Zukunft sind
-            if has_future_matches(html, now):
-                print(f"   📅 Aktueller Spieltag gefunden: {matchday}")
-                return matchday
-    
-    return None
+        # Normale Ligen: Spieltage 1-34
+        key = f"{league_path}/{season}"
+        matchday = None
+        if matches:
+            matchday = find_current_matchday_cached(key, range(1, 35), local_check())
+        if matchday is None:
+            matchday = find_current_matchday_cached(key, range(1, 35), lambda md: overview_check(f"{league_path}/{season}/{md}/"))
+        if matchday is not None:
+            print(f"   📅 Aktueller Spieltag gefunden: {matchday}")
+        return matchday
 
 def has_future_matches(html: str, now: datetime) -> bool:
     """
@@ -431,7 +494,7 @@ def extract_games_with_dates(html: str) -> List[Dict]:
     
     return spiele
 
-def find_matchdays_to_scrape(league_path: str, season: str, is_international: bool = False, liga_id: int = 1) -> List[Union[int, str]]:
+def find_matchdays_to_scrape(league_path: str, season: str, is_international: bool = False, liga_id: int = 1, pages: Optional[PageStore] = None) -> List[Union[int, str]]:
     """
     Findet alle Spieltage, die gescrapt werden sollen:
     - Alle Spieltage mit Spielen innerhalb von HEUTE + 7 Tage
@@ -439,7 +502,7 @@ def find_matchdays_to_scrape(league_path: str, season: str, is_international: bo
     
     Gibt Liste von Spieltagen zurück: [16, 17, 18] oder ["achtelfinale", "viertelfinale"] für DFB-Pokal
     """
-    heute = datetime.now()
+    heute = pages.now if pages is not None else datetime.now()
     spieltage_zum_scrapen = []
     nachholspiel_spieltage = []
     
@@ -463,14 +526,14 @@ def find_matchdays_to_scrape(league_path: str, season: str, is_international: bo
     print(f"\n🔍 Suche Spieltage zum Scrapen (7-Tage-Fenster)...")
     
     for spieltag in spieltag_range:
-        url = f"https://www.fussballdaten.de/{league_path}/{season}/{spieltag}/"
-        html = fetch_html(url)
+        url = fussballdaten_url(f"{league_path}/{season}/{spieltag}/")
+        html = fetch_overview(url, pages)
         
         if not html or len(html) < 1000:
             continue
         
         # Extrahiere alle Spiele mit Datum
-        alle_spiele = extract_games_with_dates(html)
+        alle_spiele = pages.parse(url, extract_games_with_dates) if pages is not None else extract_games_with_dates(html)
         
         if not alle_spiele:
             continue
@@ -519,125 +582,58 @@ def find_matchdays_to_scrape(league_path: str, season: str, is_international: bo
     
     return alle_spieltage
 
-def scrape_lineup_for_match(league_path: str, season: str, phase: str, matchday: Optional[int], home_team: str, away_team: str, is_international: bool = False, liga_id: int = 1) -> Optional[Tuple[List[str], List[str], bool]]:
-    """Scrapt Aufstellung für ein einzelnes Spiel - OPTIMIERT: Testet zuerst nur ±2 Spieltage, dann alle anderen"""
-    # Erstelle Team-Slugs mit der korrekten Konvertierungs-Logik
-    home_slug = convert_team_to_slug(home_team, liga_id, is_international)
-    away_slug = convert_team_to_slug(away_team, liga_id, is_international)
-    
-    print(f"    🔍 Team-Slugs: '{home_team}' → '{home_slug}', '{away_team}' → '{away_slug}'")
-    print(f"    📋 Spieltag: {matchday}, Phase: {phase}, Liga-ID: {liga_id}, International: {is_international}")
-    
-    if not home_slug or not away_slug:
-        print(f"    ❌ Konnte Team-Slugs nicht erstellen: {home_team} → {home_slug}, {away_team} → {away_slug}")
-        return None
-    
-    # OPTIMIERT: Teste zuerst nur ±1 Spieltag (statt ±2) für maximale Performance
-    # Ziel: 112 Spiele × 3 Spieltage (±1) × 2 URLs = 672 Requests (statt 20.808)
-    # Wenn alle im ersten Versuch gefunden werden: ~5-6 Minuten statt 173 Minuten
-    
+def build_lineup_url_candidates(league_path: str, season: str, phase: str, matchday: Optional[Union[int, str]], home_slug: str, away_slug: str, is_international: bool = False, liga_id: int = 1) -> List[Tuple[int, str]]:
+    """
+    Erstellt die Aufstellungs-URLs in der Reihenfolge, in der sie getestet werden.
+    Gibt Liste von (Test-Phase, URL) zurück:
+    - Phase 1: Erwarteter Spieltag / Runde / Phase (beide Team-Reihenfolgen)
+    - Phase 2: ±1 Spieltag (nur normale Ligen, falls Phase 1 fehlschlägt)
+    """
     # STEP 1: Spieltag-Ermittlung für jede Liga
     # - Bundesliga/2. Bundesliga/England/Spain/Italy/France: matchday kommt direkt aus Match-Daten (wird beim Scraping aus URL extrahiert)
     # - DFB-Pokal: matchday ist Runden-Name (z.B. "1-runde", "achtelfinale")
     # - Internationale Ligen: phase + matchday kommen aus Match-Daten
+    candidates = []
     
-    # Phase 1: Teste zuerst nur den spezifischen Spieltag ±1 (3 Spieltage: base-1, base, base+1)
+    # Phase 1: Teste zuerst nur den spezifischen Spieltag
     if is_international:
         # International: Teste zuerst spezifischen Spieltag (kein ±1, da Phase wichtig ist)
         # WICHTIG: Nur die aktuelle Phase verwenden (z.B. gruppenphase 5, nicht alle Phasen)
-        first_rounds_to_test = []
-        if matchday and phase:
-            first_rounds_to_test.append((phase, matchday))
-        elif phase:
-            # Phase ohne Spieltag (z.B. achtelfinale)
-            first_rounds_to_test.append((phase, None))
-    elif liga_id == 3:  # DFB-Pokal
-        # DFB-Pokal: Teste zuerst spezifische Runde (kein ±1, da Runden-Namen sind)
-        first_rounds_to_test = []
+        if phase:
+            if matchday:
+                base_url = fussballdaten_url(f"{league_path}/{season}/{phase}/{matchday}")
+            else:
+                # Phase ohne Spieltag (z.B. achtelfinale)
+                base_url = fussballdaten_url(f"{league_path}/{season}/{phase}")
+            candidates.append((1, f"{base_url}/{home_slug}-{away_slug}/"))
+            candidates.append((1, f"{base_url}/{away_slug}-{home_slug}/"))
+        return candidates
+    
+    first_rounds_to_test = []
+    if liga_id == 3:  # DFB-Pokal
+        # DFB-Pokal: Teste nur die spezifische Runde (kein ±1, da Runden-Namen sind)
         if matchday and isinstance(matchday, str):
             dfb_rounds = ["1-runde", "2-runde", "achtelfinale", "viertelfinale", "halbfinale", "finale"]
             if matchday in dfb_rounds:
                 first_rounds_to_test.append(matchday)
-    else:
-        # Normale Ligen: Teste zuerst nur den spezifischen Spieltag (kein ±1, da wir den richtigen Spieltag haben)
-        first_rounds_to_test = []
-        if matchday:
-            try:
-                base_matchday = int(matchday) if isinstance(matchday, (int, str)) else 1
-                # OPTIMIERT: Nur den spezifischen Spieltag testen (kein ±1, da matchday bereits korrekt ist)
-                first_rounds_to_test = [str(base_matchday)]
-            except:
-                first_rounds_to_test = []
-    
-    # Phase 1: Teste zuerst nur ±1 Spieltag (schnell!)
-    print(f"    📅 Phase 1: Teste {len(first_rounds_to_test)} Spieltage/Runden: {first_rounds_to_test}")
+    elif matchday:
+        # Normale Ligen: Nur den spezifischen Spieltag testen (kein ±1, da matchday bereits korrekt ist)
+        try:
+            base_matchday = int(matchday) if isinstance(matchday, (int, str)) else 1
+            first_rounds_to_test = [str(base_matchday)]
+        except:
+            first_rounds_to_test = []
+    
     for round_value in first_rounds_to_test:
-        if is_international:
-            test_phase, test_matchday = round_value
-            if test_matchday:
-                base_url = f"https://www.fussballdaten.de/{league_path}/{season}/{test_phase}/{test_matchday}"
-            else:
-                base_url = f"https://www.fussballdaten.de/{league_path}/{season}/{test_phase}"
-            urls = [
-                f"{base_url}/{home_slug}-{away_slug}/",
-                f"{base_url}/{away_slug}-{home_slug}/"
-            ]
-        else:
-            # Deutsche/ausländische Ligen
-            urls = [
-                f"https://www.fussballdaten.de/{league_path}/{season}/{round_value}/{home_slug}-{away_slug}/",
-                f"https://www.fussballdaten.de/{league_path}/{season}/{round_value}/{away_slug}-{home_slug}/"
-            ]
-        
-        for url in urls:
-            print(f"    🌐 Teste URL: {url}")
-            html = fetch_html(url)
-            
-            if not html:
-                print(f"    ⚠️ HTML ist None/leer für {url}")
-                continue
-            
-            if "heim-content" not in html or "gast-content" not in html:
-                print(f"    ⚠️ HTML hat keine heim-content/gast-content (Länge: {len(html)})")
-                # Prüfe ob es eine 404 oder andere Fehlerseite ist
-                if "404" in html or "nicht gefunden" in html.lower():
-                    print(f"    ❌ 404-Fehler für {url}")
-                continue
-            
-            if html and "heim-content" in html and "gast-content" in html:
-                # STEP 2: Sofort abbrechen wenn gefunden (keine weiteren Tests!)
-                print(f"    ✅ Aufstellungsseite gefunden: {url}")
-                
-                heim_html = extract_team_html(html, "heim-content")
-                gast_html = extract_team_html(html, "gast-content")
-                
-                heim_start11 = analyze_start11(extract_start11_area(heim_html))
-                gast_start11 = analyze_start11(extract_start11_area(gast_html))
-                
-                print(f"    🏠 Heim: {len(heim_start11)} Spieler")
-                print(f"    ✈️ Gast: {len(gast_start11)} Spieler")
-                
-                if heim_start11 and gast_start11:
-                    # Bestimme Zuordnung aus URL
-                    is_home_first = f"{home_slug}-{away_slug}" in url
-                    print(f"    ✅ Aufstellung erfolgreich geparst! (Home-First: {is_home_first})")
-                    # Prüfe ob Positionen zugeordnet werden sollen (nicht für Bundesliga/2. Bundesliga/DFB-Pokal)
-                    assign_positions = liga_id not in [1, 2, 3]  # Nicht für 1. Bundesliga, 2. Bundesliga und DFB-Pokal
-                    if is_home_first:
-                        return (heim_start11, gast_start11, assign_positions)
-                    else:
-                        return (gast_start11, heim_start11, assign_positions)
-                else:
-                    print(f"    ⚠️ Aufstellungsseite gefunden, aber Parsing fehlgeschlagen (Heim: {len(heim_start11)}, Gast: {len(gast_start11)})")
-                # Wenn Parsing fehlschlägt, versuche nächste URL (aber nicht nächsten Spieltag!)
-    
-    # Phase 2: Teste ±1 Spieltag, wenn Phase 1 fehlgeschlagen ist (nur für normale Ligen)
+        candidates.append((1, fussballdaten_url(f"{league_path}/{season}/{round_value}/{home_slug}-{away_slug}/")))
+        candidates.append((1, fussballdaten_url(f"{league_path}/{season}/{round_value}/{away_slug}-{home_slug}/")))
+    
+    # Phase 2: ±1 Spieltag (nur für normale Ligen)
     # WICHTIG: ±1 ist okay, wenn das Match nicht auf dem erwarteten Spieltag gefunden wird
-    fallback_matchdays = []
-    if not is_international and liga_id != 3 and matchday:
+    if liga_id != 3 and matchday:
+        fallback_matchdays = []
         try:
             base_matchday = int(matchday) if isinstance(matchday, (int, str)) else 1
-            # Teste ±1 (base-1, base+1) - aber nur wenn Phase 1 fehlgeschlagen ist
             if base_matchday - 1 >= 1 and str(base_matchday - 1) not in first_rounds_to_test:
                 fallback_matchdays.append(str(base_matchday - 1))
             if base_matchday + 1 < 35 and str(base_matchday + 1) not in first_rounds_to_test:
@@ -645,52 +641,282 @@ def scrape_lineup_for_match(league_path: str, season: str, phase: str, matchday:
         except:
             fallback_matchdays = []
         
-        if fallback_matchdays:
-            print(f"    ⚠️ Phase 1 fehlgeschlagen, teste jetzt ±1 Spieltag: {fallback_matchdays}")
-            for round_value in fallback_matchdays:
-                urls = [
-                    f"https://www.fussballdaten.de/{league_path}/{season}/{round_value}/{home_slug}-{away_slug}/",
-                    f"https://www.fussballdaten.de/{league_path}/{season}/{round_value}/{away_slug}-{home_slug}/"
-                ]
-                
-                for url in urls:
-                    html = fetch_html(url)
-                    
-                    if html and "heim-content" in html and "gast-content" in html:
-                        print(f"    ✅ Aufstellungsseite gefunden (Phase 2): {url}")
-                        
-                        heim_html = extract_team_html(html, "heim-content")
-                        gast_html = extract_team_html(html, "gast-content")
-                        
-                        heim_start11 = analyze_start11(extract_start11_area(heim_html))
-                        gast_start11 = analyze_start11(extract_start11_area(gast_html))
-                        
-                        print(f"    🏠 Heim: {len(heim_start11)} Spieler")
-                        print(f"    ✈️ Gast: {len(gast_start11)} Spieler")
-                        
-                        if heim_start11 and gast_start11:
-                            # Sofort abbrechen wenn gefunden!
-                            is_home_first = f"{home_slug}-{away_slug}" in url
-                            # Prüfe ob Positionen zugeordnet werden sollen (nicht für Bundesliga/2. Bundesliga/DFB-Pokal)
-                            assign_positions = liga_id not in [1, 2, 3]  # Nicht für 1. Bundesliga, 2. Bundesliga und DFB-Pokal
-                            if is_home_first:
-                                return (heim_start11, gast_start11, assign_positions)
-                            else:
-                                return (gast_start11, heim_start11, assign_positions)
-    
-    # Beide Phasen fehlgeschlagen
-    total_tested = len(first_rounds_to_test) + len(fallback_matchdays)
+        for round_value in fallback_matchdays:
+            candidates.append((2, fussballdaten_url(f"{league_path}/{season}/{round_value}/{home_slug}-{away_slug}/")))
+            candidates.append((2, fussballdaten_url(f"{league_path}/{season}/{round_value}/{away_slug}-{home_slug}/")))
+    
+    return candidates
+
+def parse_lineup_page(html: Optional[str], url: str, home_slug: str, away_slug: str, liga_id: int = 1) -> Optional[Tuple[List[str], List[str], bool]]:
+    """Parst eine Aufstellungsseite. Gibt (Heim-Start11, Gast-Start11, Positionen zuordnen) oder None zurück"""
+    if not html:
+        print(f"    ⚠️ HTML ist None/leer für {url}")
+        return None
+    
+    if "heim-content" not in html or "gast-content" not in html:
+        print(f"    ⚠️ HTML hat keine heim-content/gast-content (Länge: {len(html)})")
+        # Prüfe ob es eine 404 oder andere Fehlerseite ist
+        if "404" in html or "nicht gefunden" in html.lower():
+            print(f"    ❌ 404-Fehler für {url}")
+        return None
+    
+    print(f"    ✅ Aufstellungsseite gefunden: {url}")
+    
+    heim_html = extract_team_html(html, "heim-content")
+    gast_html = extract_team_html(html, "gast-content")
+    
+    heim_start11 = analyze_start11(extract_start11_area(heim_html))
+    gast_start11 = analyze_start11(extract_start11_area(gast_html))
+    
+    print(f"    🏠 Heim: {len(heim_start11)} Spieler")
+    print(f"    ✈️ Gast: {len(gast_start11)} Spieler")
+    
+    if not heim_start11 or not gast_start11:
+        # Wenn Parsing fehlschlägt, wird die nächste URL getestet
+        print(f"    ⚠️ Aufstellungsseite gefunden, aber Parsing fehlgeschlagen (Heim: {len(heim_start11)}, Gast: {len(gast_start11)})")
+        return None
+    
+    # Bestimme Zuordnung aus URL
+    is_home_first = f"{home_slug}-{away_slug}" in url
+    print(f"    ✅ Aufstellung erfolgreich geparst! (Home-First: {is_home_first})")
+    # Prüfe ob Positionen zugeordnet werden sollen (nicht für Bundesliga/2. Bundesliga/DFB-Pokal)
+    assign_positions = liga_id not in [1, 2, 3]  # Nicht für 1. Bundesliga, 2. Bundesliga und DFB-Pokal
+    if is_home_first:
+        return (heim_start11, gast_start11, assign_positions)
+    else:
+        return (gast_start11, heim_start11, assign_positions)
+
+def lookup_team_slug(team_name: str, league_path: str, liga_id: int = 1, is_international: bool = False, guessed_slug: Optional[str] = None) -> str:
+    """Slug für ein Team: zuerst aus dem Slug-Index (echte Links der Übersichten), sonst geraten
+
+    Gegen eine gepflegte Zuordnung (team_slug_converter) gewinnen nur exakte und Kern-Namen-Treffer,
+    unscharfe Treffer nur bei Teams ohne gepflegten Slug.
+    guessed_slug: bereits geratener Slug (league_slug_resolver), sonst wird er hier ermittelt.
+    """
+    if guessed_slug is None:
+        guessed_slug = convert_team_to_slug(team_name, liga_id, is_international)
+    learned_slug = None
+    if SLUG_INDEX is not None:
+        learned_slug = SLUG_INDEX.lookup(team_name, league_path, fuzzy=not has_curated_team_slug(team_name, liga_id, is_international))
+    if learned_slug and learned_slug != guessed_slug:
+        print(f"    🧭 Gelernter Slug für '{team_name}': '{learned_slug}' (statt '{guessed_slug}')")
+    return learned_slug or guessed_slug
+
+def league_slug_resolver(records: Iterable[MatchRecord], league_path: str, liga_id: int = 1, is_international: bool = False) -> Callable[[str], str]:
+    """Resolver für resolve_slugs: rät die Slugs aller Team-Namen der Liga auf einmal (convert_teams_to_slugs),
+    gelernte Slugs aus den Übersichten gewinnen wie in lookup_team_slug"""
+    team_names = {team for record in records for team in (record.home_team, record.away_team)}
+    guessed_slugs = convert_teams_to_slugs(team_names, liga_id, is_international)
+    return lambda team: lookup_team_slug(team, league_path, liga_id, is_international, guessed_slugs.get(team))
+
+def prepare_lineup_probe(league_path: str, season: str, phase: str, matchday: Optional[Union[int, str]], home_team: str, away_team: str, is_international: bool = False, liga_id: int = 1, kickoff_epoch: Optional[float] = None, slugs: Optional[Tuple[str, str]] = None) -> Optional[Tuple[str, str, List[Tuple[int, str]], bool]]:
+    """Ermittelt Team-Slugs und Kandidaten-URLs für ein Spiel. Gibt (home_slug, away_slug, Kandidaten, bekannte URL) oder None zurück
+
+    slugs: bereits aufgelöste Team-Slugs (MatchRecord), sonst werden sie hier ermittelt.
+    Ist die Detail-URL des Spiels aus den Übersichten bekannt (Spiel-URL-Index), wird nur sie getestet.
+    Bekannte tote URLs (Negativ-Cache, TTL nach Anpfiff-Nähe, kickoff_epoch = Anpfiff in UTC) werden nicht mehr getestet.
+    Die bekannte Detail-URL ist die richtige URL des Spiels und umgeht den Negativ-Cache.
+    """
+    # Erstelle Team-Slugs: gelernte Slugs aus den Übersichten, sonst die Konvertierungs-Logik
+    if slugs and all(slugs):
+        home_slug, away_slug = slugs
+    else:
+        home_slug = lookup_team_slug(home_team, league_path, liga_id, is_international)
+        away_slug = lookup_team_slug(away_team, league_path, liga_id, is_international)
+    
+    print(f"    🔍 Team-Slugs: '{home_team}' → '{home_slug}', '{away_team}' → '{away_slug}'")
+    print(f"    📋 Spieltag: {matchday}, Phase: {phase}, Liga-ID: {liga_id}, International: {is_international}")
+    
+    if not home_slug or not away_slug:
+        print(f"    ❌ Konnte Team-Slugs nicht erstellen: {home_team} → {home_slug}, {away_team} → {away_slug}")
+        return None
+    
+    known_match = None
+    if MATCH_URL_INDEX is not None:
+        known_match = MATCH_URL_INDEX.lookup(league_path, season, home_slug, away_slug, home_team, away_team, matchday)
+    if known_match:
+        path, home_slug, away_slug = known_match
+        print(f"    🎯 Detail-URL aus Übersicht bekannt: /{path}")
+        candidates = [(1, fussballdaten_url(path))]
+    else:
+        candidates = build_lineup_url_candidates(league_path, season, phase, matchday, home_slug, away_slug, is_international, liga_id)
+    if PROBE_CACHE is not None and not known_match:
+        candidates = PROBE_CACHE.filter_candidates(candidates, kickoff_epoch)
+    return home_slug, away_slug, candidates, bool(known_match)
+
+def remember_probe_result(url: str, status_code: Optional[int], html: Optional[str], found: bool, known_url: bool = False):
+    """Aktualisiert den Negativ-Cache nach einem Test einer Aufstellungs-URL (bekannte Detail-URLs werden nie gemerkt)"""
+    if PROBE_CACHE is None or known_url:
+        return
+    if found:
+        PROBE_CACHE.forget(url)
+        return
+    reason = dead_probe_reason(status_code, html)
+    if reason:
+        PROBE_CACHE.record(url, reason)
+
+def report_lineup_not_found(candidates: List[Tuple[int, str]], home_slug: str, away_slug: str, matchday, phase: str):
+    """Gibt Diagnose aus, wenn keine Aufstellung gefunden wurde"""
+    # Pro Spieltag/Runde werden zwei URLs getestet (beide Team-Reihenfolgen, bei bekannter Detail-URL nur eine)
+    phase1_count = (sum(1 for lineup_phase, _ in candidates if lineup_phase == 1) + 1) // 2
+    phase2_count = (sum(1 for lineup_phase, _ in candidates if lineup_phase == 2) + 1) // 2
     print(f"    ❌ FEHLER: Keine Aufstellung gefunden!")
-    print(f"    📊 Getestet: {total_tested} Spieltage/Runden")
-    print(f"    📋 Phase 1: {len(first_rounds_to_test)} Spieltage/Runden")
-    if fallback_matchdays:
-        print(f"    📋 Phase 2: {len(fallback_matchdays)} Spieltage/Runden")
+    print(f"    📊 Getestet: {phase1_count + phase2_count} Spieltage/Runden")
+    print(f"    📋 Phase 1: {phase1_count} Spieltage/Runden")
+    if phase2_count:
+        print(f"    📋 Phase 2: {phase2_count} Spieltage/Runden")
     print(f"    🏠 Team-Slugs: {home_slug} vs {away_slug}")
     print(f"    📅 Matchday: {matchday}, Phase: {phase}")
+
+def scrape_lineup_for_match(league_path: str, season: str, phase: str, matchday: Optional[int], home_team: str, away_team: str, is_international: bool = False, liga_id: int = 1, kickoff_epoch: Optional[float] = None, slugs: Optional[Tuple[str, str]] = None) -> Optional[Tuple[List[str], List[str], bool]]:
+    """Scrapt Aufstellung für ein einzelnes Spiel - testet zuerst den erwarteten Spieltag, dann ±1"""
+    probe = prepare_lineup_probe(league_path, season, phase, matchday, home_team, away_team, is_international, liga_id, kickoff_epoch, slugs)
+    if not probe:
+        return None
+    home_slug, away_slug, candidates, known_url = probe
+    
+    current_phase = 0
+    for lineup_phase, url in candidates:
+        if lineup_phase != current_phase:
+            current_phase = lineup_phase
+            if lineup_phase == 1:
+                print(f"    📅 Phase 1: Teste erwarteten Spieltag/Runde")
+            else:
+                print(f"    ⚠️ Phase 1 fehlgeschlagen, teste jetzt ±1 Spieltag")
+        print(f"    🌐 Teste URL: {url}")
+        status_code, html = fetch_html_with_status(url)
+        # STEP 2: Sofort abbrechen wenn gefunden (keine weiteren Tests!)
+        lineup = parse_lineup_page(html, url, home_slug, away_slug, liga_id)
+        remember_probe_result(url, status_code, html, bool(lineup), known_url)
+        if lineup:
+            return lineup
+    
+    # Alle Phasen fehlgeschlagen
+    report_lineup_not_found(candidates, home_slug, away_slug, matchday, phase)
     return None
 
-def load_matches_from_json(file_path: str) -> List[Dict]:
-    """Lädt Matches aus JSON-Datei"""
+async def fetch_html_async(fetcher, url: str) -> Optional[str]:
+    """Asynchrone Variante von fetch_html (über async_fetch.AsyncFetcher)"""
+    return (await fetch_html_with_status_async(fetcher, url))[1]
+
+async def fetch_html_with_status_async(fetcher, url: str) -> Tuple[Optional[int], Optional[str]]:
+    """Asynchrone Variante von fetch_html_with_status"""
+    try:
+        response = await fetcher.get(url)
+        if response.status_code == 200:
+            return response.status_code, response.text
+        else:
+            print(f"  ⚠️ HTTP {response.status_code} für {url}")
+            return response.status_code, None
+    except Exception as e:
+        print(f"  ❌ Fehler beim Laden von {url}: {e}")
+        return None, None
+
+async def scrape_lineup_for_match_async(fetcher, league_path: str, season: str, phase: str, matchday: Optional[int], home_team: str, away_team: str, is_international: bool = False, liga_id: int = 1, kickoff_epoch: Optional[float] = None, slugs: Optional[Tuple[str, str]] = None) -> Optional[Tuple[List[str], List[str], bool]]:
+    """Asynchrone Variante von scrape_lineup_for_match - gleiche URLs in gleicher Reihenfolge, gleiches Ergebnis"""
+    probe = prepare_lineup_probe(league_path, season, phase, matchday, home_team, away_team, is_international, liga_id, kickoff_epoch, slugs)
+    if not probe:
+        return None
+    home_slug, away_slug, candidates, known_url = probe
+    
+    for lineup_phase, url in candidates:
+        status_code, html = await fetch_html_with_status_async(fetcher, url)
+        lineup = parse_lineup_page(html, url, home_slug, away_slug, liga_id)
+        remember_probe_result(url, status_code, html, bool(lineup), known_url)
+        if lineup:
+            return lineup
+    
+    report_lineup_not_found(candidates, home_slug, away_slug, matchday, phase)
+    return None
+
+def scrape_lineups_async(jobs: List[Tuple], host_concurrency: Optional[int] = None, on_result: Optional[Callable[[int, Optional[Tuple[List[str], List[str], bool]]], None]] = None) -> List[Optional[Tuple[List[str], List[str], bool]]]:
+    """
+    Scrapt mehrere Aufstellungen gleichzeitig.
+    jobs: Liste von Argument-Tupeln für scrape_lineup_for_match (ohne fetcher).
+    Ergebnisse kommen in der Reihenfolge der jobs zurück.
+    on_result(index, Ergebnis): wird aufgerufen, sobald ein Spiel fertig ist (z.B. für Checkpoints)
+    Die Spiele werden in Job-Reihenfolge begonnen (höchstens host_concurrency gleichzeitig, so viele
+    Requests laufen pro Host ohnehin parallel). Ist das Run-Budget erschöpft, wird kein weiteres Spiel
+    begonnen: Ergebnis None, on_result wird für diese Spiele nicht aufgerufen.
+    """
+    from async_fetch import AsyncFetcher, DEFAULT_HOST_CONCURRENCY
+    concurrency = host_concurrency or DEFAULT_HOST_CONCURRENCY
+    
+    async def run_one(fetcher, slots: asyncio.Semaphore, index: int, job: Tuple):
+        async with slots:
+            if RUN_BUDGET.exhausted():
+                return None
+            result = await scrape_lineup_for_match_async(fetcher, *job)
+        if on_result is not None:
+            on_result(index, result)
+        return result
+    
+    async def run_all():
+        async with AsyncFetcher(concurrency) as fetcher:
+            slots = asyncio.Semaphore(max(1, concurrency))
+            return await asyncio.gather(*(run_one(fetcher, slots, index, job) for index, job in enumerate(jobs)))
+    
+    return asyncio.run(run_all())
+
+def build_lineup_entry(home_team: str, away_team: str, date_time: str, matchday, phase: str, lineup: Tuple[List[str], List[str], bool]) -> Dict:
+    """Erstellt den Eintrag für lineups_*.json aus dem Ergebnis von scrape_lineup_for_match"""
+    home_players, away_players, assign_positions = lineup
+    
+    # Ordne Positionen zu, wenn nicht Bundesliga/2. Bundesliga/DFB-Pokal
+    if assign_positions:
+        home_lineup_with_positions = assign_positions_by_order(home_players)
+        away_lineup_with_positions = assign_positions_by_order(away_players)
+        # Prüfe ob alle Positionen zugeordnet wurden
+        home_positions_count = len([p for p in home_lineup_with_positions if p.get('position')])
+        away_positions_count = len([p for p in away_lineup_with_positions if p.get('position')])
+        print(f"  📍 Positionen zugeordnet: Heim {home_positions_count}/{len(home_players)}, Auswärts {away_positions_count}/{len(away_players)}")
+    else:
+        # Für Bundesliga/2. Bundesliga/DFB-Pokal: Nur Namen (wie bisher, einfache Liste)
+        home_lineup_with_positions = home_players
+        away_lineup_with_positions = away_players
+    
+    return {
+        "homeTeam": home_team,
+        "awayTeam": away_team,
+        "dateTime": date_time,
+        "matchday": matchday,
+        "phase": phase,
+        "homeLineup": home_lineup_with_positions,
+        "awayLineup": away_lineup_with_positions
+    }
+
+# Liga-Name (Dateiname) → (fussballdaten.de-Pfad, international, Liga-ID)
+LEAGUE_CONFIGS = {
+    "bundesliga": ("bundesliga", False, 1),
+    "2bundesliga": ("2liga", False, 2),
+    "dfbpokal": ("dfb-pokal", False, 3),
+    "championsleague": ("championsleague", True, 11),
+    "europaleague": ("europaleague", True, 12),
+    "conferenceleague": ("conferenceleague", True, 13),
+    "england": ("england", False, 51),
+    "spain": ("spanien", False, 41),
+    "italy": ("italien", False, 31),
+    "france": ("frankreich", False, 21),
+}
+
+def load_matches_from_json(file_path: str, league_name: Optional[str] = None) -> List[MatchRecord]:
+    """Lädt Matches aus JSON-Datei als MatchRecords (mit Team-Slugs, wenn die Liga bekannt ist)"""
+    return load_match_records(file_path, league_name)[0]
+
+def load_match_records(file_path: str, league_name: Optional[str] = None, with_slugs: bool = True) -> Tuple[List[MatchRecord], Optional[str]]:
+    """Lädt eine Match-Datei einmal und übersetzt jedes Spiel in einen MatchRecord. Gibt (Records, lastUpdated) zurück
+
+    with_slugs=False: Team-Slugs nicht auflösen (der Aufrufer löst sie nur für die ausgewählten Spiele auf)
+    """
+    matches, last_updated = load_match_file(file_path)
+    league_path, is_international, liga_id = LEAGUE_CONFIGS.get(league_name, (league_name, False, 1))
+    records = build_match_records(matches, liga_id)
+    if league_name and with_slugs:
+        resolve_slugs(records, league_slug_resolver(records, league_path, liga_id, is_international))
+    return records, last_updated
+
+def load_match_file(file_path: str) -> Tuple[List[Dict], Optional[str]]:
+    """Lädt Matches und lastUpdated (nur im Format von scrape_matches.py vorhanden) aus JSON-Datei"""
     # Stelle sicher, dass der Pfad korrekt ist
     if not os.path.isabs(file_path) and os.path.basename(os.getcwd()) == 'scraper':
         # Wenn wir im scraper/ Verzeichnis sind und der Pfad relativ ist, gehe nach oben
@@ -701,17 +927,61 @@ def load_matches_from_json(file_path: str) -> List[Dict]:
         with open(file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
             if isinstance(data, dict) and 'matches' in data:
-                return data['matches']
+                return data['matches'], data.get('lastUpdated')
             elif isinstance(data, list):
-                return data
+                return data, None
             else:
-                return []
+                return [], None
     except Exception as e:
         print(f"❌ Fehler beim Laden von {file_path}: {e}")
-        return []
+        return [], None
+
+class LeagueLineupPlan:
+    """Die in einem Lauf zu testenden Spiele einer Liga (plan_league_lineups) und ihre Ergebnisse
 
-def scrape_lineups_for_league(league_name: str, season: str, data_dir: str = 'data/matches') -> Dict:
-    """Scrapt Aufstellungen für alle Spiele einer Liga"""
+    jobs: (home_team, away_team, date_time, matchday, phase, Argumente für scrape_lineup_for_match, Spiel-Identität, Dringlichkeit)
+    pending: Indizes der noch zu ladenden Jobs, dringendste zuerst (Jobs aus dem Journal fehlen)
+    done: Indizes mit Ergebnis in results (geladen oder aus dem Journal)
+    """
+
+    def __init__(self, league_name: str, season: str, store: LineupStore, journal: Optional[LineupJournal] = None, pages: Optional[PageStore] = None):
+        self.league_name = league_name
+        self.season = season
+        self.store = store
+        self.journal = journal
+        self.pages = pages
+        self.jobs: List[Tuple] = []
+        self.results: List = []
+        self.pending: List[int] = []
+        self.done = set()
+        self.skipped_complete = 0
+
+    def start(self):
+        """Übernimmt Ergebnisse aus dem Journal und sortiert die übrigen Jobs nach Dringlichkeit"""
+        self.results = [self.journal.get(job[6]) for job in self.jobs]
+        self.pending = sorted((index for index, job in enumerate(self.jobs) if job[6] not in self.journal), key=lambda index: self.jobs[index][7])
+        self.done = set(range(len(self.jobs))) - set(self.pending)
+        if self.done:
+            print(f"♻️ {len(self.done)} Spiele aus dem Journal übernommen (--resume)")
+
+    def checkpoint(self, index: int, lineup):
+        self.results[index] = lineup
+        self.done.add(index)
+        self.journal.record(self.jobs[index][6], lineup)
+
+def probe_priority(kickoff_epoch: Optional[float], live: bool, has_lineup: bool, now: float) -> Tuple[int, bool, float]:
+    """Dringlichkeit eines Aufstellungs-Tests (kleiner = zuerst): Wert nach Anpfiff (work_priority), Spiele ohne gespeicherte Aufstellung vor solchen mit"""
+    tier, value = work_priority(kickoff_epoch, live, now)
+    return tier, has_lineup, value
+
+def plan_league_lineups(league_name: str, season: str, data_dir: str = 'data/matches', full: bool = False,
+                        resume: bool = False, checkpoint_every: Optional[int] = None) -> LeagueLineupPlan:
+    """Lädt die Match-Datei einer Liga, plant die Spieltage und wählt die zu testenden Spiele aus
+
+    full: auch Spiele mit bereits vollständig gespeicherter Aufstellung neu laden
+    resume: Ergebnisse aus dem Journal eines abgebrochenen Laufs übernehmen (siehe lineup_journal)
+    checkpoint_every: Journal nach so vielen Spielen schreiben (0 = kein Journal)
+    """
     # WICHTIG: Deutsche Ligen verwenden leeren season-String für Dateinamen
     display_season = season if season else "aktuell"
     print(f"\n{'='*60}")
@@ -726,383 +996,237 @@ def scrape_lineups_for_league(league_name: str, season: str, data_dir: str = 'da
     # Lade Matches
     # WICHTIG: ALLE Ligen verwenden jetzt Dateinamen OHNE Saison
     match_file = os.path.join(data_dir, f"matches_{league_name}.json")
+    # Gespeicherte Aufstellungen (Spiel-Identität → Eintrag); die Datei wird fortgeschrieben, nicht ersetzt
+    # (Einträge einer anderen Saison werden dabei verworfen)
+    store = LineupStore(league_name, season=get_scraping_season(league_name))
     if not os.path.exists(match_file):
         print(f"⚠️ Match-Datei nicht gefunden: {match_file}")
-        return {"league": league_name, "season": season if season else get_current_season(), "lineups": []}
-    
-    matches = load_matches_from_json(match_file)
-    print(f"📊 Gefundene Spiele: {len(matches)}")
+        return LeagueLineupPlan(league_name, season if season else get_current_season(), store)
     
     # Bestimme League-Path, ob international und Liga-ID
-    league_configs = {
-        "bundesliga": ("bundesliga", False, 1),
-        "2bundesliga": ("2liga", False, 2),
-        "dfbpokal": ("dfb-pokal", False, 3),
-        "championsleague": ("championsleague", True, 11),
-        "europaleague": ("europaleague", True, 12),
-        "conferenceleague": ("conferenceleague", True, 13),
-        "england": ("england", False, 51),
-        "spain": ("spanien", False, 41),
-        "italy": ("italien", False, 31),
-        "france": ("frankreich", False, 21),
-    }
+    league_path, is_international, liga_id = LEAGUE_CONFIGS.get(league_name, (league_name, False, 1))
     
-    league_path, is_international, liga_id = league_configs.get(league_name, (league_name, False, 1))
+    # Jedes Spiel wird einmal in einen MatchRecord übersetzt (Teams, Spieltag, Phase, Anpfiff);
+    # Slugs nur für die ausgewählten Spiele (siehe unten)
+    matches, last_updated = load_match_records(match_file, league_name, with_slugs=False)
+    print(f"📊 Gefundene Spiele: {len(matches)}")
     
     # WICHTIG: Für Scraping-URLs (fussballdaten.de) verwende Saison +1
     # ALLE Ligen: season ist leer für Dateinamen, aber für Scraping-URLs brauchen wir die aktuelle Saison
-    if league_name in ["bundesliga", "2bundesliga", "dfbpokal"]:
-        # Deutsche Ligen: Hole aktuelle Saison für Scraping-URLs
-        scraping_season = get_current_season()
-        # WICHTIG: Alle deutschen Ligen verwenden die aktuelle Saison für Scraping-URLs (kein +1 mehr)
-        print(f"   ℹ️ Match-Datei: matches_{league_name}.json, Scraping Saison: {scraping_season}")
-    elif league_name in ["championsleague", "europaleague", "conferenceleague"]:
-        # Internationale Ligen: Verwende internationale Saison für Scraping-URLs
-        scraping_season = get_international_season()
-        print(f"   ℹ️ Match-Datei: matches_{league_name}.json, Scraping Saison: {scraping_season}")
-    else:
-        # Andere Ligen (england, spain, italy, france): Verwende aktuelle Saison für Scraping-URLs
-        scraping_season = get_current_season()
-        print(f"   ℹ️ Match-Datei: matches_{league_name}.json, Scraping Saison: {scraping_season}")
+    scraping_season = get_scraping_season(league_name)
+    print(f"   ℹ️ Match-Datei: matches_{league_name}.json, Scraping Saison: {scraping_season}")
+    
+    # Checkpoints: Ergebnisse jedes bearbeiteten Spiels (mit resume die des abgebrochenen Laufs)
+    journal = LineupJournal(league_name, scraping_season, resume, checkpoint_every)
+    if journal.resumed:
+        print(f"   ♻️ Journal gefunden: {journal.resumed} Spiele mit vollständiger Aufstellung")
+    
+    # Seiten-Speicher für diesen Lauf: Jede Spieltags-Übersicht wird nur einmal geladen und ausgewertet,
+    # auch wenn find_matchdays_to_scrape/find_current_matchday/find_matchday_for_match sie mehrfach brauchen
+    pages = PageStore(fetch_html)
+    plan = LeagueLineupPlan(league_name, season, store, journal, pages)
     
     # WICHTIG: Finde alle Spieltage innerhalb 7 Tage + Nachholspiele
     # Für internationale Ligen: Verwende alte Logik (find_current_matchday)
     if is_international:
         print(f"\n🔍 Suche aktuellen Spieltag (Internationale Liga)...")
-        current_matchday = find_current_matchday(league_path, scraping_season, is_international, liga_id)
+        current_matchday = find_current_matchday(league_path, scraping_season, is_international, liga_id, pages, matches)
         spieltage_zum_scrapen = [current_matchday] if current_matchday else []
         if current_matchday:
             print(f"✅ Aktueller Spieltag: {current_matchday}")
         else:
             print(f"⚠️ Kein aktueller Spieltag gefunden")
     else:
-        # Normale Ligen: Verwende neue 7-Tage-Logik
-        spieltage_zum_scrapen = find_matchdays_to_scrape(league_path, scraping_season, is_international, liga_id)
+        # Normale Ligen: Verwende neue 7-Tage-Logik - zuerst aus der Match-Datei, nur bei veralteten Daten per HTTP
+        spieltage_zum_scrapen = plan_matchdays_from_matches(matches, liga_id, pages.now, last_updated)
+        if spieltage_zum_scrapen is None:
+            spieltage_zum_scrapen = find_matchdays_to_scrape(league_path, scraping_season, is_international, liga_id, pages)
         if not spieltage_zum_scrapen:
             print(f"⚠️ Keine Spieltage zum Scrapen gefunden")
     
-    # Filtere Matches nach gefundenen Spieltagen (kann mehrere sein!)
-    filtered_matches = []
-    original_matches = matches.copy()  # Speichere Original-Matches für Fallback
-    
-    if spieltage_zum_scrapen:
+    # Ein Durchlauf über die Records: filtern, Spieltag sichern, Slugs auflösen, Vorschau und Jobs bauen.
+    # Die Slugs werden erst hier aufgelöst, damit die Übersichten der Planung (Slug-Index) schon berücksichtigt sind.
+    planned = set(spieltage_zum_scrapen or [])
+    # International: (phase, matchday) Tupel; DFB-Pokal: Runden-Namen; normale Ligen: Integers
+    plan_key = (lambda match: (match.phase, match.matchday)) if is_international else (lambda match: match.matchday)
+    if planned and matches and not any(plan_key(match) in planned for match in matches):
+        # Die Nummerierung der Match-Datei passt nicht zum Plan (DFB-Runden-Slugs, OpenLigaDB-Gruppen,
+        # internationale Phasen) → wie ohne Plan alle Matches verwenden (needs_scrape filtert weiterhin)
+        print(f"⚠️ WARNUNG: Keine Matches zu Spieltagen {spieltage_zum_scrapen} in der Match-Datei, verwende alle {len(matches)} Matches")
+        planned = set()
+    elif planned:
         print(f"   🔍 Filtere Matches für Spieltage: {spieltage_zum_scrapen}...")
-        matchday_counts = {}  # Debug: Zähle Matchdays
-        for match in matches:
-            # Extrahiere Matchday aus Match
-            team1 = match.get('Team1') or match.get('team1') or {}
-            team2 = match.get('Team2') or match.get('team2') or {}
-            
-            # Initialisiere Variablen
-            matchday = None
-            phase = ''
-            
-            if isinstance(team1, dict) and isinstance(team2, dict):
-                # OpenLigaDB Format: Prüfe verschiedene mögliche Felder für Matchday
-                # WICHTIG: OpenLigaDB verwendet 'group' (kleingeschrieben), nicht 'Group'!
-                
-                # Versuche group.groupOrderID (für OpenLigaDB - kleingeschrieben!)
-                group_obj = match.get('group') or match.get('Group')
-                if group_obj and isinstance(group_obj, dict):
-                    matchday = group_obj.get('groupOrderID') or group_obj.get('GroupOrderID')
-                    phase = group_obj.get('groupName') or group_obj.get('GroupName') or ''
-                
-                # Versuche direktes Matchday-Feld (verschiedene Schreibweisen)
-                if not matchday:
-                    matchday = (match.get('Matchday') or match.get('matchday') or 
-                               match.get('MatchDay') or match.get('matchDay') or
-                               match.get('GroupOrderID') or match.get('groupOrderID'))
-                
-                # Versuche aus League-Objekt
-                if not matchday:
-                    league_obj = match.get('League') or match.get('league')
-                    if league_obj and isinstance(league_obj, dict):
-                        matchday = league_obj.get('GroupOrderID') or league_obj.get('groupOrderID')
-                
-                # Phase extrahieren (falls noch nicht gesetzt)
-                if not phase:
-                    group_obj = match.get('group') or match.get('Group')
-                    if group_obj and isinstance(group_obj, dict):
-                        phase = group_obj.get('groupName') or group_obj.get('GroupName') or ''
-                    if not phase:
-                        phase = match.get('phase', '')
-                
-                # DEBUG: Zeige Match-Struktur beim ersten Match
-                if len(matchday_counts) == 0:
-                    print(f"   🔍 DEBUG: Erster Match Keys: {list(match.keys())[:15]}")
-                    group_obj = match.get('group') or match.get('Group')
-                    if group_obj:
-                        print(f"   🔍 DEBUG: group Keys: {list(group_obj.keys()) if isinstance(group_obj, dict) else 'N/A'}")
-                    league_obj = match.get('League') or match.get('league')
-                    if league_obj:
-                        print(f"   🔍 DEBUG: League Keys: {list(league_obj.keys()) if isinstance(league_obj, dict) else 'N/A'}")
-            else:
-                matchday = match.get('matchday', None)
-                phase = match.get('phase', '')
-            
-            # Debug: Zähle Matchdays
-            matchday_key = str(matchday) if matchday is not None else 'None'
-            matchday_counts[matchday_key] = matchday_counts.get(matchday_key, 0) + 1
-            
-            # Prüfe ob Match zu einem der gewünschten Spieltage gehört
-            if is_international:
-                # International: spieltage_zum_scrapen enthält (phase, matchday) Tupel
-                for spieltag in spieltage_zum_scrapen:
-                    if isinstance(spieltag, tuple):
-                        target_phase, target_matchday_num = spieltag
-                        if phase == target_phase and matchday == target_matchday_num:
-                            filtered_matches.append(match)
-                            break
-            elif liga_id == 3:
-                # DFB-Pokal: spieltage_zum_scrapen enthält Runden-Namen (Strings)
-                if matchday in spieltage_zum_scrapen:
-                    filtered_matches.append(match)
-            else:
-                # Normale Ligen: spieltage_zum_scrapen enthält Integers
-                # Konvertiere matchday zu Integer für Vergleich (kann String oder Integer sein)
-                try:
-                    matchday_int = int(matchday) if matchday is not None else None
-                    if matchday_int is not None and matchday_int in spieltage_zum_scrapen:
-                        filtered_matches.append(match)
-                except (ValueError, TypeError):
-                    # Wenn matchday nicht konvertierbar ist, überspringe dieses Match
-                    pass
-        
-        # Debug: Zeige Matchday-Verteilung
-        print(f"   📊 Matchday-Verteilung in Match-Datei: {dict(sorted(matchday_counts.items(), key=lambda x: int(x[0]) if x[0] != 'None' and x[0].isdigit() else 999))}")
-        
-        original_count = len(matches)
-        matches = filtered_matches
-        print(f"📊 Gefiltert: {len(matches)} Matches für Spieltage {spieltage_zum_scrapen} (von {original_count} total)")
-        
-        # WICHTIG: Wenn keine Matches gefiltert wurden, aber spieltage_zum_scrapen gefunden wurden,
-        # dann haben die Matches wahrscheinlich kein Matchday-Feld. In diesem Fall
-        # filtern wir die Matches, indem wir für jedes Match prüfen, ob es zu einem Spieltag gehört.
-        if len(matches) == 0 and original_count > 0:
-            print(f"⚠️ WARNUNG: Keine Matches mit Matchday-Feld gefunden!")
-            print(f"   → Prüfe für jedes Match, ob es zu Spieltagen {spieltage_zum_scrapen} gehört...")
-            filtered_by_matchday_check = []
-            for match in original_matches[:10]:  # Teste erstmal nur die ersten 10
-                # WICHTIG: Prüfe zuerst, ob homeTeam/awayTeam existieren (andere Formate)
-                if 'homeTeam' in match and 'awayTeam' in match:
-                    home_team = match.get('homeTeam', '')
-                    away_team = match.get('awayTeam', '')
-                else:
-                    # OpenLigaDB Format: Team1/Team2 sind Objekte mit TeamName
-                    team1 = match.get('Team1') or match.get('team1')
-                    team2 = match.get('Team2') or match.get('team2')
-                    if team1 and team2 and isinstance(team1, dict) and isinstance(team2, dict):
-                        home_team = (team1.get('TeamName') or team1.get('teamName') or 
-                                    team1.get('name') or team1.get('Name') or '')
-                        away_team = (team2.get('TeamName') or team2.get('teamName') or 
-                                    team2.get('name') or team2.get('Name') or '')
-                    else:
-                        home_team = (team1 if isinstance(team1, str) else '') or match.get('homeTeam', '')
-                        away_team = (team2 if isinstance(team2, str) else '') or match.get('awayTeam', '')
-                
-                if home_team and away_team:
-                    # Prüfe ob dieses Match zum aktuellen Spieltag gehört
-                    found_matchday = find_matchday_for_match(
-                        league_path, scraping_season, home_team, away_team, is_international, liga_id, '', spieltage_zum_scrapen
-                    )
-                    if found_matchday in spieltage_zum_scrapen:
-                        filtered_by_matchday_check.append(match)
-            
-            if len(filtered_by_matchday_check) > 0:
-                print(f"   ✅ {len(filtered_by_matchday_check)} Matches gefunden, die zu Spieltagen {spieltage_zum_scrapen} gehören")
-                print(f"   → Scrapte nur diese Matches (nicht alle {original_count})")
-                matches = filtered_by_matchday_check
-            else:
-                print(f"   ⚠️ Keine Matches zu Spieltagen {spieltage_zum_scrapen} gefunden, verwende alle {original_count} Matches")
-                matches = original_matches
     else:
         print(f"⚠️ Kein aktueller Spieltag gefunden, verwende alle {len(matches)} Matches")
     
-    # Zeige alle Matches zu Beginn aufgelistet
-    print(f"\n📋 Alle Matches die gescrappt werden sollen:")
-    print(f"{'='*60}")
-    parsed_matches_preview = []
-    for i, match in enumerate(matches, 1):
-        # Extrahiere Match-Info (gleiche Logik wie im Loop)
-        # WICHTIG: Prüfe zuerst, ob homeTeam/awayTeam existieren (andere Formate)
-        # Dann prüfe Team1/Team2 (OpenLigaDB Format)
-        if 'homeTeam' in match and 'awayTeam' in match:
-            # Andere Formate: Direkte Strings
-            home_team = match.get('homeTeam', '')
-            away_team = match.get('awayTeam', '')
-            matchday = match.get('matchday', None)
-            phase = match.get('phase', '')
-        else:
-            # OpenLigaDB Format: Team1/Team2 sind Objekte mit TeamName
-            team1 = match.get('Team1') or match.get('team1')
-            team2 = match.get('Team2') or match.get('team2')
-            
-            if team1 and team2 and isinstance(team1, dict) and isinstance(team2, dict):
-                home_team = (team1.get('TeamName') or team1.get('teamName') or 
-                            team1.get('name') or team1.get('Name') or '')
-                away_team = (team2.get('TeamName') or team2.get('teamName') or 
-                            team2.get('name') or team2.get('Name') or '')
-                matchday = None
-                if match.get('Group') and isinstance(match.get('Group'), dict):
-                    matchday = match.get('Group').get('GroupOrderID')
-                if not matchday:
-                    matchday = match.get('Matchday') or match.get('matchday')
-                phase = ''
-                if match.get('Group') and isinstance(match.get('Group'), dict):
-                    phase = match.get('Group').get('GroupName') or ''
-                if not phase:
-                    phase = match.get('phase', '')
-            else:
-                # Fallback: Versuche als Strings
-                home_team = (team1 if isinstance(team1, str) else '') or match.get('homeTeam', '')
-                away_team = (team2 if isinstance(team2, str) else '') or match.get('awayTeam', '')
-                matchday = match.get('matchday', None)
-                phase = match.get('phase', '')
-        
-        if home_team and away_team:
-            match_info = f"  [{i:3d}/{len(matches)}] {home_team} vs {away_team}"
-            if matchday:
-                match_info += f" (Spieltag: {matchday})"
-            if phase:
-                match_info += f" (Phase: {phase})"
-            parsed_matches_preview.append(match_info)
-    
-    # Zeige alle Matches (maximal 50, sonst zusammenfassen)
-    if len(parsed_matches_preview) <= 50:
-        for match_info in parsed_matches_preview:
-            print(match_info)
-    else:
-        # Zeige erste 25 und letzte 25
-        for match_info in parsed_matches_preview[:25]:
-            print(match_info)
-        print(f"  ... ({len(parsed_matches_preview) - 50} weitere Matches ausgelassen) ...")
-        for match_info in parsed_matches_preview[-25:]:
-            print(match_info)
-    
-    print(f"{'='*60}\n")
-    
-    lineups = []
-    successful = 0
-    failed = 0
-    failed_matches = []  # Sammle fehlgeschlagene Spiele für Analyse
-    
-    # Speichere ersten Spieltag für Fallback, wenn find_matchday_for_match fehlschlägt
+    # Fallback-Spieltag, wenn find_matchday_for_match für ein Spiel ohne Spieltag nichts findet
     saved_first_matchday = spieltage_zum_scrapen[0] if spieltage_zum_scrapen else None
+    slug_memo: Dict[str, str] = {}
+    slug_of = league_slug_resolver(matches, league_path, liga_id, is_international)
+    matchday_counts: Dict[str, int] = {}  # Debug: Zähle Matchdays
+    selected = 0
+    now_epoch = pages.now.timestamp()
+    parsed_matches_preview = []
     
-    for i, match in enumerate(matches, 1):
-        # WICHTIG: Prüfe zuerst, ob homeTeam/awayTeam existieren (andere Formate)
-        # Dann prüfe Team1/Team2 (OpenLigaDB Format)
-        if 'homeTeam' in match and 'awayTeam' in match:
-            # Andere Formate: Direkte Strings
-            home_team = match.get('homeTeam', '')
-            away_team = match.get('awayTeam', '')
-            date_time = match.get('dateTime', '')
-            matchday = match.get('matchday', None)
-            phase = match.get('phase', '')
-        else:
-            # OpenLigaDB Format: Team1/Team2 sind Objekte mit TeamName
-            team1 = match.get('Team1') or match.get('team1')
-            team2 = match.get('Team2') or match.get('team2')
-            
-            if team1 and team2 and isinstance(team1, dict) and isinstance(team2, dict):
-                # OpenLigaDB Format: Extrahiere TeamName aus Objekten
-                home_team = (team1.get('TeamName') or team1.get('teamName') or 
-                            team1.get('name') or team1.get('Name') or '')
-                away_team = (team2.get('TeamName') or team2.get('teamName') or 
-                            team2.get('name') or team2.get('Name') or '')
-                date_time = match.get('MatchDateTime') or match.get('matchDateTime') or match.get('dateTime', '')
-                
-                # OpenLigaDB: Spieltag kann in Group.GroupOrderID oder Matchday sein
-                matchday = None
-                if match.get('Group') and isinstance(match.get('Group'), dict):
-                    matchday = match.get('Group').get('GroupOrderID')
-                if not matchday:
-                    matchday = match.get('Matchday') or match.get('matchday')
-                
-                # Phase für DFB-Pokal (z.B. "achtelfinale", "viertelfinale")
-                phase = ''
-                if match.get('Group') and isinstance(match.get('Group'), dict):
-                    phase = match.get('Group').get('GroupName') or ''
-                if not phase:
-                    phase = match.get('phase', '')
-            else:
-                # Fallback: Versuche als Strings
-                home_team = (team1 if isinstance(team1, str) else '') or match.get('homeTeam', '')
-                away_team = (team2 if isinstance(team2, str) else '') or match.get('awayTeam', '')
-                date_time = match.get('dateTime', '')
-                matchday = match.get('matchday', None)
-                phase = match.get('phase', '')
-        
-        print(f"\n[{i}/{len(matches)}] {home_team} vs {away_team}")
+    for match in matches:
+        home_team, away_team, date_time, matchday, phase = match.fields()
+        matchday_key = str(matchday) if matchday is not None else 'None'
+        matchday_counts[matchday_key] = matchday_counts.get(matchday_key, 0) + 1
         
-        # STEP 1: Finde den richtigen Spieltag, NUR wenn nicht vorhanden oder unsicher
-        # WICHTIG: Wenn matchday bereits vorhanden und > 1, verwende ihn direkt (nicht neu suchen!)
-        if not matchday:
-            print(f"    🔍 Suche richtigen Spieltag...")
-            found_matchday = find_matchday_for_match(
-                league_path, scraping_season, home_team, away_team, is_international, liga_id, phase, spieltage_zum_scrapen
-            )
-            if found_matchday:
-                matchday = found_matchday
-                print(f"    ✅ Spieltag gefunden: {matchday}")
-            else:
-                # Fallback: Wenn kein Spieltag gefunden wurde, aber wir bereits einen saved_first_matchday haben, verwende diesen
-                if saved_first_matchday:
-                    matchday = saved_first_matchday
-                    print(f"    ⚠️ Spieltag nicht gefunden, verwende ersten Spieltag: {matchday}")
-                else:
-                    print(f"    ⚠️ Spieltag nicht gefunden, verwende vorhandenen: {matchday}")
-        elif matchday == 1 and liga_id == 3:  # Nur für DFB-Pokal: matchday=1 ist oft falsch
-            print(f"    🔍 Suche richtigen Spieltag (DFB-Pokal matchday=1 ist oft falsch)...")
+        if planned:
+            if plan_key(match) not in planned:
+                continue
+        elif not matchday or (matchday == 1 and liga_id == 3):  # DFB-Pokal: matchday=1 ist oft falsch
+            # Nur ohne Plan: Spieltag über die (im Seiten-Speicher gemerkten) Übersichten suchen
+            print(f"    🔍 Suche richtigen Spieltag für {home_team} vs {away_team}...")
             found_matchday = find_matchday_for_match(
-                league_path, scraping_season, home_team, away_team, is_international, liga_id, phase, spieltage_zum_scrapen
+                league_path, scraping_season, home_team, away_team, is_international, liga_id, phase, spieltage_zum_scrapen, pages
             )
             if found_matchday:
                 matchday = found_matchday
                 print(f"    ✅ Spieltag gefunden: {matchday}")
+            elif saved_first_matchday:
+                matchday = saved_first_matchday
+                print(f"    ⚠️ Spieltag nicht gefunden, verwende ersten Spieltag: {matchday}")
             else:
-                # Fallback: Wenn kein Spieltag gefunden wurde, aber wir bereits einen saved_first_matchday haben, verwende diesen
-                if saved_first_matchday:
-                    matchday = saved_first_matchday
-                    print(f"    ⚠️ Spieltag nicht gefunden, verwende ersten Spieltag: {matchday}")
-                else:
-                    print(f"    ⚠️ Spieltag nicht gefunden, verwende vorhandenen: {matchday}")
-        else:
-            # Spieltag ist bereits vorhanden und > 1, verwende ihn direkt
-            print(f"    📅 Verwende vorhandenen Spieltag: {matchday}")
+                print(f"    ⚠️ Spieltag nicht gefunden, verwende vorhandenen: {matchday}")
+        selected += 1
+        
+        # Bereits vollständig gespeicherte Aufstellungen nicht erneut laden (außer kurz vor/nach Anpfiff)
+        match_key = lineup_key(home_team, away_team, date_time, matchday, phase)
+        if not full and not store.needs_scrape(match_key, match.kickoff_epoch, now_epoch):
+            plan.skipped_complete += 1
+            continue
+        
+        resolve_slugs((match,), slug_of, slug_memo)
+        
+        match_info = f"{home_team} vs {away_team}"
+        if matchday:
+            match_info += f" (Spieltag: {matchday})"
+        if phase:
+            match_info += f" (Phase: {phase})"
+        parsed_matches_preview.append(match_info)
         
-        # Scrapte Aufstellung (testet automatisch ±1 Spieltag)
         # WICHTIG: Verwende scraping_season für fussballdaten.de URLs
-        lineup = scrape_lineup_for_match(
+        lineup_args = (
             league_path, scraping_season, phase, matchday,
-            home_team, away_team, is_international, liga_id
+            home_team, away_team, is_international, liga_id, match.kickoff_epoch, (match.home_slug, match.away_slug)
         )
+        plan.jobs.append((home_team, away_team, date_time, matchday, phase, lineup_args, match_key,
+                          probe_priority(match.kickoff_epoch, match.live, store.get(match_key) is not None, now_epoch)))
+    
+    if planned:
+        # Debug: Zeige Matchday-Verteilung
+        print(f"   📊 Matchday-Verteilung in Match-Datei: {dict(sorted(matchday_counts.items(), key=lambda x: int(x[0]) if x[0] != 'None' and x[0].isdigit() else 999))}")
+        print(f"📊 Gefiltert: {selected} Matches für Spieltage {spieltage_zum_scrapen} (von {len(matches)} total)")
+    
+    # Zeige alle Matches zu Beginn aufgelistet (maximal 50, sonst erste 25 und letzte 25)
+    print(f"\n📋 Alle Matches die gescrappt werden sollen:")
+    print(f"{'='*60}")
+    total = len(parsed_matches_preview)
+    for i, match_info in enumerate(parsed_matches_preview, 1):
+        if total > 50 and i == 26:
+            print(f"  ... ({total - 50} weitere Matches ausgelassen) ...")
+        if total <= 50 or i <= 25 or i > total - 25:
+            print(f"  [{i:3d}/{total}] {match_info}")
+    if plan.skipped_complete:
+        print(f"⏭️ {plan.skipped_complete} Spiele mit vollständig gespeicherter Aufstellung übersprungen")
+    print(f"{'='*60}\n")
+    
+    # Ergebnisse aus dem Journal übernehmen; die übrigen Spiele nach Dringlichkeit (laufende, bald beginnende,
+    # dann ältere Spiele; ohne gespeicherte Aufstellung zuerst), damit bei knappem Budget das Wichtigste zuerst kommt
+    plan.start()
+    return plan
+    
+
+def scrape_planned_lineups(plan: LeagueLineupPlan, use_async: bool = False, host_concurrency: Optional[int] = None):
+    """Lädt die offenen Aufstellungen einer Liga in der Reihenfolge von plan.pending
+
+    use_async: Aufstellungsseiten gleichzeitig laden (max. host_concurrency Requests pro Host)
+    """
+    if plan.journal is None:
+        return
+    try:
+        if not use_async:
+            for i, index in enumerate(plan.pending, 1):
+                if RUN_BUDGET.exhausted():
+                    break
+                home_team, away_team, _, matchday, _, lineup_args, _, _ = plan.jobs[index]
+                print(f"\n[{i}/{len(plan.pending)}] {home_team} vs {away_team}")
+                print(f"    📅 Spieltag: {matchday}")
+                # Scrapte Aufstellung (testet automatisch ±1 Spieltag)
+                plan.checkpoint(index, scrape_lineup_for_match(*lineup_args))
         
+        # Async-Modus: Alle Aufstellungen gleichzeitig scrapen (Ergebnis identisch zum seriellen Pfad)
+        if use_async and plan.pending:
+            print(f"\n⚡ Async-Modus: Scrape {len(plan.pending)} Aufstellungen gleichzeitig...")
+            scrape_lineups_async([plan.jobs[index][5] for index in plan.pending], host_concurrency,
+                                 on_result=lambda i, lineup: plan.checkpoint(plan.pending[i], lineup))
+    finally:
+        plan.journal.flush()
+
+def scrape_lineup_queue(plans: List[LeagueLineupPlan], use_async: bool = False, host_concurrency: Optional[int] = None, workers: Optional[int] = None):
+    """
+    Lädt die offenen Aufstellungen aller Ligen aus einer gemeinsamen Warteschlange: die (je Liga schon
+    sortierten) pending-Listen werden per heapq.merge nach Dringlichkeit zusammengeführt, die Worker
+    (bzw. im Async-Modus die Coroutinen) beginnen die Spiele in dieser Reihenfolge.
+    """
+    plans = [plan for plan in plans if plan.journal is not None]
+    queue = list(heapq.merge(
+        *([(plan.jobs[index][7], plan_number, index) for index in plan.pending] for plan_number, plan in enumerate(plans))
+    ))
+    if not queue:
+        return
+    
+    def checkpoint(position: int, lineup):
+        _, plan_number, index = queue[position]
+        plans[plan_number].checkpoint(index, lineup)
+    
+    print(f"\n{'='*60}")
+    print(f"🚦 Warteschlange: {len(queue)} Spiele aus {len(plans)} Ligen, dringendste zuerst")
+    print(f"{'='*60}")
+    try:
+        if use_async:
+            print(f"⚡ Async-Modus: Scrape {len(queue)} Aufstellungen gleichzeitig...")
+            try:
+                scrape_lineups_async([plans[plan_number].jobs[index][5] for _, plan_number, index in queue], host_concurrency,
+                                     on_result=checkpoint)
+            except Exception as e:
+                # Bereits fertige Spiele sind per Checkpoint übernommen, der Rest gilt als verschoben
+                print(f"❌ Fehler im Async-Modus: {e}")
+                traceback.print_exc(file=sys.stdout)
+        else:
+            tasks = []
+            for _, plan_number, index in queue:
+                plan = plans[plan_number]
+                home_team, away_team, _, matchday, _, lineup_args, _, _ = plan.jobs[index]
+                tasks.append((f"[{plan.league_name}] {home_team} vs {away_team} (Spieltag: {matchday})",
+                              lambda lineup_args=lineup_args: scrape_lineup_for_match(*lineup_args)))
+            run_in_order(tasks, workers, on_done=checkpoint)
+    finally:
+        for plan in plans:
+            plan.journal.flush()
+
+def finish_league_lineups(plan: LeagueLineupPlan) -> Dict:
+    """Übernimmt die Ergebnisse in die gespeicherten Aufstellungen, gibt die Zusammenfassung aus und liefert die Daten für save_lineups_json"""
+    league_name, season, store = plan.league_name, plan.season, plan.store
+    if plan.pages is None:
+        # Keine Match-Datei: gespeicherte Aufstellungen unverändert
+        return {"league": league_name, "season": season, "lineups": store.lineups()}
+    
+    successful = 0
+    failed = 0
+    postponed = 0
+    failed_matches = []  # Sammle fehlgeschlagene Spiele für Analyse
+    
+    for index, ((home_team, away_team, date_time, matchday, phase, _, _, _), lineup) in enumerate(zip(plan.jobs, plan.results)):
+        if index not in plan.done:
+            # Wegen des Budgets nicht mehr begonnen (oder mit Fehler abgebrochen) - kommt im nächsten Lauf dran
+            postponed += 1
+            continue
         if lineup:
-            home_players, away_players, assign_positions = lineup
-            
-            # Ordne Positionen zu, wenn nicht Bundesliga/2. Bundesliga/DFB-Pokal
-            if assign_positions:
-                home_lineup_with_positions = assign_positions_by_order(home_players)
-                away_lineup_with_positions = assign_positions_by_order(away_players)
-                # Prüfe ob alle Positionen zugeordnet wurden
-                home_positions_count = len([p for p in home_lineup_with_positions if p.get('position')])
-                away_positions_count = len([p for p in away_lineup_with_positions if p.get('position')])
-                print(f"  📍 Positionen zugeordnet: Heim {home_positions_count}/{len(home_players)}, Auswärts {away_positions_count}/{len(away_players)}")
-            else:
-                # Für Bundesliga/2. Bundesliga/DFB-Pokal: Nur Namen (wie bisher, einfache Liste)
-                home_lineup_with_positions = home_players
-                away_lineup_with_positions = away_players
-            
-            lineups.append({
-                "homeTeam": home_team,
-                "awayTeam": away_team,
-                "dateTime": date_time,
-                "matchday": matchday,
-                "phase": phase,
-                "homeLineup": home_lineup_with_positions,
-                "awayLineup": away_lineup_with_positions
-            })
+            home_players, away_players, _ = lineup
+            store.put(build_lineup_entry(home_team, away_team, date_time, matchday, phase, lineup))
             successful += 1
             print(f"  ✅ Aufstellung gescrappt: {len(home_players)} Heim, {len(away_players)} Auswärts")
         else:
@@ -1122,6 +1246,11 @@ def scrape_lineups_for_league(league_name: str, season: str, data_dir: str = 'da
     print(f"📊 ZUSAMMENFASSUNG für {league_name} (Saison {season}):")
     print(f"✅ Erfolgreich: {successful}")
     print(f"❌ Fehlgeschlagen: {failed}")
+    print(f"⏭️ Übersprungen (vollständig gespeichert): {plan.skipped_complete}")
+    if postponed:
+        print(f"⏸️ Verschoben (Budget erschöpft): {postponed}")
+    print(f"📦 {plan.pages.stats()}")
+    print(f"📦 {store.stats()}")
     if failed > 0:
         print(f"\n⚠️ {failed} Spiele konnten nicht gefunden werden!")
         print(f"   Bitte prüfe die Logs oben für Details zu jedem fehlgeschlagenen Spiel.")
@@ -1146,9 +1275,22 @@ def scrape_lineups_for_league(league_name: str, season: str, data_dir: str = 'da
         "league": league_name,
         "season": season,
         "lastUpdated": datetime.now().isoformat(),
-        "lineups": lineups
+        "lineups": store.lineups()
     }
 
+def scrape_lineups_for_league(league_name: str, season: str, data_dir: str = 'data/matches', use_async: bool = False, host_concurrency: Optional[int] = None, full: bool = False,
+                              resume: bool = False, checkpoint_every: Optional[int] = None) -> Dict:
+    """Scrapt Aufstellungen für alle Spiele einer Liga und führt sie mit den gespeicherten zusammen
+
+    Planen, Laden und Zusammenführen einer einzelnen Liga; main() plant alle Ligen und lädt
+    aus einer gemeinsamen Warteschlange (scrape_lineup_queue).
+    use_async: Aufstellungsseiten gleichzeitig laden (max. host_concurrency Requests pro Host)
+    full/resume/checkpoint_every: siehe plan_league_lineups
+    """
+    plan = plan_league_lineups(league_name, season, data_dir, full, resume, checkpoint_every)
+    scrape_planned_lineups(plan, use_async, host_concurrency)
+    return finish_league_lineups(plan)
+
 def save_lineups_json(league_name: str, season: str, lineups_data: Dict, output_dir: str = 'data/lineups'):
     """Speichert Aufstellungen als JSON"""
     # Stelle sicher, dass das Verzeichnis relativ zum Repository-Root ist
@@ -1163,9 +1305,46 @@ def save_lineups_json(league_name: str, season: str, lineups_data: Dict, output_
     
     print(f"💾 Gespeichert: {filename} ({len(lineups_data['lineups'])} Aufstellungen)")
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Kommandozeilen-Optionen"""
+    parser = argparse.ArgumentParser(description="Scrapt Aufstellungen von fussballdaten.de")
+    parser.add_argument(
+        '--async', dest='use_async', action='store_true',
+        default=os.environ.get('SCRAPER_FETCH_MODE', '').lower() == 'async',
+        help="Aufstellungsseiten gleichzeitig laden (alternativ: SCRAPER_FETCH_MODE=async)"
+    )
+    parser.add_argument(
+        '--host-concurrency', type=int, default=None,
+        help="Max. gleichzeitige Requests pro Host im Async-Modus (alternativ: SCRAPER_HOST_CONCURRENCY, Standard 4)"
+    )
+    parser.add_argument(
+        '--full', action='store_true',
+        help="Auch Spiele mit bereits vollständig gespeicherter Aufstellung neu laden"
+    )
+    add_budget_arguments(parser)
+    parser.add_argument(
+        '--resume', action='store_true',
+        help="Abgebrochenen Lauf fortsetzen: bereits bearbeitete Spiele aus dem Journal übernehmen"
+    )
+    parser.add_argument(
+        '--checkpoint-every', type=int, default=DEFAULT_CHECKPOINT_EVERY,
+        help=f"Journal nach so vielen Spielen schreiben (alternativ: SCRAPER_CHECKPOINT_EVERY, Standard {DEFAULT_CHECKPOINT_EVERY}, 0 = aus)"
+    )
+    add_league_workers_argument(parser)
+    add_probe_workers_argument(parser)
+    http_client.add_fixture_arguments(parser)
+    http_client.add_base_url_argument(parser)
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
     """Hauptfunktion"""
+    args = parse_args(argv)
+    http_client.apply_fixture_arguments(args)
+    http_client.set_fussballdaten_base_url(args.base_url)
+    apply_budget_arguments(args)
     print("🚀 Starte Lineup-Scraping für alle Ligen...")
+    if args.use_async:
+        print("⚡ Async-Modus aktiv")
     
     # WICHTIG: ALLE Ligen verwenden jetzt Dateinamen OHNE Saison
     # fussballdaten.de verwendet Saison +1 (z.B. 2026 statt 2025) für Scraping-URLs
@@ -1188,17 +1367,55 @@ def main():
         ("france", ""),  # France: Dateiname OHNE Saison
     ]
     
-    for league_name, league_season in leagues:
+    def plan_job(league_name: str, league_season: str):
+        def job() -> Optional[LeagueLineupPlan]:
+            if RUN_BUDGET.exhausted():
+                print(f"⏱️ Budget erschöpft - {league_name} wird in diesem Lauf übersprungen (gespeicherte Aufstellungen und Journal bleiben)")
+                return None
+            try:
+                return plan_league_lineups(
+                    league_name, league_season, full=args.full, resume=args.resume, checkpoint_every=args.checkpoint_every
+                )
+            except Exception as e:
+                print(f"❌ Fehler bei Liga {league_name}: {e}")
+                traceback.print_exc(file=sys.stdout)
+                return None
+        return job
+    
+    # 1. Alle Ligen planen (gleichzeitig, gemeinsamer Rate Limiter), Ausgaben in Liga-Reihenfolge
+    plans = run_leagues([(league_name, plan_job(league_name, league_season)) for league_name, league_season in leagues], args.league_workers)
+    plans = [plan for plan in plans if plan is not None]
+    
+    # 2. Eine Warteschlange über alle Ligen: dringendste Spiele zuerst (Anpfiff, fehlende Aufstellung)
+    scrape_lineup_queue(plans, args.use_async, args.host_concurrency, args.probe_workers)
+    
+    # 3. Ergebnisse pro Liga zusammenführen und speichern
+    for plan in plans:
         try:
-            lineups_data = scrape_lineups_for_league(league_name, league_season)
+            lineups_data = finish_league_lineups(plan)
             # Für deutsche Ligen: Verwende aktuelle Saison für Lineup-Dateinamen
-            save_season = league_season if league_season else get_current_season()
-            save_lineups_json(league_name, save_season, lineups_data)
+            save_lineups_json(plan.league_name, plan.season if plan.season else get_current_season(), lineups_data)
+            # Liga gespeichert → Journal wird nicht mehr gebraucht
+            clear_journal(plan.league_name)
         except Exception as e:
-            print(f"❌ Fehler bei Liga {league_name}: {e}")
-            import traceback
-            traceback.print_exc()
-    
+            print(f"❌ Fehler bei Liga {plan.league_name}: {e}")
+            traceback.print_exc(file=sys.stdout)
+    
+    if http_client.HTTP_CACHE is not None:
+        print(f"\n📦 {http_client.HTTP_CACHE.stats()}")
+    if PROBE_CACHE is not None:
+        PROBE_CACHE.save()
+        print(f"📦 {PROBE_CACHE.stats()}")
+    if SLUG_INDEX is not None:
+        SLUG_INDEX.save()
+        print(f"📦 {SLUG_INDEX.stats()}")
+    if MATCH_URL_INDEX is not None:
+        MATCH_URL_INDEX.save()
+        print(f"📦 {MATCH_URL_INDEX.stats()}")
+    if http_client.FIXTURES is not None:
+        print(f"🎞️ {http_client.FIXTURES.stats()}")
+    if RUN_BUDGET.limited:
+        print(f"⏱️ {RUN_BUDGET.stats()}")
     print("\n✅ Scraping abgeschlossen!")
 
 if __name__ == "__main__":
@@ -4,18 +4,26 @@ Match-Scraper für Anstoss App
 Scrapt Match-Daten von fussballdaten.de und speichert sie als JSON
 """
 
-import requests
 import re
 import json
 from datetime import datetime, timedelta, timezone
 from bs4 import BeautifulSoup
 import os
-from typing import List, Dict, Optional, Tuple
+import argparse
+from typing import Callable, List, Dict, Optional, Set, Tuple
 
-# User-Agent für Requests
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-}
+# Gemeinsamer HTTP-Client (Keep-Alive-Session, einheitliche Header)
+import http_client
+from http_client import fussballdaten_url
+from slug_index import SLUG_INDEX
+from match_url_index import MATCH_URL_INDEX
+from page_store import PageStore
+from matchday_finder import find_current_matchday_cached
+from league_pool import add_league_workers_argument, run_leagues
+from page_crawler import crawl_in_order
+from match_record import build_match_records
+from overview_anchors import MATCH_TITLE_DATE_PATTERN, classify_match_anchor, match_anchor_pattern
+from run_budget import RUN_BUDGET, add_budget_arguments, apply_budget_arguments, work_priority
 
 # Team-Name-Mappings (vereinfacht, kann erweitert werden)
 TEAM_MAPPINGS = {
@@ -97,221 +105,175 @@ def parse_team_from_slug(slug: str, league: str) -> Tuple[str, str]:
 def fetch_html(url: str) -> Optional[str]:
     """Lädt HTML von einer URL"""
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        response = http_client.get(url)
         if response.status_code == 200:
+            # Spiel-Links der Übersicht in Slug- und Spiel-URL-Index übernehmen (für die Aufstellungs-Suche)
+            for index in (SLUG_INDEX, MATCH_URL_INDEX):
+                if index is not None:
+                    index.harvest(response.text)
             return response.text
         return None
     except Exception as e:
         print(f"❌ Fehler beim Laden von {url}: {e}")
         return None
 
-def parse_england_matches(html: str, matchday: int, season: str) -> List[Dict]:
-    """Parst England-Matches aus HTML"""
-    matches = []
-    
-    # Pattern für zukünftige Spiele
-    zukunft_pattern = re.compile(
-        r'href="/england/\d+/\d+/([a-z0-9.-]+)/"[^>]*title="[^"]*\((\d{2})\.(\d{2})\.(\d{4})[^)]*\)[^"]*"[^>]*>[\s\S]*?<span>(\d{2}:\d{2})</span>',
-        re.IGNORECASE
-    )
-    
-    # Pattern für Live-Spiele
-    live_pattern = re.compile(
-        r'class="ergebnis\s+live"[^>]*href="/england/\d+/\d+/([a-z0-9.-]+)/"[^>]*>[\s\S]*?<span[^>]*>(\d+:\d+)</span>',
-        re.IGNORECASE
-    )
-    
-    # Pattern für vergangene Spiele
-    vergangen_pattern = re.compile(
-        r'class="ergebnis"\s+href="/england/\d+/\d+/([a-z0-9.-]+)/"[^>]*title="[^"]*\((\d{2})\.(\d{2})\.(\d{4})[^)]*\)[^"]*"[^>]*>[\s\S]*?<span[^>]*id="[^"]*"[^>]*>(\d+:\d+)</span>',
-        re.IGNORECASE
-    )
-    
-    # Live-Spiele
-    for match in live_pattern.finditer(html):
-        slug = match.group(1)
-        score = match.group(2)
-        home_team, away_team = parse_team_from_slug(slug, 'england')
-        if home_team and away_team:
+def parse_matchday_overview(html: str, matchday: int, league_path: str) -> List[Dict]:
+    """
+    Parst eine Spieltags-Übersicht in einem Durchlauf.
+    Jeder Spiel-Link wird genau einmal gelesen und anhand seines Abschnitts (bis zum nächsten Spiel-Link)
+    als live, zukünftig oder beendet eingeordnet. Reihenfolge der Ausgabe: live, zukünftig, beendet.
+    """
+    live_matches = []
+    future_matches = []
+    finished_matches = []
+    
+    anchors = list(match_anchor_pattern(league_path).finditer(html))
+    for i, anchor in enumerate(anchors):
+        tag = anchor.group(0)
+        section_end = anchors[i + 1].start() if i + 1 < len(anchors) else len(html)
+        
+        home_team, away_team = parse_team_from_slug(anchor.group(1), league_path)
+        if not home_team or not away_team:
+            continue
+        
+        date_match = MATCH_TITLE_DATE_PATTERN.search(tag)
+        state, value = classify_match_anchor(html, tag, anchor.end(), section_end)
+        
+        if state == 'live':
+            # Live-Spiel
             today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            matches.append({
+            live_matches.append({
                 'matchday': matchday,
                 'homeTeam': home_team,
                 'awayTeam': away_team,
                 'dateTime': today.isoformat() + 'Z',
-                'score': score,
+                'score': value,
                 'isFinished': False,
                 'isLive': True,
-                'liveScore': score
-            })
-    
-    # Zukünftige Spiele
-    for match in zukunft_pattern.finditer(html):
-        slug = match.group(1)
-        day = int(match.group(2))
-        month = int(match.group(3))
-        year = int(match.group(4))
-        time_str = match.group(5)
-        
-        home_team, away_team = parse_team_from_slug(slug, 'england')
-        if home_team and away_team:
-            hour, minute = map(int, time_str.split(':'))
-            match_datetime = datetime(year, month, day, hour, minute)
-            matches.append({
-                'matchday': matchday,
-                'homeTeam': home_team,
-                'awayTeam': away_team,
-                'dateTime': match_datetime.isoformat() + 'Z',
-                'score': None,
-                'isFinished': False,
-                'isLive': False,
-                'liveScore': None
+                'liveScore': value
             })
-    
-    # Vergangene Spiele
-    for match in vergangen_pattern.finditer(html):
-        slug = match.group(1)
-        day = int(match.group(2))
-        month = int(match.group(3))
-        year = int(match.group(4))
-        score = match.group(5)
+            continue
+        
+        if not date_match or state is None:
+            continue
+        day, month, year = int(date_match.group(1)), int(date_match.group(2)), int(date_match.group(3))
         
-        home_team, away_team = parse_team_from_slug(slug, 'england')
-        if home_team and away_team:
+        if state == 'finished':
+            # Vergangenes Spiel
             match_datetime = datetime(year, month, day, 15, 0)  # Geschätzte Uhrzeit
-            matches.append({
+            finished_matches.append({
                 'matchday': matchday,
                 'homeTeam': home_team,
                 'awayTeam': away_team,
                 'dateTime': match_datetime.isoformat() + 'Z',
-                'score': score,
+                'score': value,
                 'isFinished': True,
                 'isLive': False,
                 'liveScore': None
             })
-    
-    return matches
+            continue
+        
+        # Zukünftiges Spiel
+        hour, minute = map(int, value.split(':'))
+        match_datetime = datetime(year, month, day, hour, minute)
+        future_matches.append({
+            'matchday': matchday,
+            'homeTeam': home_team,
+            'awayTeam': away_team,
+            'dateTime': match_datetime.isoformat() + 'Z',
+            'score': None,
+            'isFinished': False,
+            'isLive': False,
+            'liveScore': None
+        })
+    
+    return live_matches + future_matches + finished_matches
+
+def parse_england_matches(html: str, matchday: int, season: str) -> List[Dict]:
+    """Parst England-Matches aus HTML"""
+    return parse_matchday_overview(html, matchday, 'england')
+
+# So viele Spieltage vor dem aktuellen werden mitgescrapt (Ergebnisse der letzten Wochen)
+MATCHDAYS_BEFORE_CURRENT = 5
+
+# Runde eines Spiels: (Phase, Spieltag) - Phase None für Ligen, Spieltag None für K.o.-Runden
+RoundKey = Tuple[Optional[str], Optional[int]]
+
+def round_key(match: Dict) -> RoundKey:
+    return match.get('phase'), match.get('matchday')
+
+def find_current_league_matchday(league_path: str, season: str, pages: PageStore, last_matchday: int = 38, frozen: Optional[Set[RoundKey]] = None) -> int:
+    """
+    Aktueller Spieltag (per Bisektion, siehe matchday_finder); geladen wird ab diesem Spieltag
+    minus MATCHDAYS_BEFORE_CURRENT. Ohne offenen Spieltag (Saison beendet) wird wie bisher
+    aus der Kalenderwoche geschätzt. Abgeschlossene Spieltage (frozen) werden nicht geladen.
+    """
+    def check(matchday: int) -> Optional[bool]:
+        if frozen and (None, matchday) in frozen:
+            return False
+        url = fussballdaten_url(f"{league_path}/{season}/{matchday}/")
+        html = pages.get(url)
+        if not html or len(html) < 1000:
+            return None
+        matches = pages.parse(url, parse_matchday_overview, matchday, league_path)
+        if not matches:
+            return None
+        return any(not match['isFinished'] for match in matches)
+    
+    current_matchday = find_current_matchday_cached(f"{league_path}/{season}", range(1, last_matchday + 1), check)
+    if current_matchday is None:
+        current_week = datetime.now().isocalendar()[1]
+        current_matchday = max(1, (current_week - 30) // 2)
+    else:
+        print(f"📅 {league_path}: Aktueller Spieltag {current_matchday}")
+    return current_matchday
+
+def crawl_league_matchdays(league_path: str, season: str, pages: PageStore, current_matchday: int, frozen: Optional[Set[RoundKey]] = None, last_matchday: int = 38) -> List[Tuple[int, List[Dict]]]:
+    """
+    Lädt die Spieltage ab current_matchday - MATCHDAYS_BEFORE_CURRENT gleichzeitig (siehe page_crawler)
+    und gibt (Spieltag, Spiele) in Spieltags-Reihenfolge zurück. Nach 3 leeren Seiten in Folge ist die Saison zu Ende.
+    Abgeschlossene Spieltage (frozen) werden nicht geladen, zählen aber nicht als leer.
+    Geladen wird nach Wert: zuerst ab dem aktuellen Spieltag (laufende und bald beginnende Spiele),
+    dann die Spieltage davor - bei knappem Run-Budget fehlen also eher die älteren Spieltage.
+    """
+    def fetch(matchday: int) -> Optional[List[Dict]]:
+        if frozen and (None, matchday) in frozen:
+            # Alle Spiele beendet - bleibt aus der gespeicherten Datei erhalten
+            return []
+        url = fussballdaten_url(f"{league_path}/{season}/{matchday}/")
+        html = pages.get(url)
+        if not html or len(html) < 1000:
+            return None
+        return pages.parse(url, parse_matchday_overview, matchday, league_path)
+    
+    start_matchday = max(1, current_matchday - MATCHDAYS_BEFORE_CURRENT)
+    current_matchday = max(start_matchday, min(current_matchday, last_matchday))
+    matchdays = list(range(current_matchday, last_matchday + 1)) + list(range(start_matchday, current_matchday))
+    # Die Abbruch-Regel gilt nur ab dem aktuellen Spieltag; die Spieltage davor sind eine eigene Gruppe
+    crawled = crawl_in_order(matchdays, fetch, max_consecutive_empty=3, group=lambda matchday: matchday < current_matchday)
+    return sorted(((matchday, matches) for matchday, matches in crawled if not (frozen and (None, matchday) in frozen)), key=lambda item: item[0])
 
-def scrape_england_matches(season: str) -> List[Dict]:
-    """Scrapt alle England-Matches für eine Saison"""
+def scrape_england_matches(season: str, frozen: Optional[Set[RoundKey]] = None) -> List[Dict]:
+    """Scrapt alle England-Matches für eine Saison (abgeschlossene Spieltage aus frozen werden übersprungen)"""
     all_matches = []
     league_path = 'england'
     
-    # Schätze aktuellen Spieltag
-    current_week = datetime.now().isocalendar()[1]
-    estimated_matchday = max(1, (current_week - 30) // 2)
-    start_matchday = max(1, estimated_matchday - 5)
+    # Aktueller Spieltag per Bisektion - die dabei geladenen Seiten werden unten wiederverwendet
+    pages = PageStore(fetch_html)
+    current_matchday = find_current_league_matchday(league_path, season, pages, frozen=frozen)
     
-    consecutive_empty = 0
-    max_consecutive_empty = 3
-    
-    for matchday in range(start_matchday, 39):
-        url = f"https://www.fussballdaten.de/{league_path}/{season}/{matchday}/"
-        html = fetch_html(url)
-        
-        if not html or len(html) < 1000:
-            consecutive_empty += 1
-            if consecutive_empty >= max_consecutive_empty:
-                break
-            continue
-        
-        consecutive_empty = 0
-        matches = parse_england_matches(html, matchday, season)
+    for matchday, matches in crawl_league_matchdays(league_path, season, pages, current_matchday, frozen):
         all_matches.extend(matches)
-        
         print(f"✅ Spieltag {matchday}: {len(matches)} Spiele gefunden")
     
     return all_matches
 
 def parse_league_matches(html: str, matchday: int, season: str, league_path: str) -> List[Dict]:
     """Parst Matches aus HTML für eine Liga (Spain, Italy, France)"""
-    matches = []
-    
-    # Pattern für zukünftige Spiele
-    zukunft_pattern = re.compile(
-        rf'href="/{league_path}/\d+/\d+/([a-z0-9.-]+)/"[^>]*title="[^"]*\((\d{{2}})\.(\d{{2}})\.(\d{{4}})[^)]*\)[^"]*"[^>]*>[\s\S]*?<span>(\d{{2}}:\d{{2}})</span>',
-        re.IGNORECASE
-    )
-    
-    # Pattern für Live-Spiele
-    live_pattern = re.compile(
-        rf'class="ergebnis\s+live"[^>]*href="/{league_path}/\d+/\d+/([a-z0-9.-]+)/"[^>]*>[\s\S]*?<span[^>]*>(\d+:\d+)</span>',
-        re.IGNORECASE
-    )
-    
-    # Pattern für vergangene Spiele
-    vergangen_pattern = re.compile(
-        rf'class="ergebnis"\s+href="/{league_path}/\d+/\d+/([a-z0-9.-]+)/"[^>]*title="[^"]*\((\d{{2}})\.(\d{{2}})\.(\d{{4}})[^)]*\)[^"]*"[^>]*>[\s\S]*?<span[^>]*id="[^"]*"[^>]*>(\d+:\d+)</span>',
-        re.IGNORECASE
-    )
-    
-    # Live-Spiele
-    for match in live_pattern.finditer(html):
-        slug = match.group(1)
-        score = match.group(2)
-        home_team, away_team = parse_team_from_slug(slug, league_path)
-        if home_team and away_team:
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            matches.append({
-                'matchday': matchday,
-                'homeTeam': home_team,
-                'awayTeam': away_team,
-                'dateTime': today.isoformat() + 'Z',
-                'score': score,
-                'isFinished': False,
-                'isLive': True,
-                'liveScore': score
-            })
-    
-    # Zukünftige Spiele
-    for match in zukunft_pattern.finditer(html):
-        slug = match.group(1)
-        day = int(match.group(2))
-        month = int(match.group(3))
-        year = int(match.group(4))
-        time_str = match.group(5)
-        
-        home_team, away_team = parse_team_from_slug(slug, league_path)
-        if home_team and away_team:
-            hour, minute = map(int, time_str.split(':'))
-            match_datetime = datetime(year, month, day, hour, minute)
-            matches.append({
-                'matchday': matchday,
-                'homeTeam': home_team,
-                'awayTeam': away_team,
-                'dateTime': match_datetime.isoformat() + 'Z',
-                'score': None,
-                'isFinished': False,
-                'isLive': False,
-                'liveScore': None
-            })
-    
-    # Vergangene Spiele
-    for match in vergangen_pattern.finditer(html):
-        slug = match.group(1)
-        day = int(match.group(2))
-        month = int(match.group(3))
-        year = int(match.group(4))
-        score = match.group(5)
-        
-        home_team, away_team = parse_team_from_slug(slug, league_path)
-        if home_team and away_team:
-            match_datetime = datetime(year, month, day, 15, 0)
-            matches.append({
-                'matchday': matchday,
-                'homeTeam': home_team,
-                'awayTeam': away_team,
-                'dateTime': match_datetime.isoformat() + 'Z',
-                'score': score,
-                'isFinished': True,
-                'isLive': False,
-                'liveScore': None
-            })
-    
-    return matches
+    return parse_matchday_overview(html, matchday, league_path)
 
-def scrape_league_matches(league: str, season: str) -> List[Dict]:
-    """Scrapt Matches für eine Liga (Bundesliga, Spain, Italy, France)"""
+def scrape_league_matches(league: str, season: str, frozen: Optional[Set[RoundKey]] = None) -> List[Dict]:
+    """Scrapt Matches für eine Liga (Bundesliga, Spain, Italy, France; abgeschlossene Spieltage aus frozen werden übersprungen)"""
     all_matches = []
     league_paths = {
         'bundesliga1': 'bundesliga',
@@ -327,33 +289,17 @@ def scrape_league_matches(league: str, season: str) -> List[Dict]:
     league_path = league_paths[league]
     
     # Ähnliche Logik wie England
-    current_week = datetime.now().isocalendar()[1]
-    estimated_matchday = max(1, (current_week - 30) // 2)
-    start_matchday = max(1, estimated_matchday - 5)
-    
-    consecutive_empty = 0
-    max_consecutive_empty = 3
+    pages = PageStore(fetch_html)
+    current_matchday = find_current_league_matchday(league_path, season, pages, frozen=frozen)
     
-    for matchday in range(start_matchday, 39):
-        url = f"https://www.fussballdaten.de/{league_path}/{season}/{matchday}/"
-        html = fetch_html(url)
-        
-        if not html or len(html) < 1000:
-            consecutive_empty += 1
-            if consecutive_empty >= max_consecutive_empty:
-                break
-            continue
-        
-        consecutive_empty = 0
-        matches = parse_league_matches(html, matchday, season, league_path)
+    for matchday, matches in crawl_league_matchdays(league_path, season, pages, current_matchday, frozen):
         all_matches.extend(matches)
-        
         print(f"✅ {league} Spieltag {matchday}: {len(matches)} Spiele gefunden")
     
     return all_matches
 
-def scrape_international_matches(league: str, season: str) -> List[Dict]:
-    """Scrapt internationale Matches (Champions/Europa/Conference League)"""
+def scrape_international_matches(league: str, season: str, frozen: Optional[Set[RoundKey]] = None) -> List[Dict]:
+    """Scrapt internationale Matches (Champions/Europa/Conference League; abgeschlossene Runden aus frozen werden übersprungen)"""
     all_matches = []
     league_paths = {
         'championsleague': 'championsleague',
@@ -370,98 +316,144 @@ def scrape_international_matches(league: str, season: str) -> List[Dict]:
     if league == 'conferenceleague':
         phases = ['league-stage', 'play-offs', 'achtelfinale', 'viertelfinale', 'halbfinale', 'finale']
     
+    # Raster aus Phase × Spieltag (Liga-/Gruppenphase) bzw. Phase (K.o.-Runden), gleichzeitig geladen.
+    # In einer Phase mit Spieltagen endet die Phase an der ersten leeren Seite.
+    rounds = []
     for phase in phases:
-        has_matchdays = phase in ['gruppenphase', 'league-stage']
-        
-        if has_matchdays:
-            for matchday in range(1, 21):
-                url = f"https://www.fussballdaten.de/{league_path}/{season}/{phase}/{matchday}/"
-                html = fetch_html(url)
-                
-                if not html or len(html) < 1000:
-                    break
-                
-                # Parse Matches (vereinfacht)
-                matches = parse_international_matches(html, phase, matchday, league)
-                all_matches.extend(matches)
-                print(f"✅ {league} {phase} Spieltag {matchday}: {len(matches)} Spiele")
+        if phase in ['gruppenphase', 'league-stage']:
+            rounds.extend((phase, matchday) for matchday in range(1, 21))
         else:
-            url = f"https://www.fussballdaten.de/{league_path}/{season}/{phase}/"
-            html = fetch_html(url)
-            
-            if html and len(html) >= 1000:
-                matches = parse_international_matches(html, phase, None, league)
-                all_matches.extend(matches)
-                print(f"✅ {league} {phase}: {len(matches)} Spiele")
+            rounds.append((phase, None))
+    
+    def fetch(round_: RoundKey) -> Optional[List[Dict]]:
+        phase, matchday = round_
+        if frozen and round_ in frozen:
+            return []
+        if matchday is not None:
+            url = fussballdaten_url(f"{league_path}/{season}/{phase}/{matchday}/")
+        else:
+            url = fussballdaten_url(f"{league_path}/{season}/{phase}/")
+        html = fetch_html(url)
+        if not html or len(html) < 1000:
+            # Leere Seite: Phase zu Ende (K.o.-Runden sind eigene Phasen, die übrigen laufen weiter)
+            return None
+        # Parse Matches (vereinfacht)
+        return parse_international_matches(html, phase, matchday, league)
+    
+    for (phase, matchday), matches in crawl_in_order(rounds, fetch, max_consecutive_empty=1, group=lambda round_: round_[0]):
+        if frozen and (phase, matchday) in frozen:
+            continue
+        all_matches.extend(matches)
+        if matchday is not None:
+            print(f"✅ {league} {phase} Spieltag {matchday}: {len(matches)} Spiele")
+        else:
+            print(f"✅ {league} {phase}: {len(matches)} Spiele")
     
     return all_matches
 
+# Pattern für Datum: "Donnerstag, 06.11.2025"
+INTERNATIONAL_DATE_PATTERN = re.compile(r'(Montag|Dienstag|Mittwoch|Donnerstag|Freitag|Samstag|Sonntag),?\s*(\d{2})\.(\d{2})\.(\d{4})')
+
+# Link-Tags der internationalen Übersichten (nur der <a ...>-Tag, ohne den Bereich danach), ein Pattern für alle:
+# Liga-Format /championsleague/2026/league-stage/1/slavia-prag-fc-arsenal/ (Gruppen league, home, away)
+# oder Vereine-Format /vereine/slavia-prag/fc-arsenal/ (Gruppe vereine).
+# Nach jedem passenden Tag folgt das erste <span>HH:MM</span> bzw. <span>3:0</span> (INTERNATIONAL_SPAN_PATTERN).
+INTERNATIONAL_TAG_PATTERN = re.compile(
+    r'<a(?P<attributes>[^>]*)href\s*=\s*"/(?:'
+    r'(?P<league>championsleague|europaleague|conferenceleague)/\d{4}/(?:gruppenphase|league-stage)/\d+/(?P<home>[a-z0-9.]+)-(?P<away>[a-z0-9.]+)'
+    r'|vereine/(?P<vereine>(?:[a-z0-9-]+/)+[a-z0-9-]+)'
+    r')/"[^>]*>',
+    re.IGNORECASE | re.DOTALL
+)
+# class-Attribut vor dem href: "ergebnis live" (LIVE), "ergebnis" (BEENDET), ohne class (ZUKUNFT).
+# Ein Tag zählt wie früher für jede passende Art: class="ergebnis live" ist live, beendet und zukünftig
+# (parse_international_matches wertet live vor beendet vor zukünftig aus, Duplikate fallen über found_matches weg)
+INTERNATIONAL_LIVE_CLASS_PATTERN = re.compile(r'class\s*=\s*"[^"]*live[^"]*"', re.IGNORECASE)
+INTERNATIONAL_RESULT_CLASS_PATTERN = re.compile(r'class\s*=\s*"[^"]*ergebnis[^"]*"', re.IGNORECASE)
+# Reihenfolge = Priorität beim Auswerten (live vor beendet vor zukünftig, Liga-Format vor Vereine-Format)
+INTERNATIONAL_TAG_KINDS = (
+    'league_live', 'league_finished', 'league_future',
+    'vereine_live', 'vereine_finished', 'vereine_future',
+)
+INTERNATIONAL_TAG_START = re.compile(r'<a', re.IGNORECASE)
+INTERNATIONAL_SPAN_PATTERN = re.compile(r'<span[^>]*>(\d{1,2}:\d{1,2})</span>', re.IGNORECASE | re.DOTALL)
+
+class SectionMatch:
+    """Treffer eines Tag-Patterns plus Uhrzeit/Ergebnis aus dem folgenden <span> (group() wie bei re.Match)"""
+    __slots__ = ('groups',)
+
+    def __init__(self, groups: Tuple):
+        self.groups = groups
+
+    def group(self, index: int):
+        return self.groups[index - 1]
+
+def scan_international_section(html: str, start: int, end: int) -> Dict[str, List[SectionMatch]]:
+    """
+    Durchläuft einen Datums-Abschnitt html[start:end] einmal (über Offsets, ohne Kopie des Abschnitts).
+    Jeder <a>-Tag wird einmal mit INTERNATIONAL_TAG_PATTERN geprüft und zählt für jede passende Art
+    (INTERNATIONAL_TAG_KINDS). Pro Art dieselben Treffer wie früher pattern.finditer(section) mit Tag-Pattern
+    plus nachfolgendem <span>: Ein Treffer endet am ersten passenden <span> nach dem Tag,
+    und der nächste Treffer derselben Art beginnt frühestens dahinter.
+    """
+    results = {name: [] for name in INTERNATIONAL_TAG_KINDS}
+    next_allowed = {name: start for name in INTERNATIONAL_TAG_KINDS}
+    
+    for tag_start in INTERNATIONAL_TAG_START.finditer(html, start, end):
+        position = tag_start.start()
+        tag_close = html.find('>', position + 2, end)
+        if tag_close < 0:
+            break
+        tag_match = INTERNATIONAL_TAG_PATTERN.match(html[position:tag_close + 1])
+        if not tag_match:
+            continue
+        if tag_match.group('league'):
+            prefix = 'league'
+            groups = tag_match.group('league', 'home', 'away')
+        else:
+            prefix = 'vereine'
+            groups = (tag_match.group('vereine'),)
+        attributes = tag_match.group('attributes')
+        kinds = [name for name, applies in (
+            (f'{prefix}_live', INTERNATIONAL_LIVE_CLASS_PATTERN.search(attributes)),
+            (f'{prefix}_finished', INTERNATIONAL_RESULT_CLASS_PATTERN.search(attributes)),
+            (f'{prefix}_future', True),
+        ) if applies and position >= next_allowed[name]]
+        if not kinds:
+            continue
+        # Das folgende <span> ist für alle Arten dasselbe
+        span_match = INTERNATIONAL_SPAN_PATTERN.search(html, tag_close + 1, end)
+        if not span_match:
+            continue
+        for name in kinds:
+            results[name].append(SectionMatch(groups + (span_match.group(1),)))
+            next_allowed[name] = span_match.end()
+    
+    return results
+
 def parse_international_matches(html: str, phase: str, matchday: Optional[int], league: str) -> List[Dict]:
     """Parst internationale Matches aus HTML"""
     matches = []
     
-    # Pattern für Datum: "Donnerstag, 06.11.2025"
-    date_pattern = re.compile(r'(Montag|Dienstag|Mittwoch|Donnerstag|Freitag|Samstag|Sonntag),?\s*(\d{2})\.(\d{2})\.(\d{4})')
-    
-    # Pattern für LIVE-Spiele: Direktes Pattern für class="ergebnis live"
-    # Format: <a id="..." class="ergebnis live" href="/championsleague/..."><span>3:0</span>
-    # WICHTIG: Pattern erkennt class="..." live direkt, auch wenn andere Attribute dazwischen sind
-    league_pattern_live = re.compile(
-        r'<a[^>]*class\s*=\s*"[^"]*live[^"]*"[^>]*href\s*=\s*"/(championsleague|europaleague|conferenceleague)/\d{4}/(?:gruppenphase|league-stage)/\d+/([a-z0-9.]+)-([a-z0-9.]+)/"[^>]*>[\s\S]*?<span[^>]*>(\d{1,2}:\d{1,2})</span>',
-        re.IGNORECASE | re.DOTALL
-    )
-    
-    # Pattern für beendete Spiele mit class="ergebnis" (OHNE live)
-    # Format: <a class="ergebnis" href="/championsleague/..."><span>3:0</span>
-    league_pattern_finished = re.compile(
-        r'<a[^>]*class\s*=\s*"[^"]*ergebnis[^"]*"[^>]*href\s*=\s*"/(championsleague|europaleague|conferenceleague)/\d{4}/(?:gruppenphase|league-stage)/\d+/([a-z0-9.]+)-([a-z0-9.]+)/"[^>]*>[\s\S]*?<span[^>]*>(\d{1,2}:\d{1,2})</span>',
-        re.IGNORECASE | re.DOTALL
-    )
-    
-    # Pattern für zukünftige Spiele OHNE class-Attribut
-    # Format: <a href="/championsleague/..."><span>19:00</span>
-    league_pattern_future = re.compile(
-        r'<a[^>]*href\s*=\s*"/(championsleague|europaleague|conferenceleague)/\d{4}/(?:gruppenphase|league-stage)/\d+/([a-z0-9.]+)-([a-z0-9.]+)/"[^>]*>[\s\S]*?<span[^>]*>(\d{1,2}:\d{1,2})</span>',
-        re.IGNORECASE | re.DOTALL
-    )
-    
-    # Pattern für Vereine-Format mit Live-Erkennung: /vereine/slavia-prag/fc-arsenal/
-    # LIVE: <a class="ergebnis live" href="/vereine/..."><span>3:0</span>
-    # BEENDET: <a class="ergebnis" href="/vereine/..."><span>3:0</span>
-    # ZUKUNFT: <a href="/vereine/..."><span>19:00</span>
-    vereine_pattern_live = re.compile(
-        r'<a[^>]*class\s*=\s*"[^"]*live[^"]*"[^>]*href="/vereine/((?:[a-z0-9-]+/)+[a-z0-9-]+)/"[^>]*>[\s\S]*?<span[^>]*>(\d{1,2}:\d{1,2})</span>',
-        re.IGNORECASE | re.DOTALL
-    )
-    vereine_pattern_finished = re.compile(
-        r'<a[^>]*class\s*=\s*"[^"]*ergebnis[^"]*"[^>]*href="/vereine/((?:[a-z0-9-]+/)+[a-z0-9-]+)/"[^>]*>[\s\S]*?<span[^>]*>(\d{1,2}:\d{1,2})</span>',
-        re.IGNORECASE | re.DOTALL
-    )
-    vereine_pattern_future = re.compile(
-        r'<a[^>]*href="/vereine/((?:[a-z0-9-]+/)+[a-z0-9-]+)/"[^>]*>[\s\S]*?<span[^>]*>(\d{1,2}:\d{1,2})</span>',
-        re.IGNORECASE | re.DOTALL
-    )
-    
     # Finde alle Daten
-    date_matches = list(date_pattern.finditer(html))
+    date_matches = list(INTERNATIONAL_DATE_PATTERN.finditer(html))
     
-    for date_match in date_matches:
+    for index, date_match in enumerate(date_matches):
         day = int(date_match.group(2))
         month = int(date_match.group(3))
         year = int(date_match.group(4))
         
-        # Finde Abschnitt zwischen diesem und nächstem Datum
+        # Finde Abschnitt zwischen diesem und nächstem Datum (nur Offsets, keine Kopie)
         start_idx = date_match.end()
-        next_date = date_matches[date_matches.index(date_match) + 1] if date_matches.index(date_match) + 1 < len(date_matches) else None
-        end_idx = next_date.start() if next_date else len(html)
+        end_idx = date_matches[index + 1].start() if index + 1 < len(date_matches) else len(html)
         
-        section = html[start_idx:end_idx]
+        section_matches = scan_international_section(html, start_idx, end_idx)
         
         # Set zum Tracken bereits gefundener Spiele (verhindert Duplikate)
         found_matches = set()
         
         # 1. Parse LIVE-Spiele ZUERST (höchste Priorität)
-        for match in league_pattern_live.finditer(section):
+        for match in section_matches['league_live']:
             league_type = match.group(1)
             home_slug = match.group(2)
             away_slug = match.group(3)
@@ -490,7 +482,7 @@ def parse_international_matches(html: str, phase: str, matchday: Optional[int],
                     print(f"  🔴 LIVE-SPIEL erkannt: {home_team} vs {away_team} - {score_str}")
         
         # 2. Parse beendete Spiele (class="ergebnis" OHNE live)
-        for match in league_pattern_finished.finditer(section):
+        for match in section_matches['league_finished']:
             league_type = match.group(1)
             home_slug = match.group(2)
             away_slug = match.group(3)
@@ -528,7 +520,7 @@ def parse_international_matches(html: str, phase: str, matchday: Optional[int],
                         })
         
         # 3. Parse zukünftige Spiele (OHNE class-Attribut)
-        for match in league_pattern_future.finditer(section):
+        for match in section_matches['league_future']:
             league_type = match.group(1)
             home_slug = match.group(2)
             away_slug = match.group(3)
@@ -565,7 +557,7 @@ def parse_international_matches(html: str, phase: str, matchday: Optional[int],
                         })
         
         # Parse Vereine-Format: LIVE-Spiele ZUERST
-        for match in vereine_pattern_live.finditer(section):
+        for match in section_matches['vereine_live']:
             link_path = match.group(1)
             score_str = match.group(2)  # Bei Live-Spielen ist das IMMER ein Ergebnis
             
@@ -597,7 +589,7 @@ def parse_international_matches(html: str, phase: str, matchday: Optional[int],
                         print(f"  🔴 LIVE-SPIEL (Vereine): {home_team} vs {away_team} - {score_str}")
         
         # Parse Vereine-Format: Beendete Spiele
-        for match in vereine_pattern_finished.finditer(section):
+        for match in section_matches['vereine_finished']:
             link_path = match.group(1)
             score_str = match.group(2)
             
@@ -637,7 +629,7 @@ def parse_international_matches(html: str, phase: str, matchday: Optional[int],
                             })
         
         # Parse Vereine-Format: Zukünftige Spiele
-        for match in vereine_pattern_future.finditer(section):
+        for match in section_matches['vereine_future']:
             link_path = match.group(1)
             time_str = match.group(2)
             
@@ -677,6 +669,48 @@ def parse_international_matches(html: str, phase: str, matchday: Optional[int],
     
     return matches
 
+def load_stored_matches(league: str, season: str, output_dir: str = 'data/matches') -> List[Dict]:
+    """Bisher gespeicherte Matches einer Liga (Wrapper-Format); leer bei fehlender/unlesbarer Datei oder anderer Saison"""
+    filename = f"{output_dir}/matches_{league}.json"
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if not isinstance(data, dict) or str(data.get('season')) != str(season):
+        return []
+    return [match for match in data.get('matches') or [] if isinstance(match, dict)]
+
+def frozen_rounds(matches: List[Dict]) -> Set[RoundKey]:
+    """
+    Runden, deren Spiele alle beendet sind - sie ändern sich nicht mehr und werden nicht neu geladen.
+    Eine Runde mit weniger Spielen als die größte Runde derselben Phase gilt als unvollständig.
+    """
+    rounds: Dict[RoundKey, List[Dict]] = {}
+    for match in matches:
+        rounds.setdefault(round_key(match), []).append(match)
+    largest: Dict[Optional[str], int] = {}
+    for (phase, _), games in rounds.items():
+        largest[phase] = max(largest.get(phase, 0), len(games))
+    return {
+        key for key, games in rounds.items()
+        if len(games) >= largest[key[0]] and all(game.get('isFinished') and not game.get('isLive') for game in games)
+    }
+
+def merge_matches(stored: List[Dict], fresh: List[Dict]) -> List[Dict]:
+    """
+    Neu geladene Runden ersetzen die gespeicherten, alle anderen Runden bleiben erhalten.
+    Sortiert nach Phase (Reihenfolge des ersten Auftretens) und Spieltag; innerhalb einer Runde bleibt die Reihenfolge.
+    """
+    fresh_keys = {round_key(match) for match in fresh}
+    merged = [match for match in stored if round_key(match) not in fresh_keys] + fresh
+    
+    phase_order: Dict[Optional[str], int] = {}
+    for match in stored + fresh:
+        phase_order.setdefault(match.get('phase'), len(phase_order))
+    merged.sort(key=lambda match: (phase_order[match.get('phase')], match.get('matchday') or 0))
+    return merged
+
 def save_matches_json(league: str, season: str, matches: List[Dict], output_dir: str = 'data/matches'):
     """Speichert Matches als JSON-Datei (Wrapper-Format für normale Ligen)"""
     os.makedirs(output_dir, exist_ok=True)
@@ -715,7 +749,7 @@ def fetch_openligadb_matches(league_shortcut: str, season: str) -> List[Dict]:
         api_url = f"https://api.openligadb.de/getmatchdata/{league_shortcut}/{season}"
         print(f"🔍 Lade von OpenLigaDB API: {api_url}")
         
-        response = requests.get(api_url, headers=HEADERS, timeout=30)
+        response = http_client.get(api_url)
         
         if response.status_code != 200:
             print(f"❌ HTTP {response.status_code} für {api_url}")
@@ -768,16 +802,21 @@ def scrape_dfbpokal_matches(season: str) -> List[Dict]:
     # Versuche verschiedene Runden-Namen (kann je nach Saison variieren)
     rounds = ['1-runde', '2-runde', 'achtelfinale', 'viertelfinale', 'halbfinale', 'finale']
     
-    for round_name in rounds:
-        url = f"https://www.fussballdaten.de/{league_path}/{season}/{round_name}/"
-        print(f"🔍 Versuche DFB-Pokal: {url}")
-        html = fetch_html(url)
-        
+    def fetch(round_name: str) -> Optional[List[Dict]]:
+        html = fetch_html(fussballdaten_url(f"{league_path}/{season}/{round_name}/"))
         if not html or len(html) < 1000:
+            return None
+        return parse_league_matches(html, 1, season, league_path)  # matchday=1 für alle Runden
+    
+    # Alle Runden gleichzeitig laden (fehlende Runden beenden die Suche nicht)
+    found = dict(crawl_in_order(rounds, fetch))
+    for round_name in rounds:
+        print(f"🔍 Versuche DFB-Pokal: {fussballdaten_url(f'{league_path}/{season}/{round_name}/')}")
+        if round_name not in found:
             print(f"⚠️ Keine Daten für {round_name}")
             continue
         
-        matches = parse_league_matches(html, 1, season, league_path)  # matchday=1 für alle Runden
+        matches = found[round_name]
         all_matches.extend(matches)
         
         print(f"✅ DFB-Pokal {round_name}: {len(matches)} Spiele gefunden")
@@ -787,8 +826,49 @@ def scrape_dfbpokal_matches(season: str) -> List[Dict]:
     
     return all_matches
 
-def main():
+# Internationale Ligen (Liga-ID wie in scrape_lineups.LEAGUE_CONFIGS; dateTime wird als UTC gespeichert)
+INTERNATIONAL_LIGA_IDS = {'championsleague': 11, 'europaleague': 12, 'conferenceleague': 13}
+
+def league_priority(league: str, season: str) -> Tuple[int, float]:
+    """Wert einer Liga (work_priority ihres wichtigsten offenen Spiels in der gespeicherten Datei, kleiner = zuerst)"""
+    records = build_match_records(load_stored_matches(league, season), INTERNATIONAL_LIGA_IDS.get(league, 1))
+    priorities = [work_priority(record.kickoff_epoch, record.live) for record in records if not record.finished]
+    return min(priorities) if priorities else (4, 0.0)
+
+def scrape_and_save(league: str, season: str, scrape: Callable[[Set[RoundKey]], List[Dict]], full: bool = False):
+    """
+    Scrapt eine Liga inkrementell und speichert sie: Runden, deren Spiele in matches_{league}.json
+    alle beendet sind, werden nicht neu geladen, die neu geladenen Runden werden in die Datei übernommen.
+    full: alles neu laden (ohne gespeicherte Daten)
+    Bei erschöpftem Run-Budget wird die Liga übersprungen; nicht mehr geladene Runden bleiben wie gespeichert.
+    """
+    if RUN_BUDGET.exhausted():
+        print(f"   ⏱️ Budget erschöpft - {league} wird in diesem Lauf übersprungen (gespeicherte Datei bleibt)")
+        return
+    stored = [] if full else load_stored_matches(league, season)
+    frozen = frozen_rounds(stored)
+    if frozen:
+        print(f"   🧊 {len(frozen)} abgeschlossene Runden aus matches_{league}.json übernommen")
+    fresh = scrape(frozen)
+    save_matches_json(league, season, merge_matches(stored, fresh))
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Kommandozeilen-Optionen"""
+    parser = argparse.ArgumentParser(description="Scrapt Spielpläne von fussballdaten.de")
+    parser.add_argument('--full', action='store_true',
+                        help="Alle Runden neu laden statt nur Runden mit offenen Spielen")
+    add_league_workers_argument(parser)
+    add_budget_arguments(parser)
+    http_client.add_fixture_arguments(parser)
+    http_client.add_base_url_argument(parser)
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
     """Hauptfunktion"""
+    args = parse_args(argv)
+    http_client.apply_fixture_arguments(args)
+    http_client.set_fussballdaten_base_url(args.base_url)
+    apply_budget_arguments(args)
     errors = []
     print("🚀 Starte Match-Scraping...")
     
@@ -799,65 +879,64 @@ def main():
         # WICHTIG: Deutsche Ligen (1. BL, 2. BL, DFB-Pokal) werden von upload_matches_to_github.py erstellt
         # Hier werden sie NICHT mehr gescrappt, um Dopplung zu vermeiden
         
-        # England
-        try:
-            print("\n📊 Scrape England...")
-            england_matches = scrape_england_matches(season)
-            save_matches_json('england', season, england_matches)
-        except Exception as e:
-            error_msg = f"Fehler bei England: {e}"
-            print(f"❌ {error_msg}")
-            errors.append(error_msg)
+        job_seasons: Dict[str, str] = {}  # Liga → Saison der Datei (für die Reihenfolge nach Wert)
         
-        # Spain
-        try:
-            print("\n📊 Scrape Spain...")
-            spain_matches = scrape_league_matches('spain', season)
-            save_matches_json('spain', season, spain_matches)
-        except Exception as e:
-            error_msg = f"Fehler bei Spain: {e}"
-            print(f"❌ {error_msg}")
-            errors.append(error_msg)
+        def league_job(label: str, league: str, league_season: str, scrape: Callable[[Set[RoundKey]], List[Dict]]) -> Callable[[], Optional[str]]:
+            """Scrapt und speichert eine Liga; gibt die Fehlermeldung zurück (None bei Erfolg)"""
+            job_seasons[league] = league_season
+            def job() -> Optional[str]:
+                try:
+                    print(f"\n📊 Scrape {label}...")
+                    scrape_and_save(league, league_season, scrape, args.full)
+                    return None
+                except Exception as e:
+                    error_msg = f"Fehler bei {label}: {e}"
+                    print(f"❌ {error_msg}")
+                    return error_msg
+            return job
         
-        # Italy
-        try:
-            print("\n📊 Scrape Italy...")
-            italy_matches = scrape_league_matches('italy', season)
-            save_matches_json('italy', season, italy_matches)
-        except Exception as e:
-            error_msg = f"Fehler bei Italy: {e}"
-            print(f"❌ {error_msg}")
-            errors.append(error_msg)
-        
-        # France
-        try:
-            print("\n📊 Scrape France...")
-            france_matches = scrape_league_matches('france', season)
-            save_matches_json('france', season, france_matches)
-        except Exception as e:
-            error_msg = f"Fehler bei France: {e}"
-            print(f"❌ {error_msg}")
-            errors.append(error_msg)
+        jobs = [
+            ('england', league_job('England', 'england', season, lambda frozen: scrape_england_matches(season, frozen))),
+            ('spain', league_job('Spain', 'spain', season, lambda frozen: scrape_league_matches('spain', season, frozen))),
+            ('italy', league_job('Italy', 'italy', season, lambda frozen: scrape_league_matches('italy', season, frozen))),
+            ('france', league_job('France', 'france', season, lambda frozen: scrape_league_matches('france', season, frozen))),
+        ]
         
         # International
         try:
             int_season = get_international_season()
-            print(f"\n📊 Scrape International (Saison {int_season})...")
-            
-            for league in ['championsleague', 'europaleague', 'conferenceleague']:
-                try:
-                    print(f"\n  📊 Scrape {league}...")
-                    int_matches = scrape_international_matches(league, int_season)
-                    save_matches_json(league, int_season, int_matches)
-                except Exception as e:
-                    error_msg = f"Fehler bei {league}: {e}"
-                    print(f"❌ {error_msg}")
-                    errors.append(error_msg)
+            print(f"\n📊 International: Saison {int_season}")
+            for league in INTERNATIONAL_LIGA_IDS:
+                jobs.append((league, league_job(league, league, int_season,
+                                                lambda frozen, league=league: scrape_international_matches(league, int_season, frozen))))
         except Exception as e:
             error_msg = f"Fehler bei International: {e}"
             print(f"❌ {error_msg}")
             errors.append(error_msg)
         
+        # Mit Budget: Ligen mit laufenden bzw. bald beginnenden Spielen zuerst
+        if RUN_BUDGET.limited:
+            jobs.sort(key=lambda job: league_priority(job[0], job_seasons[job[0]]))
+            print(f"⏱️ Liga-Reihenfolge nach Wert: {', '.join(name for name, _ in jobs)}")
+        
+        # Ligen gleichzeitig (gemeinsamer Rate Limiter), Ausgaben und Fehler in Liga-Reihenfolge
+        for error_msg in run_leagues(jobs, args.league_workers):
+            if error_msg:
+                errors.append(error_msg)
+        
+        if http_client.HTTP_CACHE is not None:
+            print(f"\n📦 {http_client.HTTP_CACHE.stats()}")
+        if SLUG_INDEX is not None:
+            SLUG_INDEX.save()
+            print(f"📦 {SLUG_INDEX.stats()}")
+        if MATCH_URL_INDEX is not None:
+            MATCH_URL_INDEX.save()
+            print(f"📦 {MATCH_URL_INDEX.stats()}")
+        if http_client.FIXTURES is not None:
+            print(f"🎞️ {http_client.FIXTURES.stats()}")
+        if RUN_BUDGET.limited:
+            print(f"⏱️ {RUN_BUDGET.stats()}")
+        
         if errors:
             print(f"\n⚠️ Scraping abgeschlossen mit {len(errors)} Fehler(n):")
             for error in errors:
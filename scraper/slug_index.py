@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Gelernter Team-Slug-Index
+Jede Spieltags-Übersicht enthält Spiel-Links wie
+<a href="/{liga}/{saison}/{spieltag}/{heim}-{gast}/" title="Heim - Gast (22.08.2025)">.
+Daraus wird gelernt, welcher Team-Name zu welchem echten fussballdaten.de-Slug gehört.
+Der Index wird gespeichert, damit die Aufstellungs-Suche beim nächsten Lauf
+direkt die richtige URL testet statt einen geratenen Slug.
+Team-Namen aus OpenLigaDB (teamName) oder internationale Anzeigenamen werden
+exakt, über den Kern-Namen oder unscharf (difflib) auf die gelernten Namen abgebildet.
+Unscharf nur mit eindeutigem Gewinner ("Manchester City" ist nicht "Manchester United",
+"Bayern München" nicht "Bayern München II").
+"""
+
+import atexit
+import difflib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from typing import Dict, Optional, Tuple
+
+from http_cache import CACHE_DIR
+
+# Spiel-Links mit Titel: nationale Ligen/DFB-Pokal (/{liga}/{saison}/{spieltag}/...),
+# internationale Phasen (/{liga}/{saison}/{phase}/{spieltag}/...) und /vereine/{heim}/{gast}/
+MATCH_LINK_PATTERN = re.compile(r'<a\b[^>]*href="/(?:([a-z0-9-]+)/\d{4}/(?:[a-z0-9-]+/)?(?:\d+/)?([a-z0-9.]+(?:-[a-z0-9.]+)+)|vereine/([a-z0-9.-]+)/([a-z0-9.-]+))/"[^>]*>', re.IGNORECASE)
+TITLE_PATTERN = re.compile(r'title="([^"(]+?)\s+(?:-|–|vs\.?)\s+([^"(]+?)\s*\(\d{2}\.\d{2}\.\d{4}', re.IGNORECASE)
+
+# Gemeinsamer Bereich für /vereine/-Links (ohne Liga im Link)
+CLUB_SCOPE = 'vereine'
+
+# Mindest-Ähnlichkeit für die unscharfe Zuordnung (difflib-Ratio) und Abstand zum zweitbesten Namen
+FUZZY_CUTOFF = 0.9
+FUZZY_MARGIN = 0.05
+
+# Zweit-/Jugendmannschaften ("Bayern München II", "Ajax U21") werden nie unscharf zugeordnet
+RESERVE_TEAM_SUFFIX_PATTERN = re.compile(r'(?:ii|iii|u\d{2})$')
+
+def normalize_team_name(team_name: str) -> str:
+    """Vergleichsschlüssel für Team-Namen: ohne Akzente, klein, nur a-z0-9"""
+    key = unicodedata.normalize('NFD', team_name or '')
+    key = ''.join(c for c in key if unicodedata.category(c) != 'Mn')
+    key = key.lower().replace('ß', 'ss')
+    return re.sub(r'[^a-z0-9]', '', key)
+
+# Vereinskürzel, die beim Vergleich ignoriert werden ("Arsenal FC" = "FC Arsenal")
+CLUB_WORDS = frozenset({'fc', 'ac', 'as', 'sc', 'ssc', 'cf', 'afc', 'cd', 'sv', 'vfl', 'vfb', 'tsg', 'bsc', 'rc', 'us', 'ss', '1'})
+
+def team_name_core(team_name: str) -> str:
+    """Vergleichsschlüssel ohne Vereinskürzel und unabhängig von der Wort-Reihenfolge"""
+    words = [normalize_team_name(word) for word in re.split(r'[\s.-]+', team_name or '')]
+    return ''.join(sorted(word for word in words if word and word not in CLUB_WORDS))
+
+def split_slug_pair(slug_pair: str, home_name: str, away_name: str) -> Optional[Tuple[str, str]]:
+    """Teilt 'heim-gast' passend zu den Team-Namen auf (Slugs können selbst Bindestriche enthalten)"""
+    parts = slug_pair.split('-')
+    if len(parts) < 2:
+        return None
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    home_key = normalize_team_name(home_name)
+    away_key = normalize_team_name(away_name)
+    best_split = None
+    best_score = -1.0
+    for i in range(1, len(parts)):
+        home_slug = '-'.join(parts[:i])
+        away_slug = '-'.join(parts[i:])
+        score = (difflib.SequenceMatcher(None, home_key, home_slug.replace('-', '')).ratio()
+                 + difflib.SequenceMatcher(None, away_key, away_slug.replace('-', '')).ratio())
+        if score > best_score:
+            best_split = (home_slug, away_slug)
+            best_score = score
+    return best_split
+
+def closest_team_key(key: str, entries: Dict[str, Dict]) -> Optional[str]:
+    """Unscharfer Treffer nur mit eindeutigem Gewinner: Ratio >= FUZZY_CUTOFF und FUZZY_MARGIN vor dem zweitbesten"""
+    query_reserve = bool(RESERVE_TEAM_SUFFIX_PATTERN.search(key))
+    matcher = difflib.SequenceMatcher()
+    matcher.set_seq2(key)
+    scores = []
+    for candidate in entries:
+        if bool(RESERVE_TEAM_SUFFIX_PATTERN.search(candidate)) != query_reserve:
+            continue
+        matcher.set_seq1(candidate)
+        if matcher.real_quick_ratio() >= FUZZY_CUTOFF and matcher.quick_ratio() >= FUZZY_CUTOFF:
+            scores.append((matcher.ratio(), candidate))
+    scores.sort(reverse=True)
+    if not scores or scores[0][0] < FUZZY_CUTOFF:
+        return None
+    if len(scores) > 1 and scores[0][0] - scores[1][0] < FUZZY_MARGIN:
+        return None
+    return scores[0][1]
+
+class TeamSlugIndex:
+    """Thread-sicherer, gespeicherter Index (Liga → normalisierter Team-Name → Slug)"""
+
+    def __init__(self, cache_file: str = os.path.join(CACHE_DIR, 'team_slugs.json')):
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._changed = False
+        self.learned = 0
+        self.hits = 0
+        self.fuzzy_hits = 0
+        self._entries: Dict[str, Dict[str, Dict]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Dict]]:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def learn(self, scope: str, team_name: str, slug: str):
+        """Merkt sich Team-Name → Slug für eine Liga (scope)"""
+        key = normalize_team_name(team_name)
+        if not key or not slug:
+            return
+        with self._lock:
+            entries = self._entries.setdefault(scope, {})
+            entry = entries.get(key)
+            if entry is not None and entry.get('slug') == slug:
+                return
+            entries[key] = {'slug': slug, 'name': team_name.strip(), 'learnedAt': time.time()}
+            self.learned += 1
+            self._changed = True
+
+    def harvest(self, html: Optional[str]) -> int:
+        """Lernt alle Team-Slugs aus den Spiel-Links einer Übersichtsseite. Gibt die Anzahl Links zurück"""
+        if not html:
+            return 0
+        count = 0
+        for link in MATCH_LINK_PATTERN.finditer(html):
+            title = TITLE_PATTERN.search(link.group(0))
+            if not title:
+                continue
+            home_name, away_name = title.group(1), title.group(2)
+            if link.group(1):
+                scope = link.group(1).lower()
+                slugs = split_slug_pair(link.group(2).lower(), home_name, away_name)
+            else:
+                scope = CLUB_SCOPE
+                slugs = (link.group(3).lower(), link.group(4).lower())
+            if not slugs:
+                continue
+            self.learn(scope, home_name, slugs[0])
+            self.learn(scope, away_name, slugs[1])
+            count += 1
+        return count
+
+    def lookup(self, team_name: str, league_path: str, fuzzy: bool = True) -> Optional[str]:
+        """Gibt den gelernten Slug für einen Team-Namen zurück (exakt, Kern-Name, sonst unscharf), sonst None
+
+        Gesucht wird zuerst in der Liga, dann unter den /vereine/-Links (internationale Spiele).
+        fuzzy=False: nur exakte und Kern-Namen-Treffer (z.B. wenn es eine gepflegte Zuordnung gibt).
+        """
+        key = normalize_team_name(team_name)
+        if not key:
+            return None
+        with self._lock:
+            for scope in (league_path, CLUB_SCOPE):
+                entries = self._entries.get(scope)
+                if not entries:
+                    continue
+                if key in entries:
+                    self.hits += 1
+                    return entries[key]['slug']
+                core = team_name_core(team_name)
+                for entry in entries.values():
+                    if core and team_name_core(entry.get('name', '')) == core:
+                        self.fuzzy_hits += 1
+                        return entry['slug']
+                close = closest_team_key(key, entries) if fuzzy else None
+                if close:
+                    self.fuzzy_hits += 1
+                    return entries[close]['slug']
+        return None
+
+    def save(self):
+        """Speichert den Index"""
+        with self._lock:
+            if not self._changed:
+                return
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_file = self.cache_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+            self._changed = False
+
+    def stats(self) -> str:
+        return (f"Slug-Index: {self.learned} Slugs gelernt, {self.hits} exakte und "
+                f"{self.fuzzy_hits} unscharfe Treffer")
+
+# Gemeinsamer Slug-Index (SCRAPER_SLUG_INDEX=0 deaktiviert ihn)
+SLUG_INDEX: Optional[TeamSlugIndex] = None
+if os.environ.get('SCRAPER_SLUG_INDEX', '1') != '0':
+    SLUG_INDEX = TeamSlugIndex()
+    atexit.register(SLUG_INDEX.save)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+7-Tage-Fenster aus den lokalen Match-Dateien
+Ermittelt dieselben Spieltage wie find_matchdays_to_scrape (Spiele innerhalb HEUTE + 7 Tage,
+Nachholspiele bei > 6 Tagen Abstand), aber aus data/matches/matches_*.json statt aus
+bis zu 38 Spieltags-Übersichten pro Liga.
+Sind die Daten veraltet oder unvollständig, wird None zurückgegeben und die
+Aufstellungs-Suche fällt auf die HTTP-Variante zurück.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Union
+
+# Match-Dateien mit lastUpdated, die älter sind, gelten als veraltet
+MAX_DATA_AGE = timedelta(hours=36)
+
+# Spiele, die seit so langer Zeit angepfiffen sind, sollten ein Ergebnis haben.
+# Mehr als MAX_OPEN_PAST_GAMES offene Spiele in der Vergangenheit (einzelne sind abgesagt/verlegt)
+# bedeuten veraltete Ergebnisse.
+RESULT_DELAY = timedelta(hours=3)
+MAX_OPEN_PAST_GAMES = 3
+
+def parse_match_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parst matchDateTime/dateTime (lokale Zeit, optional mit 'Z')"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.rstrip('Z')[:19])
+    except ValueError:
+        return None
+
+def dfb_round_slug(group_name: str) -> str:
+    """Runden-Name wie in den fussballdaten.de-URLs ('1. Runde' → '1-runde')"""
+    return group_name.strip().lower().replace('. ', '-').replace('.', '').replace(' ', '-')
+
+def match_schedule_entry(match: Dict, liga_id: int) -> Optional[Dict]:
+    """Spieltag, Anpfiff und Status eines Spiels (OpenLigaDB- oder Scraper-Format), sonst None"""
+    if not isinstance(match, dict):
+        # Bereits normalisiert (match_record.MatchRecord)
+        return match.schedule_entry()
+    group = match.get('group') or match.get('Group')
+    if isinstance(group, dict):
+        # OpenLigaDB-Format
+        if liga_id == 3:
+            matchday = dfb_round_slug(group.get('groupName') or '')
+        else:
+            matchday = group.get('groupOrderID')
+        kickoff = parse_match_datetime(match.get('matchDateTime'))
+        finished = bool(match.get('matchIsFinished'))
+    else:
+        # Format von scrape_matches.py
+        matchday = match.get('matchday')
+        kickoff = parse_match_datetime(match.get('dateTime'))
+        finished = bool(match.get('isFinished'))
+    if liga_id != 3:
+        try:
+            matchday = int(matchday)
+        except (TypeError, ValueError):
+            return None
+    if not matchday or kickoff is None:
+        return None
+    return {'matchday': matchday, 'kickoff': kickoff, 'finished': finished}
+
+def plan_matchdays_from_matches(matches: List[Dict], liga_id: int, now: Optional[datetime] = None, last_updated: Optional[str] = None) -> Optional[List[Union[int, str]]]:
+    """
+    Spieltage zum Scrapen aus den lokalen Match-Daten (gleiche Regeln wie find_matchdays_to_scrape)
+
+    Gibt None zurück, wenn die Daten veraltet sind (lastUpdated zu alt, mehrere vergangene Spiele
+    ohne Ergebnis) oder fehlen (keine Spiele mit Spieltag und Anpfiff, keine offenen Spiele).
+    """
+    heute = now or datetime.now()
+    updated = parse_match_datetime(last_updated)
+    if updated is not None and heute - updated > MAX_DATA_AGE:
+        print(f"   ⚠️ Match-Datei veraltet (lastUpdated {last_updated}) → Spieltage per HTTP")
+        return None
+
+    spiele_pro_spieltag: Dict[Union[int, str], List[Dict]] = {}
+    offene_vergangene = 0
+    for match in matches:
+        entry = match_schedule_entry(match, liga_id) if isinstance(match, dict) or hasattr(match, 'schedule_entry') else None
+        if entry is None:
+            continue
+        if not entry['finished'] and entry['kickoff'] < heute - RESULT_DELAY:
+            offene_vergangene += 1
+        spiele_pro_spieltag.setdefault(entry['matchday'], []).append(entry)
+    
+    if offene_vergangene > MAX_OPEN_PAST_GAMES:
+        print(f"   ⚠️ Match-Datei veraltet ({offene_vergangene} vergangene Spiele ohne Ergebnis) → Spieltage per HTTP")
+        return None
+
+    if not spiele_pro_spieltag or all(e['finished'] for spiele in spiele_pro_spieltag.values() for e in spiele):
+        print(f"   ⚠️ Match-Datei ohne offene Spiele → Spieltage per HTTP")
+        return None
+
+    print(f"\n🔍 Suche Spieltage zum Scrapen (7-Tage-Fenster, aus Match-Datei)...")
+    spieltage_zum_scrapen = []
+    nachholspiel_spieltage = []
+    # Reihenfolge: Spieltage aufsteigend, DFB-Runden nach erstem Anpfiff
+    if liga_id == 3:
+        reihenfolge = sorted(spiele_pro_spieltag, key=lambda runde: min(e['kickoff'] for e in spiele_pro_spieltag[runde]))
+    else:
+        reihenfolge = sorted(spiele_pro_spieltag)
+
+    for spieltag in reihenfolge:
+        gespielte = [e for e in spiele_pro_spieltag[spieltag] if e['finished']]
+        nicht_gespielte = [e for e in spiele_pro_spieltag[spieltag] if not e['finished']]
+
+        # Keine zukünftigen Spiele → Spieltag fertig
+        if not nicht_gespielte:
+            continue
+
+        # Nachholspiele: > 6 Tage zwischen letztem gespielten und erstem offenen Spiel
+        erstes_nicht_gespielt = min(e['kickoff'] for e in nicht_gespielte).date()
+        if gespielte:
+            letztes_gespielt = max(e['kickoff'] for e in gespielte).date()
+            abstand_spiele = (erstes_nicht_gespielt - letztes_gespielt).days
+            if abstand_spiele > 6:
+                print(f"   ⚠️ Spieltag {spieltag}: Nachholspiele erkannt (+{abstand_spiele} Tage)")
+                nachholspiel_spieltage.append(spieltag)
+                continue
+
+        abstand_heute = (erstes_nicht_gespielt - heute.date()).days
+        if abstand_heute <= 7:
+            print(f"   ✅ Spieltag {spieltag}: Innerhalb 7 Tage (+{abstand_heute} Tage)")
+            spieltage_zum_scrapen.append(spieltag)
+        else:
+            print(f"   ⛔ Spieltag {spieltag}: Zu weit weg (+{abstand_heute} Tage) → STOPP")
+            break
+
+    alle_spieltage = nachholspiel_spieltage + spieltage_zum_scrapen
+    if nachholspiel_spieltage:
+        print(f"\n   📋 Nachholspiel-Spieltage: {nachholspiel_spieltage}")
+    print(f"   📋 Reguläre Spieltage: {spieltage_zum_scrapen}")
+    print(f"   📊 Gesamt zum Scrapen: {alle_spieltage}\n")
+    return alle_spieltage
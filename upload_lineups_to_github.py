@@ -6,10 +6,16 @@ Script zum Hochladen von Lineup-Daten nach GitHub Repository
 import requests
 import json
 import os
+import sys
 import base64
 import time
+import argparse
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+
+# Gemeinsamer HTTP-Client liegt im scraper/-Verzeichnis
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scraper'))
+import http_client
 
 # GitHub Repository Konfiguration
 GITHUB_REPO = "florianschommers/AnstossScraper"
@@ -46,7 +52,7 @@ def check_repo_exists(repo: str) -> bool:
     """Prüft ob das Repository existiert und zugänglich ist"""
     url = f"{GITHUB_API_BASE}/{repo}"
     try:
-        response = requests.get(url, headers=get_headers(), timeout=10)
+        response = http_client.get(url, headers=get_headers(), timeout=10)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -77,7 +83,7 @@ def get_file_sha(repo: str, path: str) -> Optional[str]:
     """Holt SHA-Hash einer Datei von GitHub"""
     url = f"{GITHUB_API_BASE}/{repo}/contents/{path}"
     try:
-        response = requests.get(url, headers=get_headers(), timeout=10)
+        response = http_client.get(url, headers=get_headers(), timeout=10)
         if response.status_code == 200:
             return response.json().get('sha')
         elif response.status_code == 404:
@@ -114,7 +120,7 @@ def upload_file_to_github(repo: str, path: str, content: str, message: str = "Up
     # Retry-Logik für temporäre Fehler
     for attempt in range(1, max_retries + 1):
         try:
-            response = requests.put(url, headers=get_headers(), json=data, timeout=30)
+            response = http_client.request('PUT', url, headers=get_headers(), json=data, timeout=30)
             if response.status_code in [200, 201]:
                 print(f"✅ Hochgeladen: {path}")
                 return True
@@ -179,8 +185,15 @@ def upload_file_to_github(repo: str, path: str, content: str, message: str = "Up
     
     return False
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Kommandozeilen-Optionen"""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    http_client.add_fixture_arguments(parser)
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
     """Hauptfunktion"""
+    http_client.apply_fixture_arguments(parse_args(argv))
     print("🚀 Starte Upload von Lineup-Daten nach GitHub...")
     print(f"📦 Repository: {GITHUB_REPO}")
     
@@ -244,6 +257,8 @@ def main():
     print(f"✅ Erfolgreich hochgeladen: {uploaded}")
     print(f"❌ Fehlgeschlagen: {failed}")
     print(f"{'='*60}")
+    if http_client.FIXTURES is not None:
+        print(f"🎞️ {http_client.FIXTURES.stats()}")
 
 if __name__ == "__main__":
     main()
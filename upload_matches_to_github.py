@@ -6,10 +6,16 @@ Script zum Hochladen von Match-Daten (2. Bundesliga und DFB-Pokal) in GitHub Rep
 import requests
 import json
 import os
+import sys
 import time
+import argparse
 from datetime import datetime
 from typing import List, Dict, Optional
 
+# Gemeinsamer HTTP-Client liegt im scraper/-Verzeichnis
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scraper'))
+import http_client
+
 # GitHub Repository Konfiguration
 GITHUB_REPO = "florianschommers/AnstossScraper"
 # Token aus Umgebungsvariable (für GitHub Actions) - KEIN Fallback, muss gesetzt sein
@@ -56,7 +62,7 @@ def fetch_openligadb_matches(league_shortcut: str, season: str) -> List[Dict]:
         api_url = f"https://api.openligadb.de/getmatchdata/{league_shortcut}/{season}"
         print(f"🔍 Lade von OpenLigaDB API: {api_url}")
         
-        response = requests.get(api_url, headers={'User-Agent': 'Anstoss-App/1.0'}, timeout=30)
+        response = http_client.get(api_url)
         
         print(f"   📊 HTTP Status: {response.status_code}")
         print(f"   📏 Response-Länge: {len(response.text)} Zeichen")
@@ -171,7 +177,7 @@ def check_repo_exists(repo: str, token: str) -> bool:
     """Prüft ob das Repository existiert und zugänglich ist"""
     url = f"{GITHUB_API_BASE}/{repo}"
     try:
-        response = requests.get(url, headers=get_headers(token), timeout=10)
+        response = http_client.get(url, headers=get_headers(token), timeout=10)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -207,7 +213,7 @@ def get_file_sha(repo: str, path: str, token: str) -> Optional[str]:
     url = f"{GITHUB_API_BASE}/{repo}/contents/{path}"
     
     try:
-        response = requests.get(url, headers=get_headers(token), timeout=10)
+        response = http_client.get(url, headers=get_headers(token), timeout=10)
         if response.status_code == 200:
             sha = response.json().get('sha')
             if sha:
@@ -255,7 +261,7 @@ def upload_file_to_github(repo: str, path: str, content: str, token: str, messag
     # Retry-Logik für temporäre Fehler
     for attempt in range(1, max_retries + 1):
         try:
-            response = requests.put(url, headers=get_headers(token), json=data, timeout=30)
+            response = http_client.request('PUT', url, headers=get_headers(token), json=data, timeout=30)
             if response.status_code in [200, 201]:
                 print(f"✅ Erfolgreich hochgeladen: {path}")
                 # Prüfe ob die Datei wirklich aktualisiert wurde
@@ -343,8 +349,15 @@ def upload_file_to_github(repo: str, path: str, content: str, token: str, messag
     
     return False
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Kommandozeilen-Optionen"""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    http_client.add_fixture_arguments(parser)
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
     """Hauptfunktion"""
+    http_client.apply_fixture_arguments(parse_args(argv))
     print("🚀 Starte Upload von Match-Daten nach GitHub...")
     print(f"📦 Repository: {GITHUB_REPO}")
     
@@ -433,6 +446,8 @@ def main():
     else:
         print("⚠️ Keine DFB-Pokal Matches gefunden")
     
+    if http_client.FIXTURES is not None:
+        print(f"🎞️ {http_client.FIXTURES.stats()}")
     print("\n✅ Upload abgeschlossen!")
 
 if __name__ == '__main__':